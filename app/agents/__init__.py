@@ -2,10 +2,10 @@ from .safety import SafetyAuditAgent
 from .triage import TriageAgent
 from .interview import InterviewAgent
 from .decomposition import DecompositionAgent
-from .evidence import EvidenceAgent
+from .evidence import EvidenceAgent, EvidenceReasonAgent
 from .form_fill import FormFillAgent
 
 __all__ = [
     "SafetyAuditAgent", "TriageAgent", "InterviewAgent",
-    "DecompositionAgent", "EvidenceAgent", "FormFillAgent",
+    "DecompositionAgent", "EvidenceAgent", "EvidenceReasonAgent", "FormFillAgent",
 ]
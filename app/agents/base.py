@@ -1,14 +1,44 @@
 from abc import ABC, abstractmethod
-from ..core.openai_client import generate_structured
+from ..core.config import get_settings
+from ..core.llm_cache import make_cache_key
+from ..core.openai_client import generate_structured, generate_structured_async
+from ..core.single_flight import get_single_flight
 
 
 class BaseAgent(ABC):
     def __init__(self, system_prompt: str):
         self.system_prompt = system_prompt
 
+    def _flight_key(self, user_content: str, response_schema: type, temperature: float) -> str:
+        return make_cache_key(
+            get_settings().openai_model, self.system_prompt, user_content, response_schema, temperature
+        )
+
     def _call(self, user_content: str, response_schema: type, temperature: float = 0.2) -> dict:
-        return generate_structured(self.system_prompt, user_content, response_schema, temperature)
+        """동시에 들어온 동일 호출(프롬프트·입력·스키마·모델)은 한 번만 보내고 결과를 공유한다"""
+        agent = type(self).__name__
+        return get_single_flight().do(
+            self._flight_key(user_content, response_schema, temperature),
+            agent,
+            lambda: generate_structured(self.system_prompt, user_content, response_schema, temperature, agent=agent),
+            schema=response_schema.__name__,
+        )
+
+    async def _call_async(self, user_content: str, response_schema: type, temperature: float = 0.2) -> dict:
+        agent = type(self).__name__
+        return await get_single_flight().do_async(
+            self._flight_key(user_content, response_schema, temperature),
+            agent,
+            lambda: generate_structured_async(
+                self.system_prompt, user_content, response_schema, temperature, agent=agent
+            ),
+            schema=response_schema.__name__,
+        )
 
     @abstractmethod
     def run(self, **kwargs) -> dict:
         pass
+
+    async def run_async(self, **kwargs) -> dict:
+        """LLM을 쓰는 에이전트는 _call_async 기반으로 오버라이드한다."""
+        return self.run(**kwargs)
@@ -1,20 +1,49 @@
 import json
 from pydantic import BaseModel
 from .base import BaseAgent
+from .decomposition_rules import RULES
+from ..core.config import get_settings
+from ..core.metrics import REGISTRY
+from ..core.response_schemas import register_response_schema
 from ..prompts import DECOMPOSITION_PROMPT
 from ..schemas.profile import MoveProfile
 from ..schemas.task import TaskNode
 
 
+DECOMPOSITIONS = REGISTRY.counter("move_decomposition_total", "task_graph 생성 경로별 횟수", ("source",))
+
+
+@register_response_schema
+class TaskList(BaseModel):
+    tasks: list[TaskNode]
+
+
 class DecompositionAgent(BaseAgent):
     def __init__(self):
         super().__init__(DECOMPOSITION_PROMPT)
 
     def run(self, move_profile: MoveProfile) -> list[dict]:
-        user_content = f"move_profile: {json.dumps(move_profile.model_dump(), ensure_ascii=False)}"
-
-        class TaskList(BaseModel):
-            tasks: list[TaskNode]
+        tasks = self._from_rules(move_profile)
+        if tasks is not None:
+            return tasks
+        result = self._call(self._build_content(move_profile), TaskList, temperature=0.1)
+        return result.get("tasks", [])
 
-        result = self._call(user_content, TaskList, temperature=0.1)
+    async def run_async(self, move_profile: MoveProfile) -> list[dict]:
+        tasks = self._from_rules(move_profile)
+        if tasks is not None:
+            return tasks
+        result = await self._call_async(self._build_content(move_profile), TaskList, temperature=0.1)
         return result.get("tasks", [])
+
+    def _from_rules(self, move_profile: MoveProfile) -> list[dict] | None:
+        """규칙 테이블로 충분하면 그 결과, 규칙 밖 필드가 있으면 None (LLM 폴백)"""
+        if not get_settings().decomposition_rules_enabled:
+            DECOMPOSITIONS.inc("llm")
+            return None
+        tasks = RULES.decompose(move_profile)
+        DECOMPOSITIONS.inc("llm" if tasks is None else "rules")
+        return tasks
+
+    def _build_content(self, move_profile: MoveProfile) -> str:
+        return f"move_profile: {json.dumps(move_profile.model_dump(), ensure_ascii=False)}"
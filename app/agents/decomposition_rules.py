@@ -0,0 +1,176 @@
+"""Decomposition 규칙 테이블 — 프로필 조건 → TaskNode (+ depends_on)
+
+DECOMPOSITION_PROMPT의 정책을 선언형 표로 옮긴 것이다. import 시 한 번 컴파일해
+조건 필드 값 튜플 → 태스크 목록을 메모이즈하므로, 일반적인 프로필은 LLM 없이 수 µs에
+같은 결과를 낸다. 규칙이 다루지 않는 필드(예: vehicles.motorcycle=yes)가 켜진 프로필만
+decompose()가 None을 돌려 LLM으로 넘긴다.
+"""
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from pydantic import BaseModel
+from ..schemas.profile import MoveProfile
+
+
+@dataclass(frozen=True)
+class TaskRule:
+    task_id: str
+    title: str
+    priority: str
+    route: str
+    when: dict[str, frozenset[str]] = field(default_factory=dict)  # 프로필 경로 → 허용 값 (모두 만족해야 적용)
+    mandatory: bool = False
+    risk_level: str = "medium"
+    required_inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    depends_on: tuple[str, ...] = ()
+
+
+def _is(*values: str) -> frozenset[str]:
+    return frozenset(values)
+
+
+DECOMPOSITION_RULES: tuple[TaskRule, ...] = (
+    TaskRule(
+        "task_001", "전입신고", "P0", "gov24", mandatory=True, risk_level="high",
+        required_inputs=("move_date", "to_region.sido"), outputs=("전입신고_완료",),
+    ),
+    TaskRule(
+        "task_002", "건강보험 주소 변경", "P0", "gov24", mandatory=True,
+        required_inputs=("to_region.sido",), outputs=("건강보험_주소_변경완료",), depends_on=("task_001",),
+    ),
+    TaskRule(
+        "task_003", "차량 주소 변경 (자동차등록증 재발급)", "P1", "gov24",
+        when={"vehicles.car": _is("yes")},
+        required_inputs=("to_region.sido",), outputs=("자동차등록증_주소_변경완료",), depends_on=("task_001",),
+    ),
+    TaskRule(
+        "task_004", "초등학교 전학 신청", "P1", "local_gov",
+        when={"has_children": _is("yes"), "needs.school_transfer": _is("yes", "unknown")},
+        required_inputs=("to_region.sido", "to_region.sgg"), outputs=("전학_신청완료",), depends_on=("task_001",),
+    ),
+    TaskRule(
+        "task_005", "어린이집 입소 신청", "P1", "gov24",
+        when={"has_children": _is("yes"), "needs.childcare": _is("yes", "unknown")},
+        required_inputs=("to_region.sido", "to_region.sgg"), outputs=("어린이집_입소_신청완료",),
+        depends_on=("task_001",),
+    ),
+    TaskRule(
+        "task_006", "생활폐기물 처리 스티커 신청", "P2", "local_gov", risk_level="low",
+        when={"needs.waste_disposal": _is("yes", "unknown")},
+        required_inputs=("to_region.sgg",), outputs=("폐기물_스티커_발급",),
+    ),
+)
+
+# 정책상 태스크 구성에 영향을 주지 않는 필드 — 값이 있어도 LLM 폴백 사유가 아니다
+IGNORED_FIELDS = frozenset({
+    "move_date", "from_region.sido", "from_region.sgg", "to_region.sido", "to_region.sgg",
+    "household_type", "is_rental", "consent.admin_info_query", "consent.notifications",
+    "risk_flags.sensitive_info_detected", "risk_flags.user_asking_to_submit_without_review",
+})
+
+# 값이 이 중 하나면 "설정되지 않음"으로 본다
+_UNSET_VALUES = frozenset({"unknown", "no", False})
+
+
+def rule_table() -> list[list]:
+    """규칙 테이블의 결정적 직렬화 (plan_version 계산용 — frozenset 순서에 의존하지 않음)"""
+    return [
+        [
+            rule.task_id, rule.title, rule.priority, rule.route,
+            sorted((path, sorted(values)) for path, values in rule.when.items()),
+            rule.mandatory, rule.risk_level, rule.required_inputs, rule.outputs, rule.depends_on,
+        ]
+        for rule in DECOMPOSITION_RULES
+    ]
+
+
+def _leaf_paths(model: type[BaseModel], prefix: str = "") -> list[str]:
+    paths = []
+    for name, info in model.model_fields.items():
+        path = f"{prefix}{name}"
+        annotation = info.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            paths.extend(_leaf_paths(annotation, f"{path}."))
+        else:
+            paths.append(path)
+    return paths
+
+
+def _tuple_getter(paths: tuple[str, ...]):
+    """점 경로들의 값을 항상 튜플로 돌려주는 getter (attrgetter는 경로가 1개면 튜플이 아님)"""
+    if len(paths) == 1:
+        getter = attrgetter(paths[0])
+        return lambda obj: (getter(obj),)
+    return attrgetter(*paths) if paths else (lambda obj: ())
+
+
+def _task_dict(rule: TaskRule, selected: set[str]) -> dict:
+    high_risk = rule.risk_level == "high"
+    return {
+        "task_id": rule.task_id,
+        "title": rule.title,
+        "priority": rule.priority,
+        "mandatory": rule.mandatory,
+        "route": rule.route,
+        "risk_level": rule.risk_level,
+        "requires_hitl": high_risk,
+        "trigger_conditions": [f"{path}={'|'.join(sorted(values))}" for path, values in rule.when.items()],
+        "required_inputs": list(rule.required_inputs),
+        "outputs": list(rule.outputs),
+        # 적용되지 않은 선행 태스크는 간선에서 뺀다
+        "depends_on": [dep for dep in rule.depends_on if dep in selected],
+    }
+
+
+class RuleEngine:
+    """규칙 테이블을 (조건 필드 getter, 규칙별 허용 값 인덱스)로 컴파일한 평가기"""
+
+    def __init__(self, rules: tuple[TaskRule, ...], ignored: frozenset[str]):
+        self.rules = rules
+        ids = [r.task_id for r in rules]
+        for rule in rules:
+            missing = [dep for dep in rule.depends_on if dep not in ids or ids.index(dep) >= ids.index(rule.task_id)]
+            if missing:
+                raise ValueError(f"{rule.task_id}: 선행 태스크는 표에서 먼저 선언돼야 함 ({missing})")
+
+        self.fields = tuple(sorted({path for rule in rules for path in rule.when}))
+        self._get_fields = _tuple_getter(self.fields)
+        # 규칙별 조건을 fields 튜플 위치 기준으로 변환
+        self._conditions = [
+            (rule, tuple((self.fields.index(path), values) for path, values in rule.when.items()))
+            for rule in rules
+        ]
+        uncovered = [p for p in _leaf_paths(MoveProfile) if p not in self.fields and p not in ignored]
+        self.uncovered_fields = tuple(uncovered)
+        self._get_uncovered = _tuple_getter(self.uncovered_fields)
+        self._evaluate = lru_cache(maxsize=1024)(self._evaluate_uncached)
+
+    def _evaluate_uncached(self, values: tuple) -> tuple[dict, ...]:
+        selected = [
+            rule for rule, conditions in self._conditions
+            if all(values[i] in allowed for i, allowed in conditions)
+        ]
+        ids = {rule.task_id for rule in selected}
+        return tuple(_task_dict(rule, ids) for rule in selected)
+
+    def needs_llm(self, profile: MoveProfile) -> list[str]:
+        """규칙이 다루지 않는데 값이 설정된 필드 (비어 있으면 규칙만으로 충분)"""
+        return [
+            path for path, value in zip(self.uncovered_fields, self._get_uncovered(profile))
+            if value not in _UNSET_VALUES
+        ]
+
+    def decompose(self, profile: MoveProfile) -> list[dict] | None:
+        """규칙으로 만든 task_graph, 규칙 밖 필드가 있으면 None"""
+        if self.needs_llm(profile):
+            return None
+        values = self._get_fields(profile)
+        # 호출자가 결과를 수정해도 메모이즈된 값은 그대로 두도록 리스트 필드까지 복사
+        return [
+            {k: list(v) if isinstance(v, list) else v for k, v in task.items()}
+            for task in self._evaluate(values)
+        ]
+
+
+RULES = RuleEngine(DECOMPOSITION_RULES, IGNORED_FIELDS)
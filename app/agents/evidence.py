@@ -1,10 +1,44 @@
-import json
 from pydantic import BaseModel
 from .base import BaseAgent
-from ..prompts import EVIDENCE_PROMPT
+from .evidence_catalog import build_cards
+from ..core.config import get_settings
+from ..core.context_builder import ContextBuilder, project
+from ..core.metrics import REGISTRY
+from ..core.response_schemas import register_response_schema
+from ..prompts import EVIDENCE_PROMPT, EVIDENCE_REASON_PROMPT
 from ..schemas.profile import MoveProfile
 from ..schemas.service import ServiceCard
 
+CARDS = REGISTRY.counter("move_evidence_cards_total", "service_cards 생성 경로별 횟수", ("source",))
+
+# 프롬프트에 넣는 필드 — 카드에 옮겨 적거나 추천 이유에 쓰는 것만 (fee, tags 등은 제외)
+_TASK_FIELDS = ("task_id", "title", "priority", "mandatory", "trigger_conditions")
+_SERVICE_FIELDS = (
+    "service_id", "service_name", "route", "eligibility_summary", "required_documents",
+    "application_channel", "main_url", "legal_basis", "contact",
+)
+_CARD_FIELDS = ("service_id", "service_name", "eligibility_summary", "why_recommended")
+_PROFILE_FIELDS = {"move_date", "to_region", "household_type", "is_rental", "has_children", "vehicles", "needs"}
+
+
+def _profile_context(move_profile: MoveProfile) -> dict:
+    return move_profile.model_dump(include=_PROFILE_FIELDS, exclude_defaults=True)
+
+
+@register_response_schema
+class CardList(BaseModel):
+    service_cards: list[ServiceCard]
+
+
+class CardReason(BaseModel):
+    service_id: str
+    why_recommended: list[str]
+
+
+@register_response_schema
+class CardReasonList(BaseModel):
+    reasons: list[CardReason]
+
 
 class EvidenceAgent(BaseAgent):
     def __init__(self):
@@ -16,14 +50,84 @@ class EvidenceAgent(BaseAgent):
         move_profile: MoveProfile,
         db_results: list[dict],
     ) -> list[dict]:
-        user_content = (
-            f"task_graph: {json.dumps(task_graph, ensure_ascii=False)}\n"
-            f"move_profile: {json.dumps(move_profile.model_dump(), ensure_ascii=False)}\n"
-            f"db_results: {json.dumps(db_results, ensure_ascii=False)}"
+        cards = self.from_catalog(task_graph, move_profile)
+        if cards is not None:
+            return cards
+        CARDS.inc("llm")
+        user_content = self._build_content(task_graph, move_profile, db_results)
+        result = self._call(user_content, CardList, temperature=0.2)
+        return result.get("service_cards", [])
+
+    async def run_async(
+        self,
+        task_graph: list[dict],
+        move_profile: MoveProfile,
+        db_results: list[dict],
+    ) -> list[dict]:
+        cards = self.from_catalog(task_graph, move_profile)
+        if cards is not None:
+            return cards
+        CARDS.inc("llm")
+        user_content = self._build_content(task_graph, move_profile, db_results)
+        result = await self._call_async(user_content, CardList, temperature=0.2)
+        return result.get("service_cards", [])
+
+    def from_catalog(self, task_graph: list[dict], move_profile: MoveProfile) -> list[dict] | None:
+        """SERVICES_DB로 바로 만든 카드 (why_recommended는 기본 문구), 맞는 태스크가 없으면 None"""
+        if not get_settings().evidence_catalog_enabled:
+            return None
+        cards = build_cards(task_graph, move_profile)
+        if cards is not None:
+            CARDS.inc("catalog")
+        return cards
+
+    def _build_content(
+        self,
+        task_graph: list[dict],
+        move_profile: MoveProfile,
+        db_results: list[dict],
+    ) -> str:
+        # 예산을 넘으면 검색 순위가 낮은 서비스부터, 그다음 뒤쪽 태스크를 뺀다
+        return (
+            ContextBuilder(type(self).__name__)
+            .add("task_graph", [project(t, _TASK_FIELDS) for t in task_graph], raw=task_graph, priority=1)
+            .add("move_profile", _profile_context(move_profile), raw=move_profile.model_dump())
+            .add("db_results", [project(r, _SERVICE_FIELDS) for r in db_results], raw=db_results, priority=0)
+            .build()
+            .text
         )
 
-        class CardList(BaseModel):
-            service_cards: list[ServiceCard]
 
-        result = self._call(user_content, CardList, temperature=0.2)
-        return result.get("service_cards", [])
+class EvidenceReasonAgent(BaseAgent):
+    """카탈로그 카드의 why_recommended만 사용자 상황에 맞게 다시 쓴다 (턴 응답 이후 백그라운드)"""
+
+    def __init__(self):
+        super().__init__(EVIDENCE_REASON_PROMPT)
+
+    def run(self, cards: list[dict], move_profile: MoveProfile) -> dict[str, list[str]]:
+        """service_id → why_recommended (요청한 카드에 대한 비어 있지 않은 문구만)"""
+        result = self._call(self._build_content(cards, move_profile), CardReasonList, temperature=0.2)
+        return self._parse(cards, result)
+
+    async def run_async(self, cards: list[dict], move_profile: MoveProfile) -> dict[str, list[str]]:
+        result = await self._call_async(self._build_content(cards, move_profile), CardReasonList, temperature=0.2)
+        return self._parse(cards, result)
+
+    def _parse(self, cards: list[dict], result: dict) -> dict[str, list[str]]:
+        ids = {c["service_id"] for c in cards}
+        return {
+            r["service_id"]: r["why_recommended"]
+            for r in result.get("reasons", [])
+            if r.get("service_id") in ids and r.get("why_recommended")
+        }
+
+    def _build_content(self, cards: list[dict], move_profile: MoveProfile) -> str:
+        # 예산을 넘으면 뒤쪽 카드는 빼고 (그 카드는 기본 추천 이유를 유지)
+        services = [project(c, _CARD_FIELDS) for c in cards]
+        return (
+            ContextBuilder(type(self).__name__)
+            .add("move_profile", _profile_context(move_profile), raw=move_profile.model_dump())
+            .add("service_cards", services, raw=services, priority=0)
+            .build()
+            .text
+        )
@@ -0,0 +1,86 @@
+"""Evidence 카드 결정적 생성 — task_graph 태스크 → SERVICES_DB 항목 → ServiceCard dict
+
+카드의 사실 필드(main_url, legal_basis, required_documents, contact, application_channel)는
+LLM 경로에서도 db_results를 그대로 옮긴 값이므로, 태스크 제목으로 카탈로그 항목을 찾아
+프로세스 안에서 바로 만든다. why_recommended만 태스크 조건·필수 여부로 만든 기본 문구이고,
+사용자 상황을 반영한 문구는 응답 후 EvidenceReasonAgent.run_async()가 채운다.
+카탈로그와 맞는 태스크가 하나도 없으면 build_cards()가 None을 돌려 LLM으로 넘긴다.
+"""
+from ..db.services_db import SERVICES_DB
+from ..schemas.profile import MoveProfile
+
+# 태스크 trigger_conditions 경로 → 기본 추천 이유
+_CONDITION_REASONS = {
+    "vehicles.car": "차량을 보유하고 있어 등록 주소도 함께 바꿔야 합니다.",
+    "has_children": "자녀가 있는 가구입니다.",
+    "needs.school_transfer": "자녀의 전학이 필요할 수 있습니다.",
+    "needs.childcare": "어린이집 이용이 필요할 수 있습니다.",
+    "needs.waste_disposal": "이사 과정에서 대형 폐기물이 나올 수 있습니다.",
+}
+_MANDATORY_REASON = "이사한 모든 가구가 해야 하는 필수 절차입니다."
+
+
+def _compact(text: str) -> str:
+    return "".join(text.split())
+
+
+def match_service(title: str, catalog: dict[str, dict] | None = None) -> dict | None:
+    """태스크 제목과 같은(공백 무시) 서비스, 없으면 이름이 서로 포함되는 서비스 중 가장 긴 것"""
+    catalog = SERVICES_DB if catalog is None else catalog
+    key = _compact(title)
+    if not key:
+        return None
+    best = None
+    for service in catalog.values():
+        name = _compact(service["service_name"])
+        if name == key:
+            return service
+        if (key in name or name in key) and (best is None or len(name) > len(_compact(best["service_name"]))):
+            best = service
+    return best
+
+
+def _reasons(task: dict, service: dict) -> list[str]:
+    reasons = [_MANDATORY_REASON] if task.get("mandatory") else []
+    for condition in task.get("trigger_conditions", []):
+        reason = _CONDITION_REASONS.get(condition.split("=", 1)[0])
+        if reason and reason not in reasons:
+            reasons.append(reason)
+    if service.get("eligibility_summary"):
+        reasons.append(service["eligibility_summary"])
+    return reasons
+
+
+def _in_region(service: dict, profile: MoveProfile) -> bool:
+    target = service.get("target_region", "all")
+    return target == "all" or target == profile.to_region.sido
+
+
+def build_cards(
+    task_graph: list[dict], profile: MoveProfile, catalog: dict[str, dict] | None = None
+) -> list[dict] | None:
+    """태스크 순서대로 카탈로그 카드 (서비스당 1장), 맞는 태스크가 없으면 None"""
+    cards: list[dict] = []
+    seen: set[str] = set()
+    for task in task_graph:
+        service = match_service(task.get("title", ""), catalog)
+        if service is None or service["service_id"] in seen or not _in_region(service, profile):
+            continue
+        seen.add(service["service_id"])
+        evidence = [{"type": "db_field", "key": "main_url", "value": service["main_url"]}] if service.get("main_url") else []
+        evidence += [{"type": "db_field", "key": "legal_basis", "value": law} for law in service.get("legal_basis", [])]
+        evidence.append({"type": "task", "key": task.get("task_id", ""), "value": task.get("title", "")})
+        cards.append({
+            "service_id": service["service_id"],
+            "service_name": service["service_name"],
+            "route": service["route"],
+            "why_recommended": _reasons(task, service),
+            "eligibility_summary": service.get("eligibility_summary", ""),
+            "required_documents": list(service.get("required_documents", [])),
+            "application_channel": list(service.get("application_channel", [])),
+            "main_url": service.get("main_url", "") or "공식 링크 확인 필요",
+            "legal_basis": list(service.get("legal_basis", [])),
+            "contact": service.get("contact", ""),
+            "evidence": evidence,
+        })
+    return cards or None
@@ -1,9 +1,16 @@
-import json
 from .base import BaseAgent
+from ..core.context_builder import ContextBuilder, project
+from ..core.response_schemas import register_response_schema
 from ..prompts import FORM_FILL_PROMPT
 from ..schemas.profile import MoveProfile
 from ..schemas.form import FormFillResult
 
+register_response_schema(FormFillResult)
+
+# 신청서 필드에 대응할 수 있는 프로필 필드만 (consent·risk_flags·needs 제외)
+_PROFILE_FIELDS = {"move_date", "from_region", "to_region", "household_type", "is_rental", "has_children", "vehicles"}
+_FIELD_KEYS = ("name", "label", "type", "required", "is_sensitive", "options")
+
 
 class FormFillAgent(BaseAgent):
     def __init__(self):
@@ -15,13 +22,34 @@ class FormFillAgent(BaseAgent):
         move_profile: MoveProfile,
         form_schema: dict,
     ) -> dict:
-        user_content = (
-            f"service_id: {service_id}\n"
-            f"move_profile: {json.dumps(move_profile.model_dump(), ensure_ascii=False)}\n"
-            f"form_schema: {json.dumps(form_schema, ensure_ascii=False)}"
+        user_content = self._build_content(service_id, move_profile, form_schema)
+        result = self._call(user_content, FormFillResult, temperature=0.1)
+        return self._parse(result, service_id, move_profile, form_schema)
+
+    async def run_async(
+        self,
+        service_id: str,
+        move_profile: MoveProfile,
+        form_schema: dict,
+    ) -> dict:
+        user_content = self._build_content(service_id, move_profile, form_schema)
+        result = await self._call_async(user_content, FormFillResult, temperature=0.1)
+        return self._parse(result, service_id, move_profile, form_schema)
+
+    def _build_content(self, service_id: str, move_profile: MoveProfile, form_schema: dict) -> str:
+        # 신청서 필드는 출력 키 목록이므로 예산과 무관하게 모두 보낸다
+        fields = [project(f, _FIELD_KEYS) for f in form_schema.get("fields", [])]
+        return (
+            ContextBuilder(type(self).__name__)
+            .add("service_id", service_id)
+            .add("move_profile", move_profile.model_dump(include=_PROFILE_FIELDS, exclude_defaults=True),
+                 raw=move_profile.model_dump())
+            .add("form_schema", fields, raw=form_schema)
+            .build()
+            .text
         )
 
-        result = self._call(user_content, FormFillResult, temperature=0.1)
+    def _parse(self, result: dict, service_id: str, move_profile: MoveProfile, form_schema: dict) -> dict:
         if not result or not result.get("draft_payload"):
             # Gemini 실패 시 프로필에서 직접 채우는 폴백
             return self._fallback_fill(service_id, move_profile, form_schema)
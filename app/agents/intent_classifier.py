@@ -0,0 +1,147 @@
+"""로컬 의도 분류기 — 첫 턴 Triage LLM 호출을 명확한 메시지에서는 생략한다
+
+공백을 없앤 메시지에서 표지 문자열(문자 n-gram)을 한 번의 정규식 스캔으로 찾고,
+표지별 가중치 합을 클래스 점수로 삼아 softmax(점수 / temperature)로 신뢰도를 낸다.
+temperature는 benchmarks/eval_intent.py --calibrate로 라벨 코퍼스에서 고른 값이다.
+신뢰도가 임계값 미만이면 None을 돌려 호출자가 LLM(TriageAgent)으로 넘긴다.
+
+'other'는 이사 관련 표지가 전혀 없을 때의 기본 점수만 가지므로 단독으로는 임계값을
+넘지 못한다 — 이사 관련 여부가 애매한 메시지는 항상 LLM이 판단한다.
+제3자("친구가 이사했어요")·부정("이사 안 가요")·취소 표지가 있으면 점수와 무관하게 LLM으로 넘긴다.
+'다음주'·'예정'·'전세' 같은 일반 표지는 가중치만 더하고, 이사 기준 표지(이사·전입·이삿짐)가
+하나도 없으면 신뢰도가 높아도 로컬에서 답하지 않는다 ("다음 주 출장 예정이야").
+"""
+import math
+import re
+from dataclasses import dataclass
+
+INTENTS = ("move", "move_plan", "other")
+
+# (표지, 클래스, 가중치) — 표지는 공백 없이 적는다
+_MARKERS: tuple[tuple[str, str, float], ...] = (
+    # 이사 완료
+    ("이사했", "move", 4.0), ("이사왔", "move", 4.0), ("이사온", "move", 3.5), ("이사와서", "move", 3.5),
+    ("이사한", "move", 3.0), ("이사함", "move", 3.0), ("이사완료", "move", 4.0), ("이사끝", "move", 3.5),
+    ("이사를했", "move", 4.0), ("이사후", "move", 2.0), ("이사하고나서", "move", 3.0),
+    ("전입신고", "move", 2.0), ("전입", "move", 1.0), ("확정일자", "move", 1.0),
+    ("주소변경", "move", 1.0), ("주소이전", "move", 1.0),
+    # 이사 예정
+    ("이사예정", "move_plan", 4.5), ("이사갈", "move_plan", 4.0), ("이사가", "move_plan", 3.0),
+    ("이사할", "move_plan", 4.0), ("이사준비", "move_plan", 4.5), ("이사하려", "move_plan", 4.5),
+    ("이사계획", "move_plan", 4.5), ("이사앞두", "move_plan", 4.5), ("이사갑니다", "move_plan", 1.5),
+    ("이사해요", "move_plan", 1.5), ("이사하는데", "move_plan", 2.0), ("이사가는데", "move_plan", 1.5),
+    ("다음주", "move_plan", 1.5), ("다음달", "move_plan", 1.5), ("예정", "move_plan", 1.5),
+    # 완료/예정 공통 — 'other'가 아니라는 근거
+    ("이사", "move", 1.5), ("이사", "move_plan", 1.5), ("이삿짐", "move", 1.0), ("이삿짐", "move_plan", 1.0),
+    ("전세", "move", 0.5), ("월세", "move", 0.5), ("주민센터", "move", 0.5), ("행정복지센터", "move", 0.5),
+)
+
+# 로컬 판정의 전제 — 이 문자열을 포함한 표지가 하나 이상 있어야 한다
+_ANCHORS = ("이사", "전입", "이삿짐")
+
+# 있으면 신뢰도와 무관하게 LLM으로 넘기는 표지 — 이사 주체가 사용자가 아니거나 이사를 부정·취소하는 경우
+_FALLBACK_MARKERS: tuple[str, ...] = (
+    # 제3자
+    "친구", "지인", "동료", "이웃", "옆집", "부모님", "어머니", "아버지", "엄마", "아빠",
+    "할머니", "할아버지", "동생", "언니", "오빠", "누나", "시부모", "장인", "장모",
+    # 부정·취소
+    "안했", "안해", "안하", "안한", "안할", "안갔", "안가", "안갈", "안왔", "안와", "않",
+    "못했", "못하", "못갔", "못가", "못갈", "취소", "무산",
+)
+
+# 사전(MessageAnalysis.scan.kinds) 분류별 가산점 — 날짜 표현은 완료 쪽 근거 (표지가 있을 때만 적용)
+_KIND_WEIGHTS: dict[str, tuple[tuple[str, float], ...]] = {
+    "date_today": (("move", 1.5),),
+    "date_yesterday": (("move", 2.0),),
+    "date_two_days_ago": (("move", 2.0),),
+}
+
+# 표지가 하나도 없을 때의 'other' 기본 점수
+_OTHER_PRIOR = 1.0
+
+_TEMPERATURE = 0.75  # eval_intent.py --calibrate — NLL은 0.5와 거의 같고 임계값 0.9에서 오판이 없는 쪽
+_PATTERN = re.compile("|".join(sorted({re.escape(m) for m, _, _ in _MARKERS}, key=len, reverse=True)))
+_FALLBACK_PATTERN = re.compile("|".join(map(re.escape, _FALLBACK_MARKERS)))
+_ANCHOR_MARKERS = frozenset(m for m, _, _ in _MARKERS if any(a in m for a in _ANCHORS))
+_WEIGHTS: dict[str, tuple[tuple[str, float], ...]] = {}
+for _marker, _intent, _weight in _MARKERS:
+    _WEIGHTS[_marker] = _WEIGHTS.get(_marker, ()) + ((_intent, _weight),)
+
+
+@dataclass(frozen=True, slots=True)
+class IntentScore:
+    intent: str
+    confidence: float
+    probabilities: dict[str, float]
+    markers: tuple[str, ...]
+    fallback_markers: tuple[str, ...] = ()  # 있으면 classify_intent가 LLM으로 넘긴다
+
+    @property
+    def anchored(self) -> bool:
+        """이사 기준 표지(_ANCHORS)가 하나라도 있는지"""
+        return any(m in _ANCHOR_MARKERS for m in self.markers)
+
+    def is_local(self, threshold: float) -> bool:
+        """LLM 없이 이 판정을 그대로 써도 되는지"""
+        return self.confidence >= threshold and self.anchored and not self.fallback_markers
+
+
+def _compact(text: str) -> str:
+    return "".join(text.split())
+
+
+def _prefixes(text: str, start: int) -> list[str]:
+    """start에서 시작하는 모든 표지 (정규식은 가장 긴 것 하나만 매치하므로 짧은 표지를 보충)"""
+    return [m for m in _WEIGHTS if text.startswith(m, start)]
+
+
+def score_intent(
+    text: str, kinds: frozenset[str] | set[str] = frozenset(), temperature: float | None = None
+) -> IntentScore:
+    """클래스별 확률과 최고 클래스 (LLM 폴백 여부와 무관한 원점수)"""
+    compact = _compact(text)
+    scores = dict.fromkeys(INTENTS, 0.0)
+    found: list[str] = []
+    pos = 0
+    while True:
+        m = _PATTERN.search(compact, pos)
+        if m is None:
+            break
+        for marker in _prefixes(compact, m.start()):
+            found.append(marker)
+            for intent, weight in _WEIGHTS[marker]:
+                scores[intent] += weight
+        pos = m.start() + 1
+    if found:
+        for kind in kinds:
+            for intent, weight in _KIND_WEIGHTS.get(kind, ()):
+                scores[intent] += weight
+    else:
+        scores["other"] = _OTHER_PRIOR
+
+    t = temperature or _TEMPERATURE
+    top = max(scores.values())
+    exp = {intent: math.exp((s - top) / t) for intent, s in scores.items()}
+    total = sum(exp.values())
+    probabilities = {intent: v / total for intent, v in exp.items()}
+    intent = max(probabilities, key=probabilities.get)
+    fallback = tuple(dict.fromkeys(_FALLBACK_PATTERN.findall(compact)))
+    return IntentScore(intent, probabilities[intent], probabilities, tuple(found), fallback)
+
+
+def classify_intent(
+    text: str,
+    kinds: frozenset[str] | set[str] = frozenset(),
+    threshold: float = 0.9,
+    sensitive: bool = False,
+) -> dict | None:
+    """IntentScore.is_local(threshold)이면 TriageResult 형태의 dict, 아니면 None (LLM 폴백)"""
+    result = score_intent(text, kinds)
+    if not result.is_local(threshold):
+        return None
+    return {
+        "intent": result.intent,
+        "confidence": round(result.confidence, 4),
+        "sensitive": sensitive,
+        "notes": f"local: {', '.join(dict.fromkeys(result.markers)) or '표지 없음'}",
+    }
@@ -1,11 +1,17 @@
 import json
 from pydantic import BaseModel
 from .base import BaseAgent
+from ..core.response_schemas import register_response_schema
 from ..prompts import INTERVIEW_PROMPT
 from ..schemas.profile import MoveProfile
 from ..schemas.api_models import NextQuestion
 
 
+@register_response_schema
+class QuestionList(BaseModel):
+    questions: list[NextQuestion]
+
+
 class InterviewAgent(BaseAgent):
     def __init__(self):
         super().__init__(INTERVIEW_PROMPT)
@@ -14,14 +20,20 @@ class InterviewAgent(BaseAgent):
         if move_profile.is_sufficient():
             return []
 
-        user_content = (
-            f"intent: {intent}\n"
-            f"move_profile: {json.dumps(move_profile.model_dump(), ensure_ascii=False)}"
-        )
+        result = self._call(self._build_content(move_profile, intent), QuestionList, temperature=0.3)
+        questions = result.get("questions", [])
+        return questions[:3]
 
-        class QuestionList(BaseModel):
-            questions: list[NextQuestion]
+    async def run_async(self, move_profile: MoveProfile, intent: str) -> list[dict]:
+        if move_profile.is_sufficient():
+            return []
 
-        result = self._call(user_content, QuestionList, temperature=0.3)
+        result = await self._call_async(self._build_content(move_profile, intent), QuestionList, temperature=0.3)
         questions = result.get("questions", [])
         return questions[:3]
+
+    def _build_content(self, move_profile: MoveProfile, intent: str) -> str:
+        return (
+            f"intent: {intent}\n"
+            f"move_profile: {json.dumps(move_profile.model_dump(), ensure_ascii=False)}"
+        )
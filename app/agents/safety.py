@@ -1,19 +1,78 @@
 import re
+from dataclasses import dataclass
+from typing import Iterable
 from pydantic import BaseModel
 from .base import BaseAgent
 from ..prompts import SAFETY_PROMPT
 from ..schemas.audit import AuditEvent
 
 _PII_PATTERNS = [
-    (re.compile(r"\d{6}-[1-4]\d{6}"), "주민등록번호"),
-    (re.compile(r"\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}"), "카드번호"),
-    (re.compile(r"\d{10,14}"), "계좌번호 의심"),
+    ("rrn", re.compile(r"\d{6}-[1-4]\d{6}"), "주민등록번호"),
+    ("card", re.compile(r"\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}"), "카드번호"),
+    ("account", re.compile(r"\d{10,14}"), "계좌번호 의심"),
 ]
+PII_KINDS = tuple(kind for kind, _, _ in _PII_PATTERNS)  # 우선순위 순
 
 _FORCE_SUBMIT_PATTERNS = re.compile(
-    r"(바로\s*제출|확인\s*없이|그냥\s*접수|즉시\s*신청|바로\s*신청|바로\s*접수)"
+    r"바로\s*제출|확인\s*없이|그냥\s*접수|즉시\s*신청|바로\s*신청|바로\s*접수"
 )
 
+_FINDING_LABELS = {kind: label for kind, _, label in _PII_PATTERNS} | {"force_submit": "강제 제출 요청"}
+
+# 모든 패턴을 하나의 교대(alternation)로 합쳐 메시지를 1회만 훑는다.
+# 앞의 문자 집합 lookahead는 숫자·강제 제출 문구 첫 글자가 아닌 위치를 교대 시도 없이 건너뛰게 한다.
+_FIRST_CHARS = "".join(sorted({alt[0] for alt in _FORCE_SUBMIT_PATTERNS.pattern.split("|")}))
+_COMBINED_PATTERN = re.compile(
+    rf"(?=[\d{_FIRST_CHARS}])(?:"
+    + "|".join(f"(?P<{kind}>{pattern.pattern})" for kind, pattern, _ in _PII_PATTERNS)
+    + f"|(?P<force_submit>{_FORCE_SUBMIT_PATTERNS.pattern}))"
+)
+# 민감정보 매치의 최대 길이 (구분자 포함 카드번호 19자)
+_MAX_PII_LEN = 19
+# 가장 짧은 탐지 대상 ("바로제출" 4자) 보다 짧은 메시지는 검사 생략
+_MIN_FINDING_LEN = 4
+
+
+@dataclass(frozen=True, slots=True)
+class SafetyFinding:
+    kind: str    # rrn | card | account | force_submit
+    start: int
+    end: int
+
+    @property
+    def label(self) -> str:
+        return _FINDING_LABELS[self.kind]
+
+
+def scan(message: str) -> list[SafetyFinding]:
+    """민감정보·강제 제출 요청을 1회 스캔으로 모두 찾아 span과 함께 반환"""
+    if len(message) < _MIN_FINDING_LEN:
+        return []
+    findings: list[SafetyFinding] = []
+    last_end: dict[str, int] = {}
+    for m in _COMBINED_PATTERN.finditer(message):
+        kind = m.lastgroup
+        start, end = m.span()
+        if kind in PII_KINDS:
+            # 교대 매치가 소비한 구간 안에서 시작하는 더 높은 우선순위 패턴이 있으면 그것으로 보고
+            # (패턴별로 따로 검사하던 기존 판정과 동일하게 유지, 구간 길이에 비례하는 국소 검사)
+            for higher_kind, pattern, _ in _PII_PATTERNS[:PII_KINDS.index(kind)]:
+                hm = pattern.search(message, start, end + _MAX_PII_LEN)
+                if hm and hm.start() < end:
+                    kind, (start, end) = higher_kind, hm.span()
+                    break
+        # 같은 종류의 겹치는 매치는 첫 매치로 대표
+        if start < last_end.get(kind, -1):
+            continue
+        last_end[kind] = end
+        findings.append(SafetyFinding(kind, start, end))
+    return findings
+
+
+def scan_many(messages: Iterable[str]) -> list[list[SafetyFinding]]:
+    """저장된 대화 기록 오프라인 감사용 배치 스캔"""
+    return [scan(message) for message in messages]
+
 
 class SafetyResult(BaseModel):
     block: bool
@@ -21,32 +80,44 @@ class SafetyResult(BaseModel):
     block_submit: bool
     required_hitl: bool
     sensitive_type: str | None = None
+    findings: list[dict] = []  # [{"kind", "label", "start", "end"}] — 원문은 담지 않음
 
 
 class SafetyAuditAgent(BaseAgent):
     def __init__(self):
         super().__init__(SAFETY_PROMPT)
 
-    def run(self, user_message: str, planned_actions: list[str] | None = None) -> dict:
+    def run(
+        self,
+        user_message: str,
+        planned_actions: list[str] | None = None,
+        findings: list[SafetyFinding] | None = None,
+    ) -> dict:
+        """findings: 이미 스캔한 결과가 있으면 재사용 (MessageAnalysis.findings)"""
         planned_actions = planned_actions or []
 
-        # 1단계: 정규식 사전 필터 (Gemini 호출 전)
-        for pattern, label in _PII_PATTERNS:
-            if pattern.search(user_message):
-                audit = AuditEvent(
-                    event_type="safety_block",
-                    summary=f"민감정보 감지됨: {label}",
-                )
-                return SafetyResult(
-                    block=True,
-                    block_reason=f"{label}이(가) 감지되었습니다. 민감정보는 채팅에 입력하지 마세요.",
-                    block_submit=False,
-                    required_hitl=False,
-                    sensitive_type=label,
-                ).model_dump() | {"audit_event": audit.model_dump()}
+        if findings is None:
+            findings = scan(user_message)
+        pii = [f for f in findings if f.kind in PII_KINDS]
+
+        # 1단계: 정규식 사전 필터 (Gemini 호출 전) — 우선순위가 가장 높은 민감정보로 판정
+        if pii:
+            label = min(pii, key=lambda f: PII_KINDS.index(f.kind)).label
+            audit = AuditEvent(
+                event_type="safety_block",
+                summary=f"민감정보 감지됨: {label}",
+            )
+            return SafetyResult(
+                block=True,
+                block_reason=f"{label}이(가) 감지되었습니다. 민감정보는 채팅에 입력하지 마세요.",
+                block_submit=False,
+                required_hitl=False,
+                sensitive_type=label,
+                findings=[_finding_dict(f) for f in findings],
+            ).model_dump() | {"audit_event": audit.model_dump()}
 
         # 2단계: 강제 제출 요구 감지
-        if _FORCE_SUBMIT_PATTERNS.search(user_message):
+        if findings:
             audit = AuditEvent(
                 event_type="hitl_gate",
                 summary="사용자가 확인 없이 즉시 제출을 요청함 → HITL 강제",
@@ -56,6 +127,7 @@ class SafetyAuditAgent(BaseAgent):
                 block_reason=None,
                 block_submit=True,
                 required_hitl=True,
+                findings=[_finding_dict(f) for f in findings],
             ).model_dump() | {"audit_event": audit.model_dump()}
 
         # 정규식 통과 시 Gemini 호출 스킵 (Rate Limit 절약)
@@ -69,3 +141,7 @@ class SafetyAuditAgent(BaseAgent):
             block_submit=False,
             required_hitl=False,
         ).model_dump() | {"audit_event": audit.model_dump()}
+
+
+def _finding_dict(finding: SafetyFinding) -> dict:
+    return {"kind": finding.kind, "label": finding.label, "start": finding.start, "end": finding.end}
@@ -1,9 +1,16 @@
 from typing import Literal
 from pydantic import BaseModel
 from .base import BaseAgent
+from .intent_classifier import classify_intent
+from ..core.config import get_settings
+from ..core.metrics import REGISTRY
+from ..core.response_schemas import register_response_schema
 from ..prompts import TRIAGE_PROMPT
 
+TRIAGES = REGISTRY.counter("move_triage_total", "첫 턴 의도 분류 경로별 횟수", ("source",))
 
+
+@register_response_schema
 class TriageResult(BaseModel):
     intent: Literal["move", "move_plan", "other"]
     confidence: float
@@ -15,8 +22,34 @@ class TriageAgent(BaseAgent):
     def __init__(self):
         super().__init__(TRIAGE_PROMPT)
 
-    def run(self, user_message: str) -> dict:
+    def run(self, user_message: str, kinds: frozenset[str] = frozenset()) -> dict:
+        local = self._from_local(user_message, kinds)
+        if local is not None:
+            return local
         result = self._call(user_message, TriageResult, temperature=0.1)
+        return self._parse(result)
+
+    async def run_async(self, user_message: str, kinds: frozenset[str] = frozenset()) -> dict:
+        local = self._from_local(user_message, kinds)
+        if local is not None:
+            return local
+        result = await self._call_async(user_message, TriageResult, temperature=0.1)
+        return self._parse(result)
+
+    def _from_local(self, user_message: str, kinds: frozenset[str]) -> dict | None:
+        """로컬 분류 신뢰도가 임계값 이상이면 그 결과, 애매하면 None (LLM 폴백)
+
+        kinds: 메시지 사전 스캔의 분류 집합 (MessageAnalysis.scan.kinds)
+        """
+        settings = get_settings()
+        if not settings.triage_local_enabled:
+            TRIAGES.inc("llm")
+            return None
+        result = classify_intent(user_message, kinds, threshold=settings.triage_local_threshold)
+        TRIAGES.inc("llm" if result is None else "local")
+        return result
+
+    def _parse(self, result: dict) -> dict:
         if not result:
             return TriageResult(
                 intent="other", confidence=0.0, sensitive=False, notes="분류 실패"
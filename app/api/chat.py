@@ -1,18 +1,88 @@
+import asyncio
+import json
+import traceback
+import uuid
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from ..core.shared_state import LeaseTimeout
 from ..schemas.api_models import ChatRequest, ChatResponse
 from ..orchestrator.orchestrator import Orchestrator
 
 router = APIRouter()
 _orchestrator = Orchestrator()
+session_store = _orchestrator.session_store
+
+# 클라이언트가 끊어도 턴은 끝까지 진행되도록 백그라운드 태스크 참조 유지
+_inflight_turns: set[asyncio.Task] = set()
 
 
 @router.post("/chat", response_model=ChatResponse)
-def chat(request: ChatRequest) -> ChatResponse:
+async def chat(request: ChatRequest) -> ChatResponse:
     if not request.user_message.strip():
         raise HTTPException(status_code=400, detail="메시지를 입력해 주세요.")
-    return _orchestrator.handle_turn(
-        session_id=request.session_id,
-        user_message=request.user_message,
+    try:
+        return await _orchestrator.handle_turn_async(
+            session_id=request.session_id,
+            user_message=request.user_message,
+        )
+    except LeaseTimeout:
+        raise HTTPException(status_code=409, detail="같은 세션의 이전 요청을 처리하고 있습니다. 잠시 후 다시 시도해 주세요.")
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """턴 진행 단계를 SSE로 전송한다.
+
+    이벤트 순서: ack → safety → (questions | task_graph → service_card* → draft_preview)
+    → markdown → final. final의 data는 /chat 응답(ChatResponse)과 동일하다.
+    """
+    if not request.user_message.strip():
+        raise HTTPException(status_code=400, detail="메시지를 입력해 주세요.")
+
+    # 새 세션도 ack에 id를 실어 보내도록 턴 시작 전에 만든다
+    session_id = request.session_id or str(uuid.uuid4())
+    queue: asyncio.Queue[tuple[str, dict] | None] = asyncio.Queue()
+
+    async def emit(event: str, data: dict) -> None:
+        await queue.put((event, data))
+
+    async def run_turn() -> None:
+        try:
+            response = await _orchestrator.handle_turn_async(
+                session_id=session_id,
+                user_message=request.user_message,
+                on_event=emit,
+                new_session=not request.session_id,
+            )
+            await emit("markdown", {"markdown": response.assistant_message_markdown})
+            await emit("final", response.model_dump())
+        except LeaseTimeout:
+            await emit("error", {"detail": "같은 세션의 이전 요청을 처리하고 있습니다. 잠시 후 다시 시도해 주세요."})
+        except Exception:
+            # 내부 오류 내용은 서버 로그에만 남기고 클라이언트에는 고정 문구를 보낸다
+            print(f"[ChatStream] 턴 처리 실패 (session={session_id})")
+            traceback.print_exc()
+            await emit("error", {"detail": "요청을 처리하는 중 오류가 발생했습니다. 잠시 후 다시 시도해 주세요."})
+        finally:
+            await queue.put(None)
+
+    async def event_stream():
+        task = asyncio.create_task(run_turn())
+        _inflight_turns.add(task)
+        task.add_done_callback(_inflight_turns.discard)
+
+        yield _sse("ack", {"session_id": session_id})
+        while (item := await queue.get()) is not None:
+            yield _sse(*item)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -22,3 +92,12 @@ def get_session(session_id: str) -> dict:
     if not session:
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
     return session.model_dump()
+
+
+@router.get("/sessions/{session_id}/audit")
+def get_session_audit(session_id: str, after_seq: int = 0, limit: int = 100) -> dict:
+    """전체 감사 로그를 seq 순으로 페이지 조회 (세션 문서에는 최근 이벤트만 남아 있음)"""
+    if not _orchestrator.session_store.get(session_id):
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+    events = _orchestrator.session_store.list_audit(session_id, after_seq, min(limit, 500))
+    return {"session_id": session_id, "events": events}
@@ -1,5 +1,7 @@
 import uuid
 from fastapi import APIRouter, HTTPException
+from ..core.config import get_settings
+from ..core.shared_state import get_shared_state
 from ..schemas.api_models import ChatRequest, ChatResponse, NextQuestion, SuggestedAction
 from ..schemas.audit import AuditEvent
 from ..schemas.task import TaskNode
@@ -7,11 +9,13 @@ from ..schemas.service import ServiceCard
 from ..tools.create_draft import create_application_draft
 
 router = APIRouter()
-_turn_store: dict[str, int] = {}
 
 
-def _get_turn(session_id: str) -> int:
-    return _turn_store.get(session_id, 0)
+def _next_turn(session_id: str) -> int:
+    """워커 간 공유 카운터 — 마지막 턴 이후 chat_mock_turn_ttl_seconds가 지나면 만료"""
+    return get_shared_state().incr(
+        f"chat_mock:turn:{session_id}", ttl_seconds=get_settings().chat_mock_turn_ttl_seconds
+    )
 
 
 @router.post("/chat-mock", response_model=ChatResponse)
@@ -20,8 +24,7 @@ def chat_mock(request: ChatRequest) -> ChatResponse:
         raise HTTPException(status_code=400, detail="메시지를 입력해 주세요.")
 
     session_id = request.session_id.strip() or str(uuid.uuid4())
-    turn = _get_turn(session_id) + 1
-    _turn_store[session_id] = turn
+    turn = _next_turn(session_id)
     message = request.user_message
 
     if turn == 1:
@@ -102,6 +105,7 @@ def chat_mock(request: ChatRequest) -> ChatResponse:
                 "household_type": "family",
                 "is_rental": None,
             },
+            session_id=session_id,
         )
         return ChatResponse(
             session_id=session_id,
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 from ..core.config import get_settings, _ENV_PATH
+from ..core.llm_cache import get_llm_cache
 
 router = APIRouter()
 
@@ -7,9 +8,11 @@ router = APIRouter()
 @router.get("/health")
 def health() -> dict:
     settings = get_settings()
+    cache = get_llm_cache()
     return {
         "status": "ok",
         "model": settings.openai_model,
         "env_path": str(_ENV_PATH),
         "env_exists": _ENV_PATH.exists(),
+        "llm_cache": cache.stats() if cache else None,
     }
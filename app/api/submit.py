@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from pydantic import BaseModel
 from fastapi import APIRouter, HTTPException
-from ..tools.create_draft import _draft_store
+from ..db.draft_repository import get_draft_repository
 
 router = APIRouter()
 
@@ -14,17 +14,22 @@ class SubmitRequest(BaseModel):
 
 @router.post("/submit/{draft_id}")
 def submit_draft(draft_id: str, request: SubmitRequest) -> dict:
-    draft = _draft_store.get(draft_id)
+    repository = get_draft_repository()
+    # 다른 워커가 상태를 바꿨을 수 있으므로 캐시가 아닌 DB에서 읽는다
+    draft = repository.get(draft_id, fresh=True)
     if not draft:
         raise HTTPException(status_code=404, detail="초안을 찾을 수 없습니다")
 
     if draft.get("status") == "submitted":
         raise HTTPException(status_code=409, detail="이미 제출된 초안입니다")
 
+    previous_status = draft["status"]
     if not request.confirmed:
         draft["status"] = "cancelled"
         draft["session_id"] = request.session_id
         draft["cancelled_at"] = datetime.now(timezone.utc).isoformat()
+        if not repository.update(draft, expected_status=previous_status):
+            raise HTTPException(status_code=409, detail="다른 요청이 이미 처리한 초안입니다")
         return {
             "draft_id": draft_id,
             "status": "cancelled",
@@ -37,6 +42,8 @@ def submit_draft(draft_id: str, request: SubmitRequest) -> dict:
     draft["submitted_at"] = datetime.now(timezone.utc).isoformat()
     if request.sensitive_fields:
         draft["preview"].update(request.sensitive_fields)
+    if not repository.update(draft, expected_status=previous_status):
+        raise HTTPException(status_code=409, detail="이미 제출된 초안입니다")
 
     return {
         "draft_id": draft_id,
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, HTTPException
+from ..core.config import get_settings
+from ..core.context_builder import CONTEXT_LEDGER
+from ..core.llm_scheduler import get_llm_scheduler
+from ..core.llm_usage import LEDGER
+
+router = APIRouter()
+
+
+@router.get("/usage")
+def get_usage() -> dict:
+    """이 워커의 LLM 사용량 (전체 + 에이전트별 토큰·지연·재시도·추정 비용) + 스케줄러 현재 상태
+    + 에이전트별 컨텍스트 압축 전/후 추정 토큰
+    """
+    return {
+        **LEDGER.summary(),
+        "context": CONTEXT_LEDGER.summary(),
+        "session_token_budget": get_settings().session_token_budget,
+        "scheduler": get_llm_scheduler().stats(),
+    }
+
+
+@router.get("/usage/sessions/{session_id}")
+def get_session_usage(session_id: str) -> dict:
+    summary = LEDGER.session_summary(session_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="해당 세션의 LLM 사용 기록이 없습니다.")
+    budget = get_settings().session_token_budget
+    summary["token_budget"] = budget
+    summary["budget_remaining"] = max(budget - summary["total"]["total_tokens"], 0) if budget else None
+    return summary
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 from pydantic_settings import BaseSettings
 
 # 이 파일 기준으로 프로젝트 루트의 .env 절대 경로
@@ -12,6 +13,66 @@ class Settings(BaseSettings):
     profile_min_fields: int = 3
     mock_mode: bool = False  # True 시 LLM 호출 없이 목데이터 반환
 
+    # LLM 응답 캐시 (generate_structured)
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_seconds: int = 86400
+    llm_cache_memory_entries: int = 1024
+    llm_cache_disk_entries: int = 50_000
+    llm_cache_path: str = ""  # 빈 값이면 프로젝트 루트의 llm_cache.db
+
+    # LLM 호출 스케줄러 — 프로바이더 한도에 맞춘 분당 요청/토큰, 동시 호출 상한 (0이면 제한 없음)
+    llm_rpm_limit: int = 500
+    llm_tpm_limit: int = 200_000
+    llm_max_concurrency: int = 16
+    llm_backoff_base_s: float = 1.0
+    llm_backoff_max_s: float = 30.0
+    # 동일 호출 합치기 — 합류한 호출자가 결과를 기다리는 최대 초 (0이면 무제한)
+    llm_single_flight_timeout_s: float = 60.0
+    # 에이전트 user 메시지 토큰 예산(추정, 0이면 무제한) — 넘으면 우선순위 낮은 목록 항목부터 뺀다
+    llm_context_budget_tokens: int = 2000
+    llm_context_log: bool = False  # 호출마다 압축 전/후 토큰 수 출력
+
+    # LLM 호출 회계 — 추정 비용 단가(USD / 1M 토큰)와 세션별 토큰 예산(0이면 무제한)
+    llm_price_input_per_1m: float = 0.15
+    llm_price_output_per_1m: float = 0.60
+    session_token_budget: int = 0
+
+    # 프로필 시그니처 기반 계획(task_graph + service_cards) 재사용
+    plan_store_enabled: bool = True
+    plan_store_path: str = ""  # 빈 값이면 프로젝트 루트의 plans.db
+    plan_warm_path: str = ""  # plan_bulk.py 결과(NDJSON) — 지정 시 시작할 때 메모리에 미리 적재
+
+    # Decomposition은 규칙 테이블 우선, 규칙이 다루지 않는 필드가 있을 때만 LLM
+    decomposition_rules_enabled: bool = True
+    # 첫 턴 의도 분류: 로컬 분류 신뢰도가 임계값 이상이면 Triage LLM 호출 생략
+    triage_local_enabled: bool = True
+    triage_local_threshold: float = 0.9
+    # Evidence 카드는 SERVICES_DB에서 바로 생성, 맞춤 추천 이유만 응답 후 백그라운드 LLM으로 보강
+    evidence_catalog_enabled: bool = True
+    evidence_reasons_enabled: bool = True
+
+    # 세션 저장: write_through(턴마다 동기 기록) | write_behind(메모리 캐시 + 주기적 일괄 기록, 단일 워커 전용)
+    session_db_path: str = ""  # 빈 값이면 프로젝트 루트의 sessions.db
+    session_write_mode: Literal["write_through", "write_behind"] = "write_through"
+    session_flush_interval_ms: int = 200
+    session_cache_size: int = 1024
+    audit_tail_size: int = 20  # 세션 문서에 남길 최근 감사 이벤트 수 (전체는 audit_events 테이블)
+
+    # 워커 간 공유 상태: memory(단일 프로세스) | sqlite(같은 호스트의 여러 워커가 파일 DB로 공유)
+    shared_state_backend: Literal["memory", "sqlite"] = "memory"
+    shared_state_path: str = ""  # 빈 값이면 프로젝트 루트의 shared_state.db
+    session_lease_ttl_seconds: int = 120  # 턴 처리 중 세션 lease 유지 시간 (워커 비정상 종료 대비)
+    session_lease_wait_seconds: int = 30  # 같은 세션의 앞선 턴을 기다리는 최대 시간
+    chat_mock_turn_ttl_seconds: int = 86400
+
+    # span을 JSON Lines로 내보낼 파일 (빈 값이면 /metrics 히스토그램만 기록)
+    trace_export_path: str = ""
+
+    # 신청서 초안 저장소 (drafts.db, 워커 간 공유)
+    draft_db_path: str = ""  # 빈 값이면 프로젝트 루트의 drafts.db
+    draft_ttl_seconds: int = 7 * 86400
+    draft_cache_entries: int = 256
+
     class Config:
         env_file = str(_ENV_PATH)
         env_file_encoding = "utf-8"
@@ -0,0 +1,151 @@
+"""에이전트 user 메시지 컨텍스트 — 필요한 필드만, 기본값 제거, 압축 JSON, 토큰 예산
+
+에이전트는 _build_content에서 섹션을 add()하고 build()로 본문을 만든다.
+- 값은 compact()로 None·"unknown"·빈 값을 뺀 뒤 공백 없는 JSON으로 직렬화한다
+  (필드 선택은 호출자가 project()/model_dump(include=..., exclude_defaults=True)로 한다).
+- 예산을 넘으면 priority가 낮은 리스트 섹션의 뒤쪽 항목부터 뺀다 (섹션마다 최소 1개는 남김).
+  priority가 없는 섹션은 자르지 않으므로 예산을 넘은 채로 보낼 수도 있다.
+- 호출마다 원래 방식(객체 전체 json.dumps)과 최종 본문의 추정 토큰 수를 기록한다.
+"""
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+from .config import get_settings
+from .llm_scheduler import approx_tokens
+from .metrics import REGISTRY
+
+CONTEXT_TOKENS = REGISTRY.counter(
+    "move_llm_context_tokens_total", "에이전트 user 메시지 추정 토큰 수 (stage: before=전체 덤프, after=압축)",
+    ("agent", "stage"),
+)
+CONTEXT_TRUNCATED = REGISTRY.counter(
+    "move_llm_context_truncated_total", "토큰 예산 초과로 뺀 리스트 항목 수", ("agent", "section")
+)
+
+_EMPTY = (None, "unknown", "", [], {})
+
+
+def compact(value: Any) -> Any:
+    """dict·list를 재귀적으로 돌며 None·"unknown"·빈 문자열·빈 컨테이너를 뺀다"""
+    if isinstance(value, dict):
+        out = {}
+        for key, item in value.items():
+            item = compact(item)
+            if not _is_empty(item):
+                out[key] = item
+        return out
+    if isinstance(value, list):
+        return [item for item in map(compact, value) if not _is_empty(item)]
+    return value
+
+
+def _is_empty(value: Any) -> bool:
+    # False/0은 의미 있는 값이므로 == 비교 대신 타입별로 판정
+    return value is None or (isinstance(value, (str, list, dict)) and value in _EMPTY)
+
+
+def project(record: dict, fields: tuple[str, ...]) -> dict:
+    return {name: record[name] for name in fields if name in record}
+
+
+def encode(value: Any) -> str:
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _encode_full(value: Any) -> str:
+    """기존 방식의 직렬화 (before 토큰 수 계산용)"""
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+
+
+@dataclass
+class _Section:
+    name: str
+    value: Any
+    raw: Any
+    priority: int | None
+
+
+@dataclass(frozen=True)
+class BuiltContext:
+    text: str
+    tokens_before: int
+    tokens_after: int
+    dropped: dict[str, int] = field(default_factory=dict)  # 섹션 → 뺀 항목 수
+
+
+class ContextBuilder:
+    def __init__(self, agent: str, budget_tokens: int | None = None):
+        self.agent = agent
+        self.budget_tokens = get_settings().llm_context_budget_tokens if budget_tokens is None else budget_tokens
+        self._sections: list[_Section] = []
+
+    def add(self, name: str, value: Any, raw: Any = None, priority: int | None = None) -> "ContextBuilder":
+        """raw: 기존 방식으로 보냈을 값 (없으면 value), priority: 작을수록 먼저 잘림 (리스트 값만)"""
+        self._sections.append(_Section(name, compact(value), value if raw is None else raw, priority))
+        return self
+
+    def build(self) -> BuiltContext:
+        before = approx_tokens("\n".join(f"{s.name}: {_encode_full(s.raw)}" for s in self._sections))
+        lines = [f"{s.name}: {encode(s.value)}" for s in self._sections]
+        after = approx_tokens("\n".join(lines))
+        dropped: dict[str, int] = {}
+
+        if self.budget_tokens:
+            trimmable = sorted(
+                (i for i, s in enumerate(self._sections) if s.priority is not None and isinstance(s.value, list)),
+                key=lambda i: self._sections[i].priority,
+            )
+            for i in trimmable:
+                section = self._sections[i]
+                while after > self.budget_tokens and len(section.value) > 1:
+                    section.value.pop()
+                    dropped[section.name] = dropped.get(section.name, 0) + 1
+                    lines[i] = f"{section.name}: {encode(section.value)}"
+                    after = approx_tokens("\n".join(lines))
+
+        built = BuiltContext("\n".join(lines), before, after, dropped)
+        _record(self.agent, built)
+        return built
+
+
+class _ContextLedger:
+    """에이전트별 누적 (GET /usage의 context 항목)"""
+
+    def __init__(self):
+        self._by_agent: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent: str, built: BuiltContext) -> None:
+        with self._lock:
+            totals = self._by_agent.setdefault(
+                agent, {"calls": 0, "tokens_before": 0, "tokens_after": 0, "truncated_items": 0}
+            )
+            totals["calls"] += 1
+            totals["tokens_before"] += built.tokens_before
+            totals["tokens_after"] += built.tokens_after
+            totals["truncated_items"] += sum(built.dropped.values())
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                agent: {
+                    **t,
+                    "saved_ratio": round(1 - t["tokens_after"] / t["tokens_before"], 3) if t["tokens_before"] else 0.0,
+                }
+                for agent, t in sorted(self._by_agent.items())
+            }
+
+
+CONTEXT_LEDGER = _ContextLedger()
+
+
+def _record(agent: str, built: BuiltContext) -> None:
+    CONTEXT_TOKENS.inc(agent, "before", amount=built.tokens_before)
+    CONTEXT_TOKENS.inc(agent, "after", amount=built.tokens_after)
+    for section, count in built.dropped.items():
+        CONTEXT_TRUNCATED.inc(agent, section, amount=count)
+    CONTEXT_LEDGER.record(agent, built)
+    if get_settings().llm_context_log:
+        truncated = f" (잘림: {', '.join(f'{k} {v}개' for k, v in built.dropped.items())})" if built.dropped else ""
+        print(f"[Context] {agent} {built.tokens_before} → {built.tokens_after} tokens{truncated}")
@@ -0,0 +1,227 @@
+"""generate_structured 응답 캐시 — 프로세스 내 LRU + SQLite 디스크 2단 구성
+
+디스크 계층은 스레드별 연결 풀(SQLitePool)을 쓴다. async 경로(get_async/set_async)는
+메모리 계층만 이벤트 루프에서 확인하고, 디스크 조회는 스레드에서, 디스크 기록은
+백그라운드 스레드에서 해 턴 처리 루프를 막지 않는다.
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from .config import get_settings
+from .response_schemas import get_response_schema
+from ..db.sqlite_pool import SQLitePool
+
+_DEFAULT_PATH = Path(__file__).resolve().parent.parent.parent / "llm_cache.db"
+
+
+def _schema_fingerprint(response_schema: type) -> str:
+    """스키마 클래스별 strict JSON 스키마 해시 (레지스트리에서 클래스당 1회 계산)"""
+    return get_response_schema(response_schema).fingerprint
+
+
+def make_cache_key(
+    model: str,
+    system_prompt: str,
+    user_content: str,
+    response_schema: type,
+    temperature: float,
+) -> str:
+    parts = [
+        model,
+        hashlib.sha256(system_prompt.encode()).hexdigest(),
+        user_content,
+        _schema_fingerprint(response_schema),
+        round(temperature, 4),
+    ]
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode()).hexdigest()
+
+
+class LLMCache:
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        ttl_seconds: int = 86400,
+        max_memory_entries: int = 1024,
+        max_disk_entries: int = 50_000,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()  # key → (expires_at, json)
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "sets": 0, "evictions": 0}
+        self._pool = SQLitePool(self.db_path) if self.db_path else None
+        self._background: set[asyncio.Task] = set()  # set_async의 디스크 기록 태스크 참조 유지
+        if self.db_path:
+            self._ensure_table()
+
+    def _connect(self) -> sqlite3.Connection:
+        return self._pool.connection()
+
+    def _ensure_table(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+
+    def get(self, key: str) -> dict | None:
+        now = time.time()
+        value = self._get_memory(key, now)
+        if value is None and self.db_path:
+            value = self._get_disk(key, now)
+        return self._finish_get(value)
+
+    async def get_async(self, key: str) -> dict | None:
+        """메모리는 바로, 디스크 조회는 스레드에서"""
+        now = time.time()
+        value = self._get_memory(key, now)
+        if value is None and self.db_path:
+            value = await asyncio.to_thread(self._get_disk, key, now)
+        return self._finish_get(value)
+
+    def _get_memory(self, key: str, now: float) -> str | None:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                self._stats["evictions"] += 1
+        return None
+
+    def _get_disk(self, key: str, now: float) -> str | None:
+        row = self._connect().execute(
+            "SELECT value, expires_at FROM llm_cache WHERE cache_key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+        if not row:
+            return None
+        with self._lock:
+            self._stats["disk_hits"] += 1
+            self._remember(key, row[1], row[0])
+        return row[0]
+
+    def _finish_get(self, value: str | None) -> dict | None:
+        if value is not None:
+            return json.loads(value)
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: dict) -> None:
+        entry = self._set_memory(key, value)
+        if self.db_path:
+            self._set_disk(*entry)
+
+    def set_async(self, key: str, value: dict) -> None:
+        """메모리는 바로 갱신하고 디스크 기록은 백그라운드 스레드로 (이벤트 루프 안에서 호출)"""
+        entry = self._set_memory(key, value)
+        if self.db_path:
+            task = asyncio.get_running_loop().create_task(asyncio.to_thread(self._set_disk, *entry))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    def _set_memory(self, key: str, value: dict) -> tuple[str, str, float, float, bool]:
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._stats["sets"] += 1
+            self._remember(key, expires_at, data)
+            self._writes_since_prune += 1
+            prune = self._writes_since_prune >= 100
+            if prune:
+                self._writes_since_prune = 0
+        return key, data, now, expires_at, prune
+
+    def _set_disk(self, key: str, data: str, now: float, expires_at: float, prune: bool) -> None:
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_cache (cache_key, value, created_at, expires_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (key, data, now, expires_at),
+                )
+                if prune:
+                    self._prune_disk(conn, now)
+        except sqlite3.Error as e:
+            # 디스크 계층 실패는 캐시 미스와 같다 — 메모리 계층과 응답에는 영향 없음
+            print(f"[LLM Cache] 디스크 기록 실패: {e}")
+
+    def _remember(self, key: str, expires_at: float, data: str) -> None:
+        """메모리 LRU에 적재 (lock 보유 상태에서 호출)"""
+        self._memory[key] = (expires_at, data)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _prune_disk(self, conn: sqlite3.Connection, now: float) -> None:
+        """만료 항목 삭제 후 상한을 넘으면 오래된 순으로 정리"""
+        deleted = conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,)).rowcount
+        (count,) = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        overflow = count - self.max_disk_entries
+        if overflow > 0:
+            deleted += conn.execute(
+                """
+                DELETE FROM llm_cache WHERE cache_key IN (
+                    SELECT cache_key FROM llm_cache ORDER BY created_at LIMIT ?
+                )
+                """,
+                (overflow,),
+            ).rowcount
+        with self._lock:
+            self._stats["evictions"] += deleted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_cache")
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+_cache: LLMCache | None = None
+
+
+def get_llm_cache() -> LLMCache | None:
+    """설정에서 비활성화된 경우 None"""
+    global _cache
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = LLMCache(
+            db_path=Path(settings.llm_cache_path) if settings.llm_cache_path else _DEFAULT_PATH,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_memory_entries=settings.llm_cache_memory_entries,
+            max_disk_entries=settings.llm_cache_disk_entries,
+        )
+    return _cache
@@ -0,0 +1,274 @@
+"""LLM 호출 스케줄러 — 분당 요청/토큰 버킷, 동시 호출 상한, 우선순위, 429 공동 대기
+
+프로세스 전역 1개를 모든 호출(sync/async, 어느 이벤트 루프든)이 공유하도록
+threading.Lock과 대기자별 깨우기 신호로 구현한다. 입장을 시도하는 것은 큐의 맨 앞 대기자뿐이고,
+나머지는 슬롯 반납·앞 대기자 입장 때 깨워질 때까지 잠든다. 맨 앞 대기자만 버킷 충전·cooldown
+시간만큼 타이머로 기다린다. async 호출은 스레드를 점유하지 않고 기다린다.
+
+- interactive(사용자 턴)가 기다리는 동안 background(사전 계획 등)는 입장하지 않는다.
+- 같은 우선순위 안에서는 도착 순서(FIFO)로 입장한다.
+- 429를 받으면 cooldown 동안 모든 신규 입장을 멈춰 동시 요청이 한꺼번에 재시도하지 않게 한다.
+"""
+import asyncio
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from .config import get_settings
+
+PRIORITIES = {"interactive": 0, "background": 1}
+
+# 깨우기 신호를 놓쳤을 때를 대비한 최대 대기 간격 (정상 동작은 신호로 깨어난다)
+_MAX_SLEEP_SECONDS = 1.0
+
+_priority: ContextVar[str] = ContextVar("llm_priority", default="interactive")
+
+
+@contextmanager
+def llm_priority(name: str):
+    """이 블록 안의 LLM 호출 우선순위 ('interactive' | 'background')"""
+    if name not in PRIORITIES:
+        raise ValueError(f"알 수 없는 우선순위: {name}")
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class TokenBucket:
+    """분당 rate_per_min만큼 연속 충전되는 버킷 (용량 = 1분 분량). rate 0이면 무제한."""
+
+    def __init__(self, rate_per_min: float):
+        self.rate = rate_per_min / 60.0
+        self.capacity = float(rate_per_min)
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount를 꺼낼 수 있을 때까지 남은 초 (lock 보유 상태에서 호출)"""
+        if not self.rate:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)  # 1분 용량보다 큰 요청도 언젠가는 입장
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        if self.rate:
+            self.level -= min(amount, self.capacity)
+
+    def adjust(self, delta: float) -> None:
+        """실제 사용량과 추정치의 차이 반영 (음수면 환급)"""
+        if self.rate:
+            self.level = min(self.capacity, self.level - delta)
+
+
+class Permit:
+    """입장권 — 응답을 받으면 settle()로 실제 토큰 수를 반영한다"""
+
+    def __init__(self, scheduler: "LLMScheduler", estimated_tokens: int, queued_s: float):
+        self._scheduler = scheduler
+        self.estimated_tokens = estimated_tokens
+        self.queued_s = queued_s
+
+    def settle(self, actual_tokens: int) -> None:
+        self._scheduler._settle(actual_tokens - self.estimated_tokens)
+        self.estimated_tokens = actual_tokens
+
+
+class _Waiter:
+    """대기자 1명의 깨우기 신호 — 다른 스레드·이벤트 루프에서 set()해도 된다"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None):
+        self._loop = loop
+        self._event = asyncio.Event() if loop is not None else threading.Event()
+
+    def set(self) -> None:
+        if self._loop is None:
+            self._event.set()
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            pass  # 루프가 이미 닫힘
+
+    async def wait_async(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._event.clear()
+
+    def wait_sync(self, timeout: float) -> None:
+        self._event.wait(timeout)
+        self._event.clear()
+
+
+class LLMScheduler:
+    def __init__(self, rpm: int = 0, tpm: int = 0, max_concurrency: int = 0):
+        self.max_concurrency = max_concurrency
+        self._requests = TokenBucket(rpm)
+        self._tokens = TokenBucket(tpm)
+        self._active = 0
+        self._cooldown_until = 0.0
+        self._waiting: list[tuple[int, int]] = []  # (priority, ticket) heap
+        self._waiters: dict[tuple[int, int], _Waiter] = {}
+        self._tickets = itertools.count()
+        self._lock = threading.Lock()
+
+    def _try_admit(self, entry: tuple[int, int], tokens: int) -> float | None:
+        """입장하면 0, 시간이 지나면 입장 가능하면 남은 초, 깨워질 때까지 기다려야 하면 None
+        (lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        if self._waiting[0] != entry:
+            return None  # 앞선(또는 우선순위가 높은) 대기자가 있음
+        if now < self._cooldown_until:
+            return self._cooldown_until - now
+        if self.max_concurrency and self._active >= self.max_concurrency:
+            return None  # 슬롯 반납 때 깨워짐
+        wait = max(self._requests.wait_time(1, now), self._tokens.wait_time(tokens, now))
+        if wait > 0:
+            return wait
+        self._requests.take(1)
+        self._tokens.take(tokens)
+        self._active += 1
+        heapq.heappop(self._waiting)
+        del self._waiters[entry]
+        self._wake_head()
+        return 0.0
+
+    def _wake_head(self) -> None:
+        """맨 앞 대기자에게 입장 조건을 다시 확인하게 한다 (lock 보유 상태에서 호출)"""
+        if self._waiting:
+            self._waiters[self._waiting[0]].set()
+
+    def _enqueue(self, waiter: _Waiter) -> tuple[int, int]:
+        entry = (PRIORITIES[_priority.get()], next(self._tickets))
+        with self._lock:
+            heapq.heappush(self._waiting, entry)
+            self._waiters[entry] = waiter
+        return entry
+
+    def _abandon(self, entry: tuple[int, int]) -> None:
+        with self._lock:
+            if entry in self._waiters:
+                was_head = self._waiting[0] == entry
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                del self._waiters[entry]
+                if was_head:
+                    self._wake_head()
+
+    def _release(self) -> None:
+        with self._lock:
+            self._active -= 1
+            self._wake_head()
+
+    def _settle(self, delta_tokens: int) -> None:
+        with self._lock:
+            self._tokens.adjust(delta_tokens)
+            if delta_tokens < 0:
+                self._wake_head()  # 환급으로 버킷 대기가 줄었을 수 있음
+
+    def cooldown(self, seconds: float) -> None:
+        """429 수신 시 모든 신규 입장을 seconds 동안 멈춘다"""
+        with self._lock:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + seconds)
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int):
+        t0 = time.monotonic()
+        waiter = _Waiter(asyncio.get_running_loop())
+        entry = self._enqueue(waiter)
+        try:
+            while True:
+                with self._lock:
+                    wait = self._try_admit(entry, estimated_tokens)
+                if wait == 0:
+                    break
+                await waiter.wait_async(_MAX_SLEEP_SECONDS if wait is None else min(wait, _MAX_SLEEP_SECONDS))
+        except BaseException:
+            self._abandon(entry)
+            raise
+        try:
+            yield Permit(self, estimated_tokens, time.monotonic() - t0)
+        finally:
+            self._release()
+
+    @contextmanager
+    def slot_sync(self, estimated_tokens: int):
+        """slot()의 동기 버전 — 이벤트 루프 밖(스크립트, 스레드)에서만 사용"""
+        t0 = time.monotonic()
+        waiter = _Waiter()
+        entry = self._enqueue(waiter)
+        try:
+            while True:
+                with self._lock:
+                    wait = self._try_admit(entry, estimated_tokens)
+                if wait == 0:
+                    break
+                waiter.wait_sync(_MAX_SLEEP_SECONDS if wait is None else min(wait, _MAX_SLEEP_SECONDS))
+        except BaseException:
+            self._abandon(entry)
+            raise
+        try:
+            yield Permit(self, estimated_tokens, time.monotonic() - t0)
+        finally:
+            self._release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "active": self._active,
+                "waiting": len(self._waiting),
+                "cooldown_s": round(max(0.0, self._cooldown_until - now), 3),
+            }
+
+
+def backoff_seconds(attempt: int, hint_s: float | None = None) -> float:
+    """재시도 대기 — 서버 힌트가 있으면 그 이상, 없으면 지수 증가 + equal jitter"""
+    settings = get_settings()
+    if hint_s is not None:
+        return hint_s + random.uniform(0, settings.llm_backoff_base_s)
+    ceiling = min(settings.llm_backoff_max_s, settings.llm_backoff_base_s * 2 ** attempt)
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def approx_tokens(text: str) -> int:
+    """토크나이저 없이 쓰는 추정 — 한글 위주 텍스트는 대략 2자당 1토큰"""
+    return len(text) // 2
+
+
+def estimate_tokens(system_prompt: str, user_content: str, max_tokens: int) -> int:
+    """TPM 버킷용 사전 추정 — 입력은 approx_tokens, 응답은 max_tokens의 1/4로 잡는다"""
+    return approx_tokens(system_prompt) + approx_tokens(user_content) + max_tokens // 4
+
+
+_scheduler: LLMScheduler | None = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    global _scheduler
+    if _scheduler is None:
+        settings = get_settings()
+        _scheduler = LLMScheduler(
+            rpm=settings.llm_rpm_limit,
+            tpm=settings.llm_tpm_limit,
+            max_concurrency=settings.llm_max_concurrency,
+        )
+    return _scheduler
+
+
+def configure_llm_scheduler(rpm: int, tpm: int, max_concurrency: int) -> LLMScheduler:
+    """이 프로세스의 스케줄러 한도를 설정값 대신 지정한다 (여러 프로세스가 한도를 나눠 쓸 때)"""
+    global _scheduler
+    _scheduler = LLMScheduler(rpm=rpm, tpm=tpm, max_concurrency=max_concurrency)
+    return _scheduler
@@ -0,0 +1,216 @@
+"""LLM 호출 회계 — 토큰·재시도·대기·파싱 실패·추정 비용을 에이전트/세션/전체 단위로 집계
+
+세션은 contextvar(usage_scope)로 전달되므로 에이전트 코드는 세션을 몰라도 된다.
+값은 프로세스별 메모리 집계이며, 세션 집계는 최근 세션 max_sessions개만 유지한다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from .config import get_settings
+from .metrics import REGISTRY
+
+LLM_TOKENS = REGISTRY.counter("move_llm_tokens_total", "LLM 토큰 사용량", ("agent", "type"))
+
+
+@dataclass
+class LLMCallRecord:
+    agent: str
+    schema: str
+    session_id: str | None = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    wall_ms: float = 0.0
+    retries: int = 0
+    wait_s: float = 0.0  # Rate Limit 재시도 대기
+    queue_s: float = 0.0  # 스케줄러 입장 대기 (RPM/TPM/동시성)
+    parse_failures: int = 0
+    cache_hit: bool = False
+    coalesced: bool = False  # 진행 중인 동일 호출에 합류 (토큰은 선두 호출에 집계)
+    error: bool = False
+    budget_exceeded: bool = False
+    cost_usd: float = 0.0
+
+    def add_usage(self, usage) -> None:
+        """completion.usage (없으면 무시)"""
+        if usage is None:
+            return
+        self.prompt_tokens += usage.prompt_tokens or 0
+        self.completion_tokens += usage.completion_tokens or 0
+
+
+def _empty_totals() -> dict:
+    return {
+        "calls": 0, "cache_hits": 0, "coalesced": 0, "errors": 0, "parse_failures": 0, "budget_rejections": 0,
+        "prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0,
+        "retries": 0, "wait_s": 0.0, "queue_s": 0.0, "wall_ms": 0.0, "cost_usd": 0.0,
+    }
+
+
+def _accumulate(totals: dict, record: LLMCallRecord) -> None:
+    totals["calls"] += 1
+    totals["cache_hits"] += record.cache_hit
+    totals["coalesced"] += record.coalesced
+    totals["errors"] += record.error
+    totals["parse_failures"] += record.parse_failures
+    totals["budget_rejections"] += record.budget_exceeded
+    totals["prompt_tokens"] += record.prompt_tokens
+    totals["completion_tokens"] += record.completion_tokens
+    totals["total_tokens"] += record.prompt_tokens + record.completion_tokens
+    totals["retries"] += record.retries
+    totals["wait_s"] += record.wait_s
+    totals["queue_s"] += record.queue_s
+    totals["wall_ms"] += record.wall_ms
+    totals["cost_usd"] += record.cost_usd
+
+
+def _rounded(totals: dict) -> dict:
+    out = dict(totals)
+    out["wait_s"] = round(out["wait_s"], 3)
+    out["queue_s"] = round(out["queue_s"], 3)
+    out["wall_ms"] = round(out["wall_ms"], 1)
+    out["cost_usd"] = round(out["cost_usd"], 6)
+    out["avg_wall_ms"] = round(totals["wall_ms"] / totals["calls"], 1) if totals["calls"] else 0.0
+    return out
+
+
+class UsageLedger:
+    def __init__(self, max_sessions: int = 10_000):
+        self.max_sessions = max_sessions
+        self._global = _empty_totals()
+        self._by_agent: dict[str, dict] = {}
+        self._by_session: OrderedDict[str, dict] = OrderedDict()  # session_id → {"total", "by_agent"}
+        self._lock = threading.Lock()
+
+    def record(self, record: LLMCallRecord) -> None:
+        with self._lock:
+            _accumulate(self._global, record)
+            _accumulate(self._by_agent.setdefault(record.agent, _empty_totals()), record)
+            if record.session_id:
+                self._record_session(record)
+        if record.prompt_tokens:
+            LLM_TOKENS.inc(record.agent, "prompt", amount=record.prompt_tokens)
+        if record.completion_tokens:
+            LLM_TOKENS.inc(record.agent, "completion", amount=record.completion_tokens)
+
+    def record_session(self, record: LLMCallRecord) -> None:
+        """전체·에이전트 집계에 이미 반영된 호출을 세션 집계에만 추가한다"""
+        with self._lock:
+            self._record_session(record)
+
+    def _record_session(self, record: LLMCallRecord) -> None:
+        """lock 보유 상태에서 호출"""
+        entry = self._by_session.get(record.session_id)
+        if entry is None:
+            entry = self._by_session[record.session_id] = {"total": _empty_totals(), "by_agent": {}}
+            while len(self._by_session) > self.max_sessions:
+                self._by_session.popitem(last=False)
+        self._by_session.move_to_end(record.session_id)
+        _accumulate(entry["total"], record)
+        _accumulate(entry["by_agent"].setdefault(record.agent, _empty_totals()), record)
+
+    def session_tokens(self, session_id: str) -> int:
+        with self._lock:
+            entry = self._by_session.get(session_id)
+            return entry["total"]["total_tokens"] if entry else 0
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "total": _rounded(self._global),
+                "by_agent": {agent: _rounded(t) for agent, t in sorted(self._by_agent.items())},
+                "sessions_tracked": len(self._by_session),
+            }
+
+    def session_summary(self, session_id: str) -> dict | None:
+        with self._lock:
+            entry = self._by_session.get(session_id)
+            if entry is None:
+                return None
+            return {
+                "session_id": session_id,
+                "total": _rounded(entry["total"]),
+                "by_agent": {agent: _rounded(t) for agent, t in sorted(entry["by_agent"].items())},
+            }
+
+
+LEDGER = UsageLedger()
+
+
+class UsageScope:
+    """턴 하나의 회계 범위.
+
+    새 세션은 id가 정해지기 전에 LLM 호출(triage)이 끝날 수 있으므로,
+    그동안의 호출은 보관했다가 set_session()에서 세션 집계에 넣는다.
+    """
+
+    def __init__(self, session_id: str | None = None):
+        self.session_id = session_id
+        self._unattributed: list[LLMCallRecord] = []
+        self._lock = threading.Lock()
+
+    def set_session(self, session_id: str) -> None:
+        with self._lock:
+            self.session_id = session_id
+            pending, self._unattributed = self._unattributed, []
+        for record in pending:
+            record.session_id = session_id
+            LEDGER.record_session(record)
+
+    def _record(self, record: LLMCallRecord) -> None:
+        with self._lock:
+            record.session_id = self.session_id
+            if record.session_id is None:
+                self._unattributed.append(record)
+        LEDGER.record(record)
+
+
+_scope: ContextVar[UsageScope | None] = ContextVar("llm_usage_scope", default=None)
+
+
+@contextmanager
+def usage_scope(session_id: str | None = None):
+    """이 블록(과 여기서 만든 태스크·스레드) 안의 LLM 호출을 session_id로 집계한다"""
+    scope = UsageScope(session_id or None)
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+
+
+def current_scope() -> UsageScope | None:
+    return _scope.get()
+
+
+def _estimate_cost(record: LLMCallRecord) -> float:
+    settings = get_settings()
+    return (
+        record.prompt_tokens * settings.llm_price_input_per_1m
+        + record.completion_tokens * settings.llm_price_output_per_1m
+    ) / 1_000_000
+
+
+@contextmanager
+def track_llm_call(agent: str, schema: str):
+    """호출 하나를 LLMCallRecord로 기록한다. 세션 토큰 예산을 넘었으면 budget_exceeded=True로 시작한다."""
+    scope = _scope.get()
+    record = LLMCallRecord(agent=agent, schema=schema, session_id=scope.session_id if scope else None)
+    budget = get_settings().session_token_budget
+    if budget and record.session_id and LEDGER.session_tokens(record.session_id) >= budget:
+        record.budget_exceeded = True
+    t0 = time.perf_counter()
+    try:
+        yield record
+    except BaseException:
+        record.error = True
+        raise
+    finally:
+        record.wall_ms = (time.perf_counter() - t0) * 1000
+        record.cost_usd = _estimate_cost(record)
+        if scope is not None:
+            scope._record(record)
+        else:
+            LEDGER.record(record)
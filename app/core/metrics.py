@@ -0,0 +1,239 @@
+"""지연 히스토그램·카운터와 span 계측 — Prometheus 텍스트 포맷(/metrics) + 선택적 JSON span 내보내기
+
+외부 의존 없이 구현한 최소 레지스트리다. 관측 1회 비용은 perf_counter 2회 + lock 구간의
+bisect 1회 수준이라 운영에서 켜 둔 채로 쓸 수 있다. 값은 프로세스별이며, 여러 워커는
+Prometheus가 워커마다 수집해 합산하는 일반적인 방식을 따른다.
+"""
+import atexit
+import json
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from .config import get_settings
+
+# 초 단위 버킷 — 로컬 stage(수 ms)부터 LLM 호출(수십 초)까지
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value:g}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # labels → [버킷별 개수..., +Inf 개수], 합계
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][idx] += 1
+            series[1][0] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, (list(counts), total[0])) for labels, (counts, total) in self._series.items())
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = _format_labels(self.labelnames, labels, f'le="{bound:g}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            cumulative += counts[-1]
+            inf = _format_labels(self.labelnames, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total:.6f}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: list[Counter | Histogram] = []
+
+    def counter(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, help_text, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Histogram:
+        metric = Histogram(name, help_text, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+TURN_SECONDS = REGISTRY.histogram(
+    "move_turn_duration_seconds", "handle_turn 전체 소요 시간 (outcome: blocked/off_topic/interview/planned/error)",
+    ("outcome",),
+)
+STAGE_SECONDS = REGISTRY.histogram("move_stage_duration_seconds", "턴 처리 stage별 소요 시간", ("stage", "status"))
+TOOL_SECONDS = REGISTRY.histogram("move_tool_call_duration_seconds", "dispatch 툴 호출 소요 시간", ("tool", "status"))
+LLM_SECONDS = REGISTRY.histogram(
+    "move_llm_call_duration_seconds", "generate_structured 호출 소요 시간 (재시도·대기 포함)", ("schema", "status")
+)
+LLM_RETRIES = REGISTRY.counter("move_llm_rate_limit_retries_total", "Rate Limit으로 인한 LLM 재시도 횟수", ("schema",))
+
+_HISTOGRAM_BY_KIND = {"stage": STAGE_SECONDS, "tool": TOOL_SECONDS, "llm": LLM_SECONDS}
+
+# 현재 턴의 trace id — asyncio 태스크/to_thread로 자동 전파된다
+_trace_id: ContextVar[str | None] = ContextVar("trace_id", default=None)
+
+
+class _SpanExporter:
+    """span을 JSON Lines로 파일에 덧붙인다 (버퍼가 차거나 종료 시 기록)"""
+
+    def __init__(self, path: Path, buffer_size: int = 256):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._buffer: list[str] = []
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def export(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) < self.buffer_size:
+                return
+            lines, self._buffer = self._buffer, []
+        self._write(lines)
+
+    def flush(self) -> None:
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+        if lines:
+            self._write(lines)
+
+    def _write(self, lines: list[str]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+_exporter: _SpanExporter | None = None
+_exporter_checked = False
+
+
+def _get_exporter() -> _SpanExporter | None:
+    global _exporter, _exporter_checked
+    if not _exporter_checked:
+        path = get_settings().trace_export_path
+        _exporter = _SpanExporter(Path(path)) if path else None
+        _exporter_checked = True
+    return _exporter
+
+
+def record_span(kind: str, name: str, duration_s: float, status: str = "ok", **attrs) -> None:
+    """히스토그램에 기록하고, span 내보내기가 켜져 있으면 파일에도 남긴다"""
+    if kind == "turn":
+        TURN_SECONDS.observe(duration_s, status)
+    else:
+        _HISTOGRAM_BY_KIND[kind].observe(duration_s, name, status)
+    exporter = _get_exporter()
+    if exporter is not None:
+        exporter.export({
+            "trace_id": _trace_id.get(),
+            "kind": kind,
+            "name": name,
+            "status": status,
+            "start": round(time.time() - duration_s, 6),
+            "duration_ms": round(duration_s * 1000, 3),
+            **attrs,
+        })
+
+
+class Span:
+    """with 블록 안에서 status·속성을 바꿀 수 있는 span 핸들"""
+    __slots__ = ("status", "attrs")
+
+    def __init__(self, attrs: dict):
+        self.status = "ok"
+        self.attrs = attrs
+
+
+@contextmanager
+def span(name: str, kind: str = "stage", **attrs):
+    """구간 소요 시간을 kind별 히스토그램에 기록한다 (예외 시 status="error")"""
+    handle = Span(attrs)
+    t0 = time.perf_counter()
+    try:
+        yield handle
+    except BaseException:
+        handle.status = "error"
+        raise
+    finally:
+        record_span(kind, name, time.perf_counter() - t0, handle.status, **handle.attrs)
+
+
+@contextmanager
+def trace(name: str = "handle_turn", **attrs):
+    """턴 하나를 새 trace로 묶는다 — 안에서 생긴 span은 같은 trace_id로 내보내진다.
+
+    yield된 Span의 status에 턴 결과(outcome)를 적는다.
+    """
+    token = _trace_id.set(uuid.uuid4().hex[:16])
+    try:
+        with span(name, kind="turn", **attrs) as handle:
+            yield handle
+    finally:
+        _trace_id.reset(token)
+
+
+def flush_spans() -> None:
+    exporter = _get_exporter()
+    if exporter is not None:
+        exporter.flush()
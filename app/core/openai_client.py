@@ -1,11 +1,21 @@
 import json
-import time
 import re
-from openai import OpenAI
-from pydantic import BaseModel
+from contextlib import contextmanager
+from openai import OpenAI, AsyncOpenAI, LengthFinishReasonError, ContentFilterFinishReasonError
+from pydantic import BaseModel, ValidationError
 from .config import get_settings
+from .llm_cache import get_llm_cache, make_cache_key
+from .llm_scheduler import LLMScheduler, backoff_seconds, estimate_tokens, get_llm_scheduler
+from .llm_usage import LLMCallRecord, track_llm_call
+from .metrics import LLM_RETRIES, span
+from .response_schemas import ResponseSchema, get_response_schema
+
+# 응답은 왔지만 스키마로 파싱하지 못한 경우 (재시도하지 않음)
+_PARSE_ERRORS = (ValidationError, LengthFinishReasonError, ContentFilterFinishReasonError)
+_MAX_ATTEMPTS = 3
 
 _client: OpenAI | None = None
+_async_client: AsyncOpenAI | None = None
 
 
 def get_client() -> OpenAI:
@@ -16,38 +26,243 @@ def get_client() -> OpenAI:
     return _client
 
 
+def get_async_client() -> AsyncOpenAI:
+    global _async_client
+    if _async_client is None:
+        settings = get_settings()
+        _async_client = AsyncOpenAI(api_key=settings.openai_api_key)
+    return _async_client
+
+
+def _build_request(
+    system_prompt: str,
+    user_content: str,
+    schema: ResponseSchema,
+    temperature: float,
+) -> dict:
+    """sync/async 공통 chat.completions 호출 인자 (미리 만든 strict response_format, 없으면 모델 자체)"""
+    return {
+        "model": get_settings().openai_model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content},
+        ],
+        "response_format": schema.response_format or schema.model,
+        "temperature": temperature,
+        "max_tokens": 4096,
+    }
+
+
+def _completions(client: OpenAI | AsyncOpenAI, schema: ResponseSchema):
+    """호출할 SDK 메서드 — strict 스키마를 미리 만들지 못했으면 SDK parse()로 대신한다"""
+    if schema.response_format is None:
+        return client.beta.chat.completions.parse
+    return client.chat.completions.create
+
+
+def _rate_limit_wait(err: str, attempt: int) -> float | None:
+    """Rate Limit 에러면 jitter를 더한 대기 초를 반환, 아니면 None"""
+    if "429" in err or "rate_limit" in err.lower():
+        m = re.search(r"(\d+(?:\.\d+)?)s", err)
+        return backoff_seconds(attempt, float(m.group(1)) if m else None)
+    return None
+
+
+def _parse_completion(completion, schema: ResponseSchema) -> dict:
+    """SDK parse()와 같은 규칙으로 응답을 검증한다 (거절·빈 응답은 {})"""
+    choice = completion.choices[0]
+    if choice.finish_reason == "length":
+        raise LengthFinishReasonError(completion=completion)
+    if choice.finish_reason == "content_filter":
+        raise ContentFilterFinishReasonError(completion=completion)
+    message = choice.message
+    if message.refusal or not message.content:
+        return {}
+    parsed = getattr(message, "parsed", None)
+    if parsed is not None:
+        return parsed.model_dump()
+    return schema.parse(message.content)
+
+
+def _cache_key(request: dict, system_prompt: str, user_content: str, schema: ResponseSchema) -> str:
+    return make_cache_key(
+        request["model"], system_prompt, user_content, schema.model, request["temperature"],
+    )
+
+
+def _cache_lookup(
+    request: dict, system_prompt: str, user_content: str, schema: ResponseSchema
+) -> tuple[str | None, dict | None]:
+    """(캐시 키, 캐시된 응답) — 캐시 비활성 시 (None, None)"""
+    cache = get_llm_cache()
+    if cache is None:
+        return None, None
+    key = _cache_key(request, system_prompt, user_content, schema)
+    return key, cache.get(key)
+
+
+async def _cache_lookup_async(
+    request: dict, system_prompt: str, user_content: str, schema: ResponseSchema
+) -> tuple[str | None, dict | None]:
+    """_cache_lookup과 같되 디스크 계층은 스레드에서 조회"""
+    cache = get_llm_cache()
+    if cache is None:
+        return None, None
+    key = _cache_key(request, system_prompt, user_content, schema)
+    return key, await cache.get_async(key)
+
+
+def _cache_store(key: str | None, result: dict) -> None:
+    cache = get_llm_cache()
+    if key and result and cache is not None:
+        cache.set(key, result)
+
+
+def _cache_store_async(key: str | None, result: dict) -> None:
+    """디스크 기록은 백그라운드 스레드로 (이벤트 루프 안에서 호출)"""
+    cache = get_llm_cache()
+    if key and result and cache is not None:
+        cache.set_async(key, result)
+
+
+# ── sync/async 공통 호출 단계 — 두 버전은 SDK 호출·스케줄러 입장·캐시 I/O만 다르다 ──
+
+@contextmanager
+def _llm_call(response_schema: type, agent: str | None):
+    """(스키마, span, 사용량 기록) — 블록이 끝나면 span과 사용량이 기록된다"""
+    schema = get_response_schema(response_schema)
+    with span(schema.name, kind="llm") as call, track_llm_call(agent or schema.name, schema.name) as usage:
+        yield schema, call, usage
+
+
+def _over_budget(call, usage: LLMCallRecord) -> bool:
+    if usage.budget_exceeded:
+        print(f"[LLM Budget] 세션 토큰 예산 초과로 호출 생략 ({usage.session_id})")
+        call.status = "budget_exceeded"
+    return usage.budget_exceeded
+
+
+def _cache_hit(call, usage: LLMCallRecord, cached: dict) -> dict:
+    usage.cache_hit = True
+    call.status = "cache_hit"
+    return cached
+
+
+def _settle(permit, completion) -> None:
+    """스케줄러 입장 시 추정한 토큰을 실제 사용량으로 정산"""
+    if completion.usage is not None:
+        permit.settle((completion.usage.prompt_tokens or 0) + (completion.usage.completion_tokens or 0))
+
+
+def _finish(completion, schema: ResponseSchema, call, usage: LLMCallRecord) -> dict:
+    """응답 사용량 기록 + 검증 (파싱 실패는 _PARSE_ERRORS로 올라감)"""
+    usage.add_usage(completion.usage)
+    result = _parse_completion(completion, schema)
+    if not result:
+        usage.parse_failures += 1
+    call.status = "ok" if result else "empty"
+    return result
+
+
+def _parse_failed(e: Exception, call, usage: LLMCallRecord) -> dict:
+    usage.parse_failures += 1
+    print(f"[OpenAI Parse Error] {e}")
+    call.status = "parse_error"
+    return {}
+
+
+def _should_retry(e: Exception, attempt: int, scheduler: LLMScheduler, usage: LLMCallRecord, schema_name: str) -> bool:
+    """Rate Limit이면 재시도 준비 후 True, 그 밖의 에러는 False"""
+    err = str(e)
+    wait = _rate_limit_wait(err, attempt)
+    if wait is None:
+        print(f"[OpenAI Error] {err}")
+        return False
+    # 대기는 스케줄러 cooldown으로 — 동시 요청들도 함께 멈추고 다음 입장 시 기다린다
+    scheduler.cooldown(wait)
+    usage.retries += 1
+    usage.wait_s += wait
+    LLM_RETRIES.inc(schema_name)
+    print(f"[Rate Limit] {wait:.1f}초 대기 후 재시도 ({attempt+1}/{_MAX_ATTEMPTS})...")
+    return True
+
+
+def _failed(call, usage: LLMCallRecord) -> dict:
+    usage.error = True
+    call.status = "error"
+    return {}
+
+
 def generate_structured(
     system_prompt: str,
     user_content: str,
     response_schema: type,
     temperature: float = 0.2,
+    agent: str | None = None,
 ) -> dict:
-    """OpenAI SDK로 structured output 호출 (Rate Limit 재시도 포함)"""
-    settings = get_settings()
-    client = get_client()
-
-    for attempt in range(3):
-        try:
-            completion = client.beta.chat.completions.parse(
-                model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_content},
-                ],
-                response_format=response_schema,
-                temperature=temperature,
-                max_tokens=4096,
-            )
-            parsed = completion.choices[0].message.parsed
-            return parsed.model_dump() if parsed else {}
-        except Exception as e:
-            err = str(e)
-            if "429" in err or "rate_limit" in err.lower():
-                m = re.search(r"(\d+)s", err)
-                wait = int(m.group(1)) + 2 if m else (15 * (attempt + 1))
-                print(f"[Rate Limit] {wait}초 대기 후 재시도 ({attempt+1}/3)...")
-                time.sleep(wait)
-            else:
-                print(f"[OpenAI Error] {err}")
-                break
-    return {}
+    """OpenAI SDK로 structured output 호출 (응답 캐시, Rate Limit 재시도, 사용량 회계 포함)
+
+    agent: 사용량 집계 키 (기본값은 스키마 이름)
+    """
+    with _llm_call(response_schema, agent) as (schema, call, usage):
+        if _over_budget(call, usage):
+            return {}
+        request = _build_request(system_prompt, user_content, schema, temperature)
+        cache_key, cached = _cache_lookup(request, system_prompt, user_content, schema)
+        if cached is not None:
+            return _cache_hit(call, usage, cached)
+
+        scheduler = get_llm_scheduler()
+        estimated = estimate_tokens(system_prompt, user_content, request["max_tokens"])
+        send = _completions(get_client(), schema)
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                with scheduler.slot_sync(estimated) as permit:
+                    usage.queue_s += permit.queued_s
+                    completion = send(**request)
+                    _settle(permit, completion)
+                result = _finish(completion, schema, call, usage)
+                _cache_store(cache_key, result)
+                return result
+            except _PARSE_ERRORS as e:
+                return _parse_failed(e, call, usage)
+            except Exception as e:
+                if not _should_retry(e, attempt, scheduler, usage, schema.name):
+                    break
+        return _failed(call, usage)
+
+
+async def generate_structured_async(
+    system_prompt: str,
+    user_content: str,
+    response_schema: type,
+    temperature: float = 0.2,
+    agent: str | None = None,
+) -> dict:
+    """generate_structured의 async 버전 — 대기 중 스레드를 점유하지 않음"""
+    with _llm_call(response_schema, agent) as (schema, call, usage):
+        if _over_budget(call, usage):
+            return {}
+        request = _build_request(system_prompt, user_content, schema, temperature)
+        cache_key, cached = await _cache_lookup_async(request, system_prompt, user_content, schema)
+        if cached is not None:
+            return _cache_hit(call, usage, cached)
+
+        scheduler = get_llm_scheduler()
+        estimated = estimate_tokens(system_prompt, user_content, request["max_tokens"])
+        send = _completions(get_async_client(), schema)
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                async with scheduler.slot(estimated) as permit:
+                    usage.queue_s += permit.queued_s
+                    completion = await send(**request)
+                    _settle(permit, completion)
+                result = _finish(completion, schema, call, usage)
+                _cache_store_async(cache_key, result)
+                return result
+            except _PARSE_ERRORS as e:
+                return _parse_failed(e, call, usage)
+            except Exception as e:
+                if not _should_retry(e, attempt, scheduler, usage, schema.name):
+                    break
+        return _failed(call, usage)
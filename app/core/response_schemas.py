@@ -0,0 +1,70 @@
+"""에이전트 structured output 응답 스키마 레지스트리
+
+OpenAI SDK의 parse()는 호출마다 pydantic 모델에서 strict JSON 스키마를 다시 만들고,
+응답도 ParsedChatCompletion으로 다시 감싼다. 여기서는 스키마별로 한 번만
+(strict response_format, 지문, 검증기)를 만들어 두고 generate_structured가 그대로 재사용한다.
+에이전트 모듈이 import될 때 register_response_schema로 등록하므로 앱 시작 시 모두 준비된다.
+
+strict 스키마 변환은 SDK의 비공개 모듈(openai.lib._pydantic)을 쓴다. SDK 버전이 바뀌어 모듈이
+없으면 response_format을 None으로 두고, openai_client가 SDK parse()로 호출한다.
+"""
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pydantic import BaseModel
+
+try:
+    from openai.lib._pydantic import to_strict_json_schema  # SDK가 parse()에서 쓰는 변환과 동일
+except ImportError:
+    to_strict_json_schema = None
+
+
+@dataclass(frozen=True)
+class ResponseSchema:
+    model: type[BaseModel]
+    name: str
+    response_format: dict | None  # chat.completions.create(response_format=...) 인자, None이면 SDK parse() 사용
+    fingerprint: str  # 응답 캐시 키용 strict 스키마 해시
+
+    def parse(self, content: str) -> dict:
+        """응답 JSON 문자열 → 검증된 dict (실패 시 pydantic.ValidationError)"""
+        return self.model.model_validate_json(content).model_dump()
+
+
+def _build(model: type[BaseModel]) -> ResponseSchema:
+    if to_strict_json_schema is None:
+        fingerprint = hashlib.sha256(json.dumps(model.model_json_schema(), sort_keys=True).encode()).hexdigest()
+        return ResponseSchema(model, model.__name__, None, fingerprint)
+    schema = to_strict_json_schema(model)
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {"schema": schema, "name": model.__name__, "strict": True},
+    }
+    fingerprint = hashlib.sha256(json.dumps(response_format, sort_keys=True).encode()).hexdigest()
+    return ResponseSchema(model, model.__name__, response_format, fingerprint)
+
+
+_registry: dict[type, ResponseSchema] = {}
+_lock = threading.Lock()
+
+
+def register_response_schema(model: type[BaseModel]) -> type[BaseModel]:
+    """응답 스키마를 미리 컴파일해 등록한다 (클래스 데코레이터로도 사용)"""
+    get_response_schema(model)
+    return model
+
+
+def get_response_schema(model: type[BaseModel]) -> ResponseSchema:
+    """등록된 스키마를 돌려준다. 등록되지 않은 모델은 이 시점에 한 번 만들어 등록한다."""
+    entry = _registry.get(model)
+    if entry is None:
+        with _lock:
+            entry = _registry.get(model)
+            if entry is None:
+                entry = _registry[model] = _build(model)
+    return entry
+
+
+def registered_schemas() -> list[ResponseSchema]:
+    return list(_registry.values())
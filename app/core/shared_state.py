@@ -0,0 +1,292 @@
+"""워커 간 공유 상태 — 카운터, TTL 키, 세션 lease
+
+- InProcessSharedState: 단일 프로세스용 (기본값, 외부 의존 없음)
+- SQLiteSharedState: 같은 호스트의 여러 uvicorn 워커가 파일 DB(WAL)로 공유
+
+모든 연산은 단일 SQL 문(또는 lock 구간)으로 원자적이다.
+"""
+import asyncio
+import random
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+from .config import get_settings
+from ..db.sqlite_pool import SQLitePool
+
+_DEFAULT_PATH = Path(__file__).resolve().parent.parent.parent / "shared_state.db"
+
+# lease를 기다릴 때 재시도 간격 (실패할 때마다 2배, 최대 _LEASE_POLL_MAX_SECONDS)
+_LEASE_POLL_SECONDS = 0.02
+_LEASE_POLL_MAX_SECONDS = 0.5
+# 보유 중인 lease는 TTL의 이 비율마다 연장한다
+_LEASE_RENEW_RATIO = 1 / 3
+
+
+class LeaseTimeout(Exception):
+    pass
+
+
+class SharedState(ABC):
+    cross_process: bool = False  # True면 다른 프로세스와 상태를 공유
+
+    @abstractmethod
+    def incr(self, key: str, amount: int = 1, ttl_seconds: float | None = None) -> int:
+        """카운터를 증가시키고 새 값을 반환한다. ttl이 주어지면 만료 시각을 갱신한다."""
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """만료되지 않은 값 (없으면 None)"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def acquire(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        """lease 획득 (같은 owner면 연장). 만료된 lease는 다른 owner가 가져갈 수 있다."""
+
+    @abstractmethod
+    def release(self, name: str, owner: str) -> None:
+        ...
+
+    async def _run(self, fn, *args):
+        # 파일 DB 등 외부 저장소 연산은 이벤트 루프를 막지 않도록 스레드에서 실행
+        if self.cross_process:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    @asynccontextmanager
+    async def lease(self, name: str, ttl_seconds: float, wait_seconds: float):
+        """lease를 잡을 때까지 wait_seconds 동안 기다린다 (실패 시 LeaseTimeout)
+
+        보유하는 동안 백그라운드 태스크가 TTL의 1/3마다 lease를 연장하므로
+        본문이 TTL보다 오래 걸려도 다른 워커가 가져가지 않는다.
+        """
+        owner = uuid.uuid4().hex
+        deadline = time.monotonic() + wait_seconds
+        delay = _LEASE_POLL_SECONDS
+        while not await self._run(self.acquire, name, owner, ttl_seconds):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise LeaseTimeout(f"lease 대기 시간 초과: {name}")
+            # 여러 워커가 같은 간격으로 몰리지 않도록 지터를 섞는다
+            await asyncio.sleep(min(remaining, delay * random.uniform(0.5, 1.0)))
+            delay = min(delay * 2, _LEASE_POLL_MAX_SECONDS)
+        heartbeat = asyncio.create_task(self._renew(name, owner, ttl_seconds))
+        try:
+            yield owner
+        finally:
+            heartbeat.cancel()
+            await self._run(self.release, name, owner)
+
+    async def _renew(self, name: str, owner: str, ttl_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(ttl_seconds * _LEASE_RENEW_RATIO)
+            try:
+                renewed = await self._run(self.acquire, name, owner, ttl_seconds)
+            except Exception as e:
+                print(f"[SharedState] lease 연장 실패: {name} — {e}")
+                continue
+            if not renewed:
+                print(f"[SharedState] lease를 잃음: {name} (다른 워커가 만료 후 획득)")
+                return
+
+
+class InProcessSharedState(SharedState):
+    def __init__(self):
+        self._values: dict[str, tuple[Any, float | None]] = {}  # key → (value, expires_at)
+        self._leases: dict[str, tuple[str, float]] = {}  # name → (owner, expires_at)
+        self._lock = threading.Lock()
+        self._writes_since_sweep = 0
+
+    def _live(self, key: str, now: float) -> Any | None:
+        """만료되지 않은 값 (lock 보유 상태에서 호출)"""
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            del self._values[key]
+            return None
+        return value
+
+    def _put(self, key: str, value: Any, ttl_seconds: float | None, now: float) -> None:
+        """lock 보유 상태에서 호출 — 쓰기 100회마다 만료 키를 정리한다"""
+        self._values[key] = (value, now + ttl_seconds if ttl_seconds is not None else None)
+        self._writes_since_sweep += 1
+        if self._writes_since_sweep >= 100:
+            self._writes_since_sweep = 0
+            expired = [k for k, (_, exp) in self._values.items() if exp is not None and exp <= now]
+            for k in expired:
+                del self._values[k]
+
+    def incr(self, key: str, amount: int = 1, ttl_seconds: float | None = None) -> int:
+        now = time.time()
+        with self._lock:
+            value = (self._live(key, now) or 0) + amount
+            self._put(key, value, ttl_seconds, now)
+        return value
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            return self._live(key, time.time())
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        with self._lock:
+            self._put(key, value, ttl_seconds, time.time())
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+
+    def acquire(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        now = time.time()
+        with self._lock:
+            holder = self._leases.get(name)
+            if holder is not None and holder[0] != owner and holder[1] > now:
+                return False
+            self._leases[name] = (owner, now + ttl_seconds)
+        return True
+
+    def release(self, name: str, owner: str) -> None:
+        with self._lock:
+            holder = self._leases.get(name)
+            if holder is not None and holder[0] == owner:
+                del self._leases[name]
+
+
+class SQLiteSharedState(SharedState):
+    cross_process = True
+
+    def __init__(self, db_path: Path | str = _DEFAULT_PATH):
+        self.db_path = db_path
+        self._pool = SQLitePool(db_path)
+        self._writes_since_sweep = 0
+        self._lock = threading.Lock()
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        conn = self._pool.connection()
+        with conn:
+            # value는 타입 선언 없이 두어 정수 카운터와 문자열을 그대로 저장한다
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS kv (
+                    key TEXT PRIMARY KEY,
+                    value,
+                    expires_at REAL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS leases (
+                    name TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+
+    def _after_write(self) -> None:
+        with self._lock:
+            self._writes_since_sweep += 1
+            sweep = self._writes_since_sweep >= 100
+            if sweep:
+                self._writes_since_sweep = 0
+        if sweep:
+            now = time.time()
+            conn = self._pool.connection()
+            with conn:
+                conn.execute("DELETE FROM kv WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+                conn.execute("DELETE FROM leases WHERE expires_at <= ?", (now,))
+
+    def incr(self, key: str, amount: int = 1, ttl_seconds: float | None = None) -> int:
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds is not None else None
+        conn = self._pool.connection()
+        with conn:
+            (value,) = conn.execute(
+                """
+                INSERT INTO kv (key, value, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = CASE
+                        WHEN kv.expires_at IS NOT NULL AND kv.expires_at <= ? THEN excluded.value
+                        ELSE kv.value + excluded.value
+                    END,
+                    expires_at = excluded.expires_at
+                RETURNING value
+                """,
+                (key, amount, expires_at, now),
+            ).fetchone()
+        self._after_write()
+        return value
+
+    def get(self, key: str) -> Any | None:
+        row = self._pool.connection().execute(
+            "SELECT value FROM kv WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+        conn = self._pool.connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+        self._after_write()
+
+    def delete(self, key: str) -> None:
+        conn = self._pool.connection()
+        with conn:
+            conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+
+    def acquire(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        now = time.time()
+        conn = self._pool.connection()
+        with conn:
+            row = conn.execute(
+                """
+                INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    owner = excluded.owner,
+                    expires_at = excluded.expires_at
+                WHERE leases.expires_at <= ? OR leases.owner = excluded.owner
+                RETURNING owner
+                """,
+                (name, owner, now + ttl_seconds, now),
+            ).fetchone()
+        return row is not None
+
+    def release(self, name: str, owner: str) -> None:
+        conn = self._pool.connection()
+        with conn:
+            conn.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner))
+
+
+_state: SharedState | None = None
+
+
+def get_shared_state() -> SharedState:
+    """설정(shared_state_backend)에 따른 프로세스 전역 인스턴스"""
+    global _state
+    if _state is None:
+        settings = get_settings()
+        if settings.shared_state_backend == "sqlite":
+            _state = SQLiteSharedState(
+                Path(settings.shared_state_path) if settings.shared_state_path else _DEFAULT_PATH
+            )
+        else:
+            _state = InProcessSharedState()
+    return _state
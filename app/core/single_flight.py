@@ -0,0 +1,116 @@
+"""동일한 LLM 호출 합치기(single-flight) — 같은 키로 진행 중인 호출이 있으면 새로 보내지 않고 결과를 공유한다
+
+키는 모델 + 시스템 프롬프트 + 사용자 입력 + 응답 스키마 + temperature (응답 캐시 키와 동일).
+- async: 이벤트 루프별로 선두 호출을 태스크로 띄우고, 각 호출자는 asyncio.shield로 기다린다.
+  한 호출자가 취소되거나 타임아웃돼도 공유 태스크는 계속 돌아 다른 호출자(와 응답 캐시)가 결과를 받는다.
+- sync: 선두 스레드가 직접 호출하고, 나머지는 Future로 결과를 기다린다.
+합류한 호출자는 결과의 사본을 받으므로 서로의 dict 수정이 섞이지 않는다.
+선두 호출은 선두의 usage_scope로만 집계되므로, 합류한 호출자는 자기 세션에 coalesced 호출(토큰 0)로
+따로 기록하고, 자기 세션의 토큰 예산을 넘었으면 합류하지 않고 빈 dict를 받는다.
+타임아웃된 호출자는 generate_structured의 실패와 같이 빈 dict를 받는다.
+"""
+import asyncio
+import copy
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Awaitable, Callable
+from .config import get_settings
+from .llm_usage import LLMCallRecord, track_llm_call
+from .metrics import REGISTRY
+
+LLM_COALESCED = REGISTRY.counter(
+    "move_llm_coalesced_total", "진행 중인 동일 호출에 합류해 생략된 LLM 요청 수", ("agent",)
+)
+LLM_COALESCED_TIMEOUTS = REGISTRY.counter(
+    "move_llm_coalesced_timeouts_total", "진행 중인 동일 호출을 기다리다 타임아웃된 호출자 수", ("agent",)
+)
+
+
+class SingleFlight:
+    def __init__(self, timeout_s: float = 0):
+        self.timeout_s = timeout_s or None
+        self._tasks: dict[tuple[int, str], asyncio.Task] = {}  # (id(loop), key) → 진행 중 태스크
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    async def do_async(self, key: str, agent: str, fn: Callable[[], Awaitable[dict]], schema: str = "") -> dict:
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+        task = self._tasks.get(slot)
+        if task is None:
+            task = loop.create_task(fn())
+            self._tasks[slot] = task
+            task.add_done_callback(lambda t: self._forget(slot, t))
+            return await self._wait_async(task, agent)
+        with track_llm_call(agent, schema) as usage:
+            if not self._join(usage, agent):
+                return {}
+            return copy.deepcopy(await self._wait_async(task, agent, usage))
+
+    async def _wait_async(self, task: asyncio.Task, agent: str, usage: LLMCallRecord | None = None) -> dict:
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), self.timeout_s)
+        except asyncio.TimeoutError:
+            self._timed_out(agent, usage)
+            return {}
+
+    def do(self, key: str, agent: str, fn: Callable[[], dict], schema: str = "") -> dict:
+        with self._lock:
+            future = self._futures.get(key)
+            leader = future is None
+            if leader:
+                future = self._futures[key] = Future()
+        if not leader:
+            with track_llm_call(agent, schema) as usage:
+                if not self._join(usage, agent):
+                    return {}
+                try:
+                    return copy.deepcopy(future.result(self.timeout_s))
+                except FutureTimeoutError:
+                    self._timed_out(agent, usage)
+                    return {}
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._futures.pop(key, None)
+
+    def _join(self, usage: LLMCallRecord, agent: str) -> bool:
+        """합류 여부 — 호출자 세션의 토큰 예산을 넘었으면 선두 호출을 기다리지 않는다"""
+        if usage.budget_exceeded:
+            print(f"[LLM Budget] 세션 토큰 예산 초과로 호출 생략 ({usage.session_id})")
+            return False
+        usage.coalesced = True
+        LLM_COALESCED.inc(agent)
+        return True
+
+    def _timed_out(self, agent: str, usage: LLMCallRecord | None) -> None:
+        LLM_COALESCED_TIMEOUTS.inc(agent)
+        if usage is not None:
+            usage.error = True
+        print(f"[LLM SingleFlight] {agent} 응답 대기 {self.timeout_s:g}초 초과 — 이 호출자만 포기")
+
+    def _forget(self, slot: tuple[int, str], task: asyncio.Task) -> None:
+        if self._tasks.get(slot) is task:
+            del self._tasks[slot]
+        if not task.cancelled():
+            task.exception()  # 모든 호출자가 떠난 뒤 실패해도 "never retrieved" 경고를 남기지 않음
+
+    def in_flight(self) -> int:
+        return len(self._tasks) + len(self._futures)
+
+
+_single_flight: SingleFlight | None = None
+
+
+def get_single_flight() -> SingleFlight:
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight(timeout_s=get_settings().llm_single_flight_timeout_s)
+    return _single_flight
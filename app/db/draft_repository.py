@@ -0,0 +1,162 @@
+"""신청서 초안 저장소 — SQLite(WAL) 기본, 워커 간 공유 + 프로세스 내 hot cache
+
+초안은 재시작 후에도 남고, 어느 uvicorn 워커가 만든 초안이든 제출할 수 있다.
+상태 변경은 기대 상태를 조건으로 한 UPDATE로 처리해 워커 간 중복 제출을 막는다.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from ..core.config import get_settings
+from .sqlite_pool import SQLitePool
+
+_DEFAULT_PATH = Path(__file__).resolve().parent.parent.parent / "drafts.db"
+
+_INSERT_SQL = """
+    INSERT INTO drafts (draft_id, session_id, service_id, status, data, created_at, updated_at, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_GET_SQL = "SELECT data, expires_at FROM drafts WHERE draft_id = ? AND expires_at > ?"
+_UPDATE_SQL = """
+    UPDATE drafts SET session_id = ?, status = ?, data = ?, updated_at = ?
+    WHERE draft_id = ? AND status = ? AND expires_at > ?
+    RETURNING expires_at
+"""
+_LIST_BY_SESSION_SQL = """
+    SELECT data FROM drafts WHERE session_id = ? AND expires_at > ?
+    ORDER BY created_at DESC LIMIT ?
+"""
+
+
+class DraftRepository:
+    def __init__(
+        self,
+        db_path: Path | str = _DEFAULT_PATH,
+        ttl_seconds: int = 7 * 86400,
+        max_cache_entries: int = 256,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_cache_entries = max_cache_entries
+        self._pool = SQLitePool(db_path)
+        self._cache: OrderedDict[str, tuple[float, str]] = OrderedDict()  # draft_id → (expires_at, json)
+        self._lock = threading.Lock()
+        self._writes_since_purge = 0
+        self._ensure_table()
+
+    def _ensure_table(self) -> None:
+        conn = self._pool.connection()
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS drafts (
+                    draft_id TEXT PRIMARY KEY,
+                    session_id TEXT,
+                    service_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_session ON drafts(session_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_status ON drafts(status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_expires ON drafts(expires_at)")
+
+    def create(self, draft: dict) -> None:
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        data = json.dumps(draft, ensure_ascii=False)
+        conn = self._pool.connection()
+        with conn:
+            conn.execute(_INSERT_SQL, (
+                draft["draft_id"], draft.get("session_id"), draft["service_id"], draft["status"],
+                data, draft["created_at"], draft["created_at"], expires_at,
+            ))
+        with self._lock:
+            self._remember(draft["draft_id"], expires_at, data)
+            self._writes_since_purge += 1
+            purge = self._writes_since_purge >= 100
+            if purge:
+                self._writes_since_purge = 0
+        if purge:
+            self.purge_expired()
+
+    def get(self, draft_id: str, fresh: bool = False) -> dict | None:
+        """초안 조회. 상태를 바꾸기 전에는 fresh=True로 다른 워커의 변경까지 반영된 값을 읽는다."""
+        now = time.time()
+        if not fresh:
+            with self._lock:
+                entry = self._cache.get(draft_id)
+                if entry is not None and entry[0] > now:
+                    self._cache.move_to_end(draft_id)
+                    return json.loads(entry[1])
+
+        row = self._pool.connection().execute(_GET_SQL, (draft_id, now)).fetchone()
+        if not row:
+            with self._lock:
+                self._cache.pop(draft_id, None)
+            return None
+        with self._lock:
+            self._remember(draft_id, row["expires_at"], row["data"])
+        return json.loads(row["data"])
+
+    def update(self, draft: dict, expected_status: str) -> bool:
+        """status가 expected_status일 때만 저장한다. 다른 요청이 먼저 바꿨으면 False."""
+        now = time.time()
+        data = json.dumps(draft, ensure_ascii=False)
+        conn = self._pool.connection()
+        with conn:
+            updated = conn.execute(_UPDATE_SQL, (
+                draft.get("session_id"), draft["status"], data, datetime.now(timezone.utc).isoformat(),
+                draft["draft_id"], expected_status, now,
+            )).fetchone()
+        with self._lock:
+            if updated:
+                self._remember(draft["draft_id"], updated["expires_at"], data)
+            else:
+                self._cache.pop(draft["draft_id"], None)
+        return bool(updated)
+
+    def list_by_session(self, session_id: str, limit: int = 20) -> list[dict]:
+        rows = self._pool.connection().execute(
+            _LIST_BY_SESSION_SQL, (session_id, time.time(), limit)
+        ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def purge_expired(self) -> int:
+        """TTL이 지난 초안 삭제"""
+        now = time.time()
+        conn = self._pool.connection()
+        with conn:
+            deleted = conn.execute("DELETE FROM drafts WHERE expires_at <= ?", (now,)).rowcount
+        with self._lock:
+            for draft_id in [k for k, (expires_at, _) in self._cache.items() if expires_at <= now]:
+                del self._cache[draft_id]
+        return deleted
+
+    def _remember(self, draft_id: str, expires_at: float, data: str) -> None:
+        """hot cache에 적재 (lock 보유 상태에서 호출)"""
+        self._cache[draft_id] = (expires_at, data)
+        self._cache.move_to_end(draft_id)
+        while len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
+
+
+_repository: DraftRepository | None = None
+
+
+def get_draft_repository() -> DraftRepository:
+    global _repository
+    if _repository is None:
+        settings = get_settings()
+        _repository = DraftRepository(
+            db_path=Path(settings.draft_db_path) if settings.draft_db_path else _DEFAULT_PATH,
+            ttl_seconds=settings.draft_ttl_seconds,
+            max_cache_entries=settings.draft_cache_entries,
+        )
+    return _repository
@@ -0,0 +1,46 @@
+"""스레드별 SQLite 연결 풀 — WAL, synchronous=NORMAL, busy_timeout, statement 캐시"""
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class SQLitePool:
+    """스레드마다 연결 1개를 재사용한다 (sqlite3 연결은 스레드 간 공유 불가)."""
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        busy_timeout_ms: int = 5000,
+        cached_statements: int = 128,
+    ):
+        self.db_path = db_path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._all: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_ms / 1000,
+                cached_statements=self.cached_statements,
+                check_same_thread=False,  # close_all()에서 다른 스레드가 닫을 수 있도록
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+            with self._lock:
+                self._all.append(conn)
+        return conn
+
+    def close_all(self) -> None:
+        with self._lock:
+            conns, self._all = self._all, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
@@ -1,10 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .api.chat import router as chat_router
+from .api.chat import router as chat_router, session_store
 from .api.chat_mock import router as chat_mock_router
 from .api.health import router as health_router
+from .api.metrics import router as metrics_router
 from .api.submit import router as submit_router
+from .api.usage import router as usage_router
 from .core.config import get_settings
+from .core.metrics import flush_spans
 
 app = FastAPI(
     title="이사 AI 민원 오케스트레이터",
@@ -20,12 +23,21 @@ app.add_middleware(
 )
 
 app.include_router(health_router, tags=["health"])
+app.include_router(metrics_router, tags=["metrics"])
 app.include_router(chat_router, prefix="/api/v1", tags=["chat"])
 app.include_router(chat_mock_router, prefix="/api/v1", tags=["chat-mock"])
 app.include_router(submit_router, prefix="/api/v1", tags=["submit"])
+app.include_router(usage_router, prefix="/api/v1", tags=["usage"])
 
 
 @app.on_event("startup")
 def startup():
     settings = get_settings()
     print(f"[startup] OpenAI 모델: {settings.openai_model}")
+
+
+@app.on_event("shutdown")
+def shutdown():
+    # write-behind 모드에서 아직 기록되지 않은 세션 변경과 버퍼된 span을 내보낸다
+    session_store.close()
+    flush_spans()
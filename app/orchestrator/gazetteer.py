@@ -0,0 +1,225 @@
+"""프로필 추출용 지명·키워드 사전과 Aho-Corasick 매처
+
+모든 키워드를 모듈 import 시 한 번 automaton으로 컴파일하고,
+메시지 1회 순회로 모든 키워드의 (첫) 출현 위치와 뒤따르는 조사를 찾는다.
+추출 비용은 메시지 길이에 비례하며 사전 크기와 무관하다.
+"""
+import re
+from dataclasses import dataclass
+
+# 시/도 (약칭 → 정식 명칭)
+SIDO_KEYWORDS: dict[str, str] = {
+    "서울": "서울특별시", "부산": "부산광역시", "인천": "인천광역시",
+    "대구": "대구광역시", "광주": "광주광역시", "대전": "대전광역시",
+    "울산": "울산광역시", "세종": "세종특별자치시", "경기": "경기도",
+    "강원": "강원도", "충북": "충청북도", "충남": "충청남도",
+    "전북": "전라북도", "전남": "전라남도", "경북": "경상북도",
+    "경남": "경상남도", "제주": "제주특별자치도",
+}
+
+# 구/군/시 — (sgg명, sido명) 튜플로 sido 자동 추론 포함
+SGG_KEYWORDS: dict[str, tuple[str, str]] = {
+    # 서울 25개 구
+    "강남구": ("강남구", "서울특별시"), "강동구": ("강동구", "서울특별시"),
+    "강북구": ("강북구", "서울특별시"), "강서구": ("강서구", "서울특별시"),
+    "관악구": ("관악구", "서울특별시"), "광진구": ("광진구", "서울특별시"),
+    "구로구": ("구로구", "서울특별시"), "금천구": ("금천구", "서울특별시"),
+    "노원구": ("노원구", "서울특별시"), "도봉구": ("도봉구", "서울특별시"),
+    "동대문구": ("동대문구", "서울특별시"), "동작구": ("동작구", "서울특별시"),
+    "마포구": ("마포구", "서울특별시"), "서대문구": ("서대문구", "서울특별시"),
+    "서초구": ("서초구", "서울특별시"), "성동구": ("성동구", "서울특별시"),
+    "성북구": ("성북구", "서울특별시"), "송파구": ("송파구", "서울특별시"),
+    "양천구": ("양천구", "서울특별시"), "영등포구": ("영등포구", "서울특별시"),
+    "용산구": ("용산구", "서울특별시"), "은평구": ("은평구", "서울특별시"),
+    "종로구": ("종로구", "서울특별시"), "중구": ("중구", "서울특별시"),
+    "중랑구": ("중랑구", "서울특별시"),
+    # 부산 주요 구
+    "해운대구": ("해운대구", "부산광역시"), "부산진구": ("부산진구", "부산광역시"),
+    "동래구": ("동래구", "부산광역시"), "남구": ("남구", "부산광역시"),
+    "북구": ("북구", "부산광역시"), "사하구": ("사하구", "부산광역시"),
+    "금정구": ("금정구", "부산광역시"), "연제구": ("연제구", "부산광역시"),
+    "수영구": ("수영구", "부산광역시"), "사상구": ("사상구", "부산광역시"),
+    "기장군": ("기장군", "부산광역시"),
+    # 인천 주요 구
+    "미추홀구": ("미추홀구", "인천광역시"), "연수구": ("연수구", "인천광역시"),
+    "남동구": ("남동구", "인천광역시"), "부평구": ("부평구", "인천광역시"),
+    "계양구": ("계양구", "인천광역시"), "강화군": ("강화군", "인천광역시"),
+    "옹진군": ("옹진군", "인천광역시"),
+    # 대구 주요 구
+    "달서구": ("달서구", "대구광역시"), "달성군": ("달성군", "대구광역시"),
+    "수성구": ("수성구", "대구광역시"),
+    # 경기 주요 시/군
+    "수원시": ("수원시", "경기도"), "성남시": ("성남시", "경기도"),
+    "용인시": ("용인시", "경기도"), "부천시": ("부천시", "경기도"),
+    "안산시": ("안산시", "경기도"), "안양시": ("안양시", "경기도"),
+    "남양주시": ("남양주시", "경기도"), "화성시": ("화성시", "경기도"),
+    "평택시": ("평택시", "경기도"), "의정부시": ("의정부시", "경기도"),
+    "시흥시": ("시흥시", "경기도"), "파주시": ("파주시", "경기도"),
+    "광명시": ("광명시", "경기도"), "김포시": ("김포시", "경기도"),
+    "군포시": ("군포시", "경기도"), "하남시": ("하남시", "경기도"),
+    "오산시": ("오산시", "경기도"), "이천시": ("이천시", "경기도"),
+    "안성시": ("안성시", "경기도"), "구리시": ("구리시", "경기도"),
+    "의왕시": ("의왕시", "경기도"), "양주시": ("양주시", "경기도"),
+    "포천시": ("포천시", "경기도"), "고양시": ("고양시", "경기도"),
+    "광주시": ("광주시", "경기도"),
+    # 경기 유명 지역명 (시 이름 없이 쓰는 경우)
+    "판교": ("성남시", "경기도"), "분당": ("성남시", "경기도"),
+    "일산": ("고양시", "경기도"), "동탄": ("화성시", "경기도"),
+    "수지": ("용인시", "경기도"), "광교": ("수원시", "경기도"),
+    "검단": ("인천광역시", "인천광역시"),
+    # 충청/전라/경상 주요 시
+    "청주시": ("청주시", "충청북도"), "천안시": ("천안시", "충청남도"),
+    "전주시": ("전주시", "전라북도"), "창원시": ("창원시", "경상남도"),
+    "진주시": ("진주시", "경상남도"), "포항시": ("포항시", "경상북도"),
+    "경주시": ("경주시", "경상북도"),
+}
+
+# 키워드 분류 → 키워드 목록 (하나의 키워드가 여러 분류에 속할 수 있음)
+KEYWORD_GROUPS: dict[str, list[str]] = {
+    "date_today": ["오늘"],
+    "date_yesterday": ["어제"],
+    "date_two_days_ago": ["그제", "그저께"],
+    "household_single": ["혼자", "1인", "싱글", "나 혼자", "1인 가구"],
+    "household_couple": ["신혼", "신혼부부", "부부"],
+    "household_family": ["가족", "세대", "아내", "남편", "아이", "자녀", "자녀 있는", "4인", "3인", "5인"],
+    "household_other": ["기타"],
+    "children": ["아이", "자녀", "아들", "딸", "초등", "학교"],
+    "vehicle": ["차", "자동차", "차량"],
+    # 초안 생성 대상 감지 (_detect_draft_service)
+    "draft_request": ["초안", "신청서", "만들어", "작성", "신청"],
+    "move_in_report": ["전입신고"],
+    "vehicle_service": ["차량", "자동차", "차 주소", "차량 주소", "차량 변경", "차량 신청"],
+}
+
+FULL_DATE_RE = re.compile(r"(\d{4})[년\-/]?\s*(\d{1,2})[월\-/]?\s*(\d{1,2})일?")
+MONTH_DAY_RE = re.compile(r"(\d{1,2})[월\-/]\s*(\d{1,2})일?")
+
+
+class AhoCorasick:
+    """문자 단위 Aho-Corasick automaton (겹치는 매치 포함 전부 보고)"""
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = patterns
+        self._lengths = [len(p) for p in patterns]
+        self._alphabet = frozenset(ch for p in patterns for ch in p)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        for idx, pattern in enumerate(patterns):
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            self._out[node] += (idx,)
+
+        # BFS로 fail 링크 계산, 출력은 fail 체인을 미리 병합
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                fail = self._goto[f].get(ch, 0)
+                self._fail[child] = fail if fail != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    def iter_matches(self, text: str):
+        """(start, end, pattern_index)를 끝 위치 순으로 생성"""
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        alphabet = self._alphabet
+        node = 0
+        for i, ch in enumerate(text):
+            if ch not in alphabet:
+                node = 0  # 사전에 없는 문자는 어떤 패턴에도 이어질 수 없음
+                continue
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                for idx in out[node]:
+                    yield i + 1 - lengths[idx], i + 1, idx
+
+
+def particle_at(message: str, pos: int) -> str:
+    """키워드 끝(pos) 바로 뒤 조사를 반환: 'from'(에서) | 'to'(로/으로/에) | 'unknown'"""
+    # '경기도로'처럼 지명 접미사(도/시/군/구)가 붙은 경우 한 글자 건너뜀
+    if pos < len(message) and message[pos] in "도시군구":
+        pos += 1
+    if message.startswith("에서", pos):
+        return "from"
+    if message.startswith("으로", pos) or message.startswith("로", pos):
+        return "to"
+    if message.startswith("에", pos):
+        return "to"
+    if pos >= len(message) or message[pos] in (" ", ",", ".", "!"):
+        return "to"
+    return "unknown"
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    keyword: str
+    start: int
+    end: int
+    particle: str
+
+
+class GazetteerScan:
+    """메시지 1회 스캔 결과 — 키워드별 첫 출현과 매칭된 분류 집합"""
+
+    def __init__(self, hits: dict[str, KeywordHit], kinds: set[str], gazetteer: "Gazetteer"):
+        self.hits = hits
+        self.kinds = kinds
+        self._gazetteer = gazetteer
+
+    def has(self, kind: str) -> bool:
+        return kind in self.kinds
+
+    def regions(self, kind: str) -> list[KeywordHit]:
+        """해당 분류('sido' | 'sgg')의 히트를 사전 선언 순서대로 반환"""
+        keyword_kinds = self._gazetteer.keyword_kinds
+        found = [h for h in self.hits.values() if kind in keyword_kinds[h.keyword]]
+        found.sort(key=lambda h: self._gazetteer.order[h.keyword])
+        return found
+
+
+class Gazetteer:
+    def __init__(self):
+        kinds: dict[str, set[str]] = {}
+        for keyword in SIDO_KEYWORDS:
+            kinds.setdefault(keyword, set()).add("sido")
+        for keyword in SGG_KEYWORDS:
+            kinds.setdefault(keyword, set()).add("sgg")
+        for kind, keywords in KEYWORD_GROUPS.items():
+            for keyword in keywords:
+                kinds.setdefault(keyword, set()).add(kind)
+        self.keyword_kinds = kinds
+        self._keywords = list(kinds)
+        # 지역 우선순위는 사전 선언 순서
+        self.order = {k: i for i, k in enumerate(self._keywords)}
+        self._automaton = AhoCorasick(self._keywords)
+
+    def scan(self, message: str) -> GazetteerScan:
+        hits: dict[str, KeywordHit] = {}
+        matched_kinds: set[str] = set()
+        for start, end, idx in self._automaton.iter_matches(message):
+            keyword = self._keywords[idx]
+            if keyword in hits:
+                continue  # 끝 위치 순으로 나오므로 먼저 나온 것이 첫 출현
+            hits[keyword] = KeywordHit(keyword, start, end, particle_at(message, end))
+            matched_kinds |= self.keyword_kinds[keyword]
+        return GazetteerScan(hits, matched_kinds, self)
+
+
+GAZETTEER = Gazetteer()
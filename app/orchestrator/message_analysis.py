@@ -0,0 +1,88 @@
+"""턴 메시지 1회 분석 — safety·triage·프로필 추출·초안 감지가 함께 쓰는 결과
+
+턴 시작 시 analyze_message()로 한 번만 만들고 stage들에 넘긴다.
+- text: NFC 정규화된 메시지 (macOS 등에서 온 자모 분리 입력도 사전·정규식에 맞게)
+- scan: 지명·키워드 사전 1회 스캔 (키워드 히트, 분류 집합, 지역 히트와 조사)
+- dates: 날짜 표현 (상대 표현은 오늘 기준으로 환산)
+- findings: 민감정보·강제 제출 요청 span (pii는 그중 민감정보만)
+모든 오프셋은 text 기준이다.
+"""
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from ..agents.safety import PII_KINDS, SafetyFinding, scan as safety_scan
+from .gazetteer import FULL_DATE_RE, GAZETTEER, MONTH_DAY_RE, GazetteerScan, KeywordHit
+
+# 상대 날짜 키워드 분류 → 오늘로부터 며칠 전
+_RELATIVE_DATES = (("date_today", 0), ("date_yesterday", 1), ("date_two_days_ago", 2))
+
+
+@dataclass(frozen=True, slots=True)
+class DateMention:
+    kind: str  # date_today | date_yesterday | date_two_days_ago | full | month_day
+    value: str  # YYYY-MM-DD
+    start: int = -1  # 정규식 매치만 위치가 있다
+    end: int = -1
+
+
+@dataclass(slots=True)
+class MessageAnalysis:
+    raw: str
+    text: str
+    scan: GazetteerScan
+    findings: list[SafetyFinding]
+    dates: list[DateMention] = field(default_factory=list)
+
+    def has(self, kind: str) -> bool:
+        """키워드 분류(예: 'children', 'draft_request') 포함 여부"""
+        return self.scan.has(kind)
+
+    def regions(self, kind: str) -> list[KeywordHit]:
+        """'sido' | 'sgg' 히트 (사전 선언 순서, 조사 포함)"""
+        return self.scan.regions(kind)
+
+    @property
+    def pii(self) -> list[SafetyFinding]:
+        return [f for f in self.findings if f.kind in PII_KINDS]
+
+    @property
+    def move_date(self) -> str | None:
+        """프로필 move_date 후보 — 상대 표현 > 연월일 > 월일 순서로 첫 번째"""
+        return self.dates[0].value if self.dates else None
+
+
+def normalize(message: str) -> str:
+    if message.isascii() or unicodedata.is_normalized("NFC", message):
+        return message
+    return unicodedata.normalize("NFC", message)
+
+
+def _date_mentions(text: str, scan: GazetteerScan, today: date) -> list[DateMention]:
+    mentions = [
+        DateMention(kind, (today - timedelta(days=days_ago)).isoformat())
+        for kind, days_ago in _RELATIVE_DATES if scan.has(kind)
+    ]
+    m = FULL_DATE_RE.search(text)
+    if m:
+        mentions.append(DateMention(
+            "full", f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}", m.start(), m.end()
+        ))
+    else:
+        m = MONTH_DAY_RE.search(text)
+        if m:
+            mentions.append(DateMention(
+                "month_day", f"{today.year}-{int(m.group(1)):02d}-{int(m.group(2)):02d}", m.start(), m.end()
+            ))
+    return mentions
+
+
+def analyze_message(message: str, today: date | None = None) -> MessageAnalysis:
+    text = normalize(message)
+    scan = GAZETTEER.scan(text)
+    return MessageAnalysis(
+        raw=message,
+        text=text,
+        scan=scan,
+        findings=safety_scan(text),
+        dates=_date_mentions(text, scan, today or date.today()),
+    )
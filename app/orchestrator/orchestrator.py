@@ -1,7 +1,11 @@
+import asyncio
 import json
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable
 from ..agents import (
     SafetyAuditAgent, TriageAgent, InterviewAgent,
-    DecompositionAgent, EvidenceAgent, FormFillAgent,
+    DecompositionAgent, EvidenceAgent, EvidenceReasonAgent, FormFillAgent,
 )
 from ..tools.registry import dispatch
 from ..schemas.api_models import ChatResponse, NextQuestion, SuggestedAction
@@ -10,8 +14,19 @@ from ..schemas.task import TaskNode
 from ..schemas.service import ServiceCard, EvidenceRef
 from ..schemas.audit import AuditEvent
 from ..core.config import get_settings
+from ..core.llm_scheduler import llm_priority
+from ..core.llm_usage import UsageScope, usage_scope
+from ..core.metrics import Span, span, trace
+from ..core.shared_state import get_shared_state
 from ..core import mock_data
 from .session import SessionStore, SessionData
+from .stages import Stage, StageGraph, StageTiming
+from .plan_store import PlanStore, profile_signature
+from .gazetteer import SIDO_KEYWORDS, SGG_KEYWORDS
+from .message_analysis import MessageAnalysis, analyze_message
+
+# 턴 진행 이벤트 콜백: (이벤트 타입, JSON 직렬화 가능한 payload) — SSE 스트리밍용
+TurnEventCallback = Callable[[str, dict], Awaitable[None]]
 
 # 에이전트 싱글턴 (앱 시작 시 1회 초기화)
 _safety = SafetyAuditAgent()
@@ -19,22 +34,127 @@ _triage = TriageAgent()
 _interview = InterviewAgent()
 _decomposition = DecompositionAgent()
 _evidence = EvidenceAgent()
+_evidence_reason = EvidenceReasonAgent()
 _form_fill = FormFillAgent()
 
 
+def search_services_for_profile(profile: MoveProfile) -> list[dict]:
+    """Evidence 입력용 서비스 후보 검색 (턴 처리와 사전 계획 CLI 공용)"""
+    tags = ["이사"]
+    if profile.has_children == "yes":
+        tags.append("자녀")
+    if profile.vehicles.car == "yes":
+        tags.append("차량")
+
+    return dispatch(
+        "search_services",
+        query="이사",
+        region=profile.to_region.sido,
+        tags=tags,
+    )
+
+
 class Orchestrator:
     def __init__(self):
-        self.session_store = SessionStore()
+        self.shared_state = get_shared_state()
+        self.session_store = SessionStore(shared=self.shared_state)
+        plan_store_path = get_settings().plan_store_path
+        self.plan_store = PlanStore(Path(plan_store_path)) if plan_store_path else PlanStore()
+        plan_warm_path = get_settings().plan_warm_path
+        if plan_warm_path and self._plan_store_active():
+            loaded = self.plan_store.warm_load(Path(plan_warm_path))
+            print(f"[PlanStore] 사전 계획 {loaded}개 로드 ({plan_warm_path})")
+        # 응답 후 실행하는 작업(카드 추천 이유 보강)의 참조 유지
+        self._background: set[asyncio.Task] = set()
+
+        # 턴 앞단: safety·세션 로드는 서로 독립, triage는 safety 통과 후에만 (민감정보를 LLM에 보내지 않음)
+        self._intake_stages = [
+            Stage("safety", self._stage_safety, ("analysis",)),
+            Stage("session", self._stage_session, ("session_id",), blocking=True),
+        ]
+        # 새 세션(session_id 없음 또는 new_session)은 항상 turn 0이므로 세션 로드를 기다리지 않고 triage를 시작한다.
+        self._intake_new = StageGraph(
+            self._intake_stages + [Stage("triage", self._stage_triage, ("analysis", "safety"))],
+            seeds=("session_id", "analysis"),
+        )
+        self._intake_existing = StageGraph(
+            self._intake_stages + [Stage("triage", self._stage_triage, ("analysis", "safety", "session"))],
+            seeds=("session_id", "analysis"),
+        )
+        # 턴 뒷단: 서비스 검색·form-fill은 프로필만 필요, evidence만 task_graph + 검색 결과를 기다린다.
+        # 카드는 카탈로그(SERVICES_DB)에서 먼저 만들고, 맞는 태스크가 없을 때만 evidence LLM을 부른다.
+        self._planning = StageGraph(
+            [
+                Stage("plan", self._stage_plan_lookup, ("session",), blocking=True),
+                Stage("task_graph", self._stage_decomposition, ("session", "plan")),
+                Stage("db_results", self._stage_search, ("profile",)),
+                Stage("catalog_cards", self._stage_catalog_cards, ("session", "plan", "task_graph")),
+                Stage(
+                    "service_cards", self._stage_evidence,
+                    ("session", "plan", "task_graph", "db_results", "catalog_cards"),
+                ),
+                Stage("form_schema", self._stage_form_schema, ("draft_service_id",)),
+                Stage("form_result", self._stage_form_fill, ("profile", "draft_service_id", "form_schema")),
+                Stage("draft", self._stage_create_draft, ("session", "draft_service_id", "form_result"), blocking=True),
+            ],
+            seeds=("session", "profile", "draft_service_id"),
+        )
 
     def handle_turn(self, session_id: str, user_message: str) -> ChatResponse:
+        """동기 호출용 래퍼 (이벤트 루프 밖에서만 사용)"""
+        return asyncio.run(self.handle_turn_async(session_id, user_message))
+
+    async def handle_turn_async(
+        self,
+        session_id: str,
+        user_message: str,
+        on_event: TurnEventCallback | None = None,
+        new_session: bool = False,
+    ) -> ChatResponse:
+        """같은 세션의 턴은 (워커가 달라도) session lease로 한 번에 하나씩 처리한다
+
+        new_session: session_id가 호출자가 방금 만든 id면 True (SSE ack에 미리 알린 경우) —
+        session_id가 없을 때와 같이 lease 없이 새 세션으로 처리한다.
+        """
+        with trace(session_id=session_id or None) as turn, usage_scope(session_id) as usage:
+            if not session_id or new_session:
+                return await self._handle_turn(session_id, user_message, on_event, turn, usage, new_session=True)
+            settings = get_settings()
+            async with self.shared_state.lease(
+                f"session:{session_id}",
+                ttl_seconds=settings.session_lease_ttl_seconds,
+                wait_seconds=settings.session_lease_wait_seconds,
+            ):
+                return await self._handle_turn(session_id, user_message, on_event, turn, usage, new_session=False)
+
+    async def _handle_turn(
+        self,
+        session_id: str,
+        user_message: str,
+        on_event: TurnEventCallback | None,
+        turn: Span,
+        usage: UsageScope,
+        new_session: bool,
+    ) -> ChatResponse:
         audit_events: list[AuditEvent] = []
+        timings: list[StageTiming] = []
+        on_stage_done = self._stage_event_emitter(on_event)
+        # 메시지는 턴당 한 번만 분석하고 모든 stage가 공유한다 (정규화·사전·날짜·민감정보)
+        analysis = analyze_message(user_message)
+
+        # ── 1~3. Safety / 세션 로드 / Triage (DAG) ───────────────────
+        intake = self._intake_new if new_session else self._intake_existing
+        ctx, stage_timings = await intake.run(
+            on_stage_done, session_id=session_id, analysis=analysis
+        )
+        timings.extend(stage_timings)
 
-        # ── 1. Safety 검사 ──────────────────────────────────────────
-        safety_result = _safety.run(user_message=user_message)
+        safety_result = ctx["safety"]
         if safety_result.get("audit_event"):
             audit_events.append(AuditEvent(**safety_result["audit_event"]))
 
         if safety_result.get("block"):
+            turn.status = "blocked"
             return ChatResponse(
                 session_id=session_id,
                 assistant_message_markdown=(
@@ -42,30 +162,27 @@ class Orchestrator:
                     f"{safety_result.get('block_reason', '민감정보가 감지되었습니다.')}\n\n"
                     "주민등록번호, 계좌번호 등의 민감정보는 채팅에 입력하지 마세요."
                 ),
-                audit_events=audit_events,
+                audit_events=audit_events + self._timing_events(timings),
             )
 
-        # ── 3. 세션 로드 ────────────────────────────────────────────
-        session: SessionData = self.session_store.get_or_create(session_id)
+        session: SessionData = ctx["session"]
         session_id = session.session_id  # 새로 생성된 경우 UUID로 갱신
+        usage.set_session(session_id)
 
-        # ── 2. Triage (기존 세션이면 스킵) ──────────────────────────
+        # Triage는 기존 세션이면 스킵 (stage가 None 반환)
         _mock = get_settings().mock_mode
-        if session.turn_count > 0:
-            intent = "move"
-        else:
-            triage = mock_data.TRIAGE if _mock else _triage.run(user_message=user_message)
-            intent = triage.get("intent", "other")
-            if intent == "other":
-                return ChatResponse(
-                    session_id=session_id,
-                    assistant_message_markdown=(
-                        "안녕하세요! 저는 이사 관련 민원을 도와드리는 AI입니다. 😊\n\n"
-                        "이사하셨거나 이사 예정이신가요? 이사 관련 질문을 해 주세요!\n\n"
-                        "예시: \"이사했는데 뭐부터 해야 해?\", \"다음 달에 이사하는데 준비할 게 뭐야?\""
-                    ),
-                    audit_events=audit_events,
-                )
+        triage = ctx["triage"]
+        if triage is not None and triage.get("intent", "other") == "other":
+            turn.status = "off_topic"
+            return ChatResponse(
+                session_id=session_id,
+                assistant_message_markdown=(
+                    "안녕하세요! 저는 이사 관련 민원을 도와드리는 AI입니다. 😊\n\n"
+                    "이사하셨거나 이사 예정이신가요? 이사 관련 질문을 해 주세요!\n\n"
+                    "예시: \"이사했는데 뭐부터 해야 해?\", \"다음 달에 이사하는데 준비할 게 뭐야?\""
+                ),
+                audit_events=audit_events + self._timing_events(timings),
+            )
 
         session.turn_count += 1
 
@@ -73,12 +190,12 @@ class Orchestrator:
         hitl_required = safety_result.get("block_submit", False)
 
         # ── 4. 메시지에서 프로필 먼저 업데이트 (인터뷰 전에) ─────────
-        session = self._update_profile_from_message(session, user_message)
+        with span("profile_extraction"):
+            session = self._update_profile_from_message(session, analysis)
 
         # ── 5. Interview (프로필 미수집 시) ─────────────────────────
         # mock 모드: 2턴부터 프로필 강제 채움
         if _mock and session.turn_count >= 2 and not session.move_profile.is_sufficient():
-            from datetime import date, timedelta
             session.move_profile = session.move_profile.merge_patch({
                 "move_date": (date.today() - timedelta(days=1)).isoformat(),
                 "to_region": {"sido": "서울특별시", "sgg": "강남구"},
@@ -86,22 +203,27 @@ class Orchestrator:
             })
 
         # 코드 기반 인터뷰 — 빠진 필드만 질문 생성 (LLM 불필요)
-        next_questions = self._build_interview_questions(session.move_profile)
+        with span("interview"):
+            next_questions = self._build_interview_questions(session.move_profile)
 
         # 아직 프로필이 충분하지 않으면 질문만 반환
         if next_questions and not session.move_profile.is_sufficient():
-            self.session_store.update(session_id, session)
-
             audit_events.append(AuditEvent(
                 event_type="state_update",
                 summary=f"인터뷰 진행 중 (턴 {session.turn_count})",
             ))
-
+            audit_events.extend(self._timing_events(timings))
+            with span("session_save"):
+                await self.session_store.update_async(session_id, session)
+            if on_event is not None:
+                await on_event("questions", {"questions": [q.model_dump() for q in next_questions]})
+
+            with span("markdown"):
+                markdown = self._build_interview_message(next_questions, session.move_profile)
+            turn.status = "interview"
             return ChatResponse(
                 session_id=session_id,
-                assistant_message_markdown=self._build_interview_message(
-                    next_questions, session.move_profile
-                ),
+                assistant_message_markdown=markdown,
                 next_questions=next_questions,
                 suggested_actions=[
                     SuggestedAction(type="skip", label="건너뛰기", payload={})
@@ -109,81 +231,79 @@ class Orchestrator:
                 audit_events=audit_events,
             )
 
-        # ── 5. Decomposition ────────────────────────────────────────
-        if not session.task_graph:
-            tasks_raw = mock_data.DECOMPOSITION if _mock else _decomposition.run(move_profile=session.move_profile)
-            session.task_graph = [
-                TaskNode(**t) if isinstance(t, dict) else t for t in tasks_raw
-            ]
+        # ── 6~9. Decomposition / 서비스 검색 / Evidence / Form-Fill (DAG) ──
+        had_tasks = bool(session.task_graph)
+        had_cards = bool(session.service_cards)
+        draft_service_id = self._detect_draft_service(analysis, session.move_profile)
+        planned, stage_timings = await self._planning.run(
+            on_stage_done,
+            session=session,
+            profile=session.move_profile,
+            draft_service_id=draft_service_id,
+        )
+        timings.extend(stage_timings)
+
+        cached_plan = planned["plan"]
+        if cached_plan is not None:
+            audit_events.append(AuditEvent(
+                event_type="state_update",
+                summary=f"동일 프로필 계획 재사용 ({profile_signature(session.move_profile)})",
+            ))
+
+        session.task_graph = planned["task_graph"]
+        if not had_tasks:
             audit_events.append(AuditEvent(
                 event_type="recommendation",
                 summary=f"태스크 {len(session.task_graph)}개 생성",
             ))
 
-        # ── 6. 서비스 검색 (Mock DB) ────────────────────────────────
-        tags = ["이사"]
-        if session.move_profile.has_children == "yes":
-            tags.append("자녀")
-        if session.move_profile.vehicles.car == "yes":
-            tags.append("차량")
-
-        db_results = dispatch(
-            "search_services",
-            query="이사",
-            region=session.move_profile.to_region.sido,
-            tags=tags,
-        )
-
-        # ── 7. Evidence (서비스 카드 생성) ──────────────────────────
-        if not session.service_cards:
-            cards_raw = mock_data.EVIDENCE if _mock else _evidence.run(
-                task_graph=[t.model_dump() for t in session.task_graph],
-                move_profile=session.move_profile,
-                db_results=db_results,
-            )
-            session.service_cards = [
-                ServiceCard(**c) if isinstance(c, dict) else c for c in cards_raw
-            ]
+        session.service_cards = planned["service_cards"]
+        if not had_cards:
             audit_events.append(AuditEvent(
                 event_type="recommendation",
                 summary=f"서비스 카드 {len(session.service_cards)}개 생성",
-                evidence_refs=[c.service_id if hasattr(c, 'service_id') else c.get('service_id', '') for c in session.service_cards],
+                evidence_refs=[c.service_id for c in session.service_cards],
             ))
 
-        # ── 8. Form-Fill (초안 요청 감지) ───────────────────────────
-        form_result = None
-        draft_result = None
-        draft_service_id = self._detect_draft_service(user_message, session.move_profile)
-        if draft_service_id:
-            schema = dispatch("get_form_schema", service_id=draft_service_id)
-            mock_form = mock_data.FORM_FILL_BY_SERVICE.get(draft_service_id, mock_data.FORM_FILL)
-            form_result = mock_form if _mock else _form_fill.run(
-                service_id=draft_service_id,
-                move_profile=session.move_profile,
-                form_schema=schema,
+        # 새로 계획한 결과는 같은 시그니처의 다음 세션을 위해 저장
+        if (
+            cached_plan is None and not had_tasks and not had_cards
+            and session.task_graph and session.service_cards
+            and self._plan_store_active()
+        ):
+            await self.plan_store.put_async(
+                profile_signature(session.move_profile), session.task_graph, session.service_cards
             )
-            if form_result:
-                draft_payload = form_result.get("draft_payload", {})
-                draft_result = dispatch(
-                    "create_application_draft",
-                    service_id=draft_service_id,
-                    draft_payload=draft_payload,
-                )
-                hitl_required = True
-                service_name = schema.get("service_name", draft_service_id) if schema else draft_service_id
-                audit_events.append(AuditEvent(
-                    event_type="hitl_gate",
-                    summary=f"{service_name} 초안 생성 완료 (draft_id: {draft_result.get('draft_id')})",
-                    tool_name="create_application_draft",
-                ))
 
-        # ── 9. 세션 저장 ────────────────────────────────────────────
-        session.audit_log.extend(audit_events)
-        self.session_store.update(session_id, session)
+        form_result = planned["form_result"]
+        draft_result = planned["draft"]
+        if draft_result:
+            hitl_required = True
+            schema = planned["form_schema"]
+            service_name = schema.get("service_name", draft_service_id) if schema else draft_service_id
+            audit_events.append(AuditEvent(
+                event_type="hitl_gate",
+                summary=f"{service_name} 초안 생성 완료 (draft_id: {draft_result.get('draft_id')})",
+                tool_name="create_application_draft",
+            ))
+
+        # ── 10. 세션 저장 ───────────────────────────────────────────
+        audit_events.extend(self._timing_events(timings))
+        with span("session_save"):
+            self.session_store.append_audit(session, audit_events)
+            await self.session_store.update_async(session_id, session)
 
-        # ── 10. 응답 조립 ────────────────────────────────────────────
+        # 카탈로그 카드의 맞춤 추천 이유는 응답을 막지 않고 뒤에서 채워 세션에 반영
+        if planned["catalog_cards"] and get_settings().evidence_reasons_enabled:
+            self._start_background(self._enrich_card_reasons(
+                session_id, session.move_profile.model_copy(deep=True), list(session.service_cards)
+            ))
+
+        # ── 11. 응답 조립 ────────────────────────────────────────────
         suggested_actions = self._build_actions(session, draft_result)
-        markdown = self._build_response_markdown(session, form_result, draft_result, hitl_required)
+        with span("markdown"):
+            markdown = self._build_response_markdown(session, form_result, draft_result, hitl_required)
+        turn.status = "planned"
 
         return ChatResponse(
             session_id=session_id,
@@ -198,176 +318,251 @@ class Orchestrator:
             draft_preview=draft_result.get("preview") if draft_result else None,
         )
 
-    def _update_profile_from_message(self, session: SessionData, message: str) -> SessionData:
-        """간단한 키워드 기반 프로필 업데이트 (Gemini 없이)"""
-        from datetime import date, timedelta
+    def _stage_event_emitter(self, on_event: TurnEventCallback | None):
+        """stage 완료를 클라이언트용 턴 이벤트로 변환"""
+        if on_event is None:
+            return None
+
+        async def _on_stage_done(name: str, value: Any) -> None:
+            if name == "safety":
+                await on_event("safety", {k: v for k, v in value.items() if k != "audit_event"})
+            elif name == "task_graph":
+                await on_event("task_graph", {"task_graph": [t.model_dump() for t in value]})
+            elif name == "service_cards":
+                for card in value:
+                    await on_event("service_card", card.model_dump())
+            elif name == "draft" and value:
+                await on_event("draft_preview", {
+                    "draft_id": value.get("draft_id"),
+                    "service_id": value.get("service_id"),
+                    "preview": value.get("preview"),
+                })
+
+        return _on_stage_done
+
+    # ── Stage 구현 ──────────────────────────────────────────────────
+
+    def _stage_safety(self, analysis: MessageAnalysis) -> dict:
+        return _safety.run(user_message=analysis.text, findings=analysis.findings)
+
+    def _stage_session(self, session_id: str) -> SessionData:
+        return self.session_store.get_or_create(session_id)
+
+    async def _stage_triage(
+        self, analysis: MessageAnalysis, safety: dict, session: SessionData | None = None
+    ) -> dict | None:
+        if safety.get("block"):
+            return None
+        if session is not None and session.turn_count > 0:
+            return None
+        if get_settings().mock_mode:
+            return mock_data.TRIAGE
+        return await _triage.run_async(user_message=analysis.text, kinds=frozenset(analysis.scan.kinds))
+
+    def _plan_store_active(self) -> bool:
+        # mock 모드 결과가 실제 계획으로 재사용되지 않도록 제외
+        settings = get_settings()
+        return settings.plan_store_enabled and not settings.mock_mode
+
+    def _stage_plan_lookup(self, session: SessionData) -> tuple[list[TaskNode], list[ServiceCard]] | None:
+        if session.task_graph or session.service_cards or not self._plan_store_active():
+            return None
+        return self.plan_store.get(profile_signature(session.move_profile))
+
+    async def _stage_decomposition(self, session: SessionData, plan) -> list[TaskNode]:
+        if session.task_graph:
+            return session.task_graph
+        if plan is not None:
+            return plan[0]
+        if get_settings().mock_mode:
+            tasks_raw = mock_data.DECOMPOSITION
+        else:
+            tasks_raw = await _decomposition.run_async(move_profile=session.move_profile)
+        return [TaskNode(**t) if isinstance(t, dict) else t for t in tasks_raw]
+
+    def _stage_search(self, profile: MoveProfile) -> list[dict]:
+        return search_services_for_profile(profile)
+
+    def _stage_catalog_cards(
+        self, session: SessionData, plan, task_graph: list[TaskNode]
+    ) -> list[ServiceCard] | None:
+        if session.service_cards or plan is not None or get_settings().mock_mode:
+            return None
+        cards_raw = _evidence.from_catalog([t.model_dump() for t in task_graph], session.move_profile)
+        return [ServiceCard(**c) for c in cards_raw] if cards_raw else None
+
+    async def _stage_evidence(
+        self,
+        session: SessionData,
+        plan,
+        task_graph: list[TaskNode],
+        db_results: list[dict],
+        catalog_cards: list[ServiceCard] | None,
+    ) -> list[ServiceCard]:
+        if session.service_cards:
+            return session.service_cards
+        if plan is not None:
+            return plan[1]
+        if catalog_cards:
+            return catalog_cards
+        if get_settings().mock_mode:
+            cards_raw = mock_data.EVIDENCE
+        else:
+            cards_raw = await _evidence.run_async(
+                task_graph=[t.model_dump() for t in task_graph],
+                move_profile=session.move_profile,
+                db_results=db_results,
+            )
+        return [ServiceCard(**c) if isinstance(c, dict) else c for c in cards_raw]
+
+    def _stage_form_schema(self, draft_service_id: str | None) -> dict | None:
+        if not draft_service_id:
+            return None
+        return dispatch("get_form_schema", service_id=draft_service_id)
+
+    async def _stage_form_fill(
+        self, profile: MoveProfile, draft_service_id: str | None, form_schema: dict | None
+    ) -> dict | None:
+        if not draft_service_id:
+            return None
+        if get_settings().mock_mode:
+            return mock_data.FORM_FILL_BY_SERVICE.get(draft_service_id, mock_data.FORM_FILL)
+        return await _form_fill.run_async(
+            service_id=draft_service_id,
+            move_profile=profile,
+            form_schema=form_schema,
+        )
+
+    def _stage_create_draft(
+        self, session: SessionData, draft_service_id: str | None, form_result: dict | None
+    ) -> dict | None:
+        if not form_result:
+            return None
+        return dispatch(
+            "create_application_draft",
+            service_id=draft_service_id,
+            draft_payload=form_result.get("draft_payload", {}),
+            session_id=session.session_id,
+        )
+
+    # ── 응답 후 작업 ────────────────────────────────────────────────
+
+    def _start_background(self, coro) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _enrich_card_reasons(
+        self, session_id: str, profile: MoveProfile, cards: list[ServiceCard]
+    ) -> None:
+        """카드별 맞춤 why_recommended를 LLM으로 만들어 세션에 반영
+
+        턴의 LLM 호출보다 뒤에 서도록 background 우선순위로 부르고, 쓰기는 세션 lease 안에서
+        한다. 그 사이 카드 구성이나 프로필이 바뀌었으면(다음 턴 등) 버린다. 실패해도 카탈로그 기본 문구가 남는다.
+        문구가 시그니처 밖 정보(시/군/구, 날짜 등)를 담을 수 있으므로 PlanStore에는 쓰지 않는다.
+        """
+        settings = get_settings()
+        try:
+            with usage_scope(session_id), llm_priority("background"):
+                reasons = await _evidence_reason.run_async(
+                    cards=[c.model_dump() for c in cards], move_profile=profile
+                )
+            if not reasons:
+                return
+            async with self.shared_state.lease(
+                f"session:{session_id}",
+                ttl_seconds=settings.session_lease_ttl_seconds,
+                wait_seconds=settings.session_lease_wait_seconds,
+            ):
+                session = await self.session_store.get_async(session_id)
+                if (
+                    session is None or session.move_profile != profile
+                    or [c.service_id for c in session.service_cards] != [c.service_id for c in cards]
+                ):
+                    return
+                session.service_cards = [
+                    c.model_copy(update={"why_recommended": reasons[c.service_id]}) if c.service_id in reasons else c
+                    for c in session.service_cards
+                ]
+                self.session_store.append_audit(session, [AuditEvent(
+                    event_type="recommendation",
+                    summary=f"서비스 카드 추천 이유 {len(reasons)}개 보강",
+                    evidence_refs=list(reasons),
+                )])
+                await self.session_store.update_async(session_id, session)
+        except Exception as e:
+            print(f"[Evidence] 추천 이유 보강 실패 ({session_id}): {type(e).__name__}: {e}")
+
+    def _timing_events(self, timings: list[StageTiming]) -> list[AuditEvent]:
+        return [
+            AuditEvent(
+                event_type="stage_timing",
+                summary=f"{t.name}: {t.duration_ms:.1f}ms (+{t.started_ms:.1f}ms)",
+                duration_ms=round(t.duration_ms, 3),
+            )
+            for t in timings
+        ]
+
+    def _update_profile_from_message(self, session: SessionData, analysis: MessageAnalysis) -> SessionData:
+        """간단한 키워드 기반 프로필 업데이트 (Gemini 없이) — 턴 메시지 분석 결과 사용"""
         profile = session.move_profile
         patch = {}
+        scan = analysis.scan
 
         # 날짜 감지
-        if profile.move_date == "unknown":
-            today = date.today()
-            if "오늘" in message:
-                patch["move_date"] = today.isoformat()
-            elif "어제" in message:
-                patch["move_date"] = (today - timedelta(days=1)).isoformat()
-            elif "그제" in message or "그저께" in message:
-                patch["move_date"] = (today - timedelta(days=2)).isoformat()
-            else:
-                import re
-                m = re.search(r"(\d{4})[년\-/]?\s*(\d{1,2})[월\-/]?\s*(\d{1,2})일?", message)
-                if m:
-                    patch["move_date"] = f"{m.group(1)}-{int(m.group(2)):02d}-{int(m.group(3)):02d}"
-                else:
-                    m2 = re.search(r"(\d{1,2})[월\-/]\s*(\d{1,2})일?", message)
-                    if m2:
-                        patch["move_date"] = f"{today.year}-{int(m2.group(1)):02d}-{int(m2.group(2)):02d}"
-
-        import re
-
-        def _particle(msg: str, keyword: str) -> str:
-            """키워드 바로 뒤 조사를 반환: 'from'(에서) | 'to'(로/으로) | 'unknown'"""
-            idx = msg.find(keyword)
-            if idx == -1:
-                return "unknown"
-            after = msg[idx + len(keyword):]
-            # '경기도로'처럼 지명 접미사(도/시/군/구)가 붙은 경우 한 글자 건너뜀
-            if after and after[0] in "도시군구":
-                after = after[1:]
-            if after.startswith("에서"):
-                return "from"
-            if after.startswith("으로") or after.startswith("로"):
-                return "to"
-            if after.startswith("에") and not after.startswith("에서"):
-                return "to"
-            if not after or after[0] in (" ", ",", ".", "!"):
-                return "to"
-            return "unknown"
+        if profile.move_date == "unknown" and analysis.move_date:
+            patch["move_date"] = analysis.move_date
 
         # 시/도 감지
-        sido_keywords = {
-            "서울": "서울특별시", "부산": "부산광역시", "인천": "인천광역시",
-            "대구": "대구광역시", "광주": "광주광역시", "대전": "대전광역시",
-            "울산": "울산광역시", "세종": "세종특별자치시", "경기": "경기도",
-            "강원": "강원도", "충북": "충청북도", "충남": "충청남도",
-            "전북": "전라북도", "전남": "전라남도", "경북": "경상북도",
-            "경남": "경상남도", "제주": "제주특별자치도",
-        }
         detected_sido = None
         if profile.to_region.sido == "unknown":
-            # 1차: 명확히 목적지(로/으로)인 키워드 우선
-            for keyword, sido in sido_keywords.items():
-                if keyword in message and _particle(message, keyword) == "to":
-                    detected_sido = sido
-                    patch["to_region"] = {"sido": sido, "sgg": profile.to_region.sgg}
-                    break
-            # 2차: 조사 불분명한 경우 fallback (에서가 아닌 것만)
-            if not detected_sido:
-                for keyword, sido in sido_keywords.items():
-                    if keyword in message and _particle(message, keyword) != "from":
-                        detected_sido = sido
-                        patch["to_region"] = {"sido": sido, "sgg": profile.to_region.sgg}
-                        break
-
-        # 구/군/시 감지 (sgg) — (sgg명, sido명) 튜플로 sido 자동 추론 포함
-        sgg_keywords = {
-            # 서울 25개 구
-            "강남구": ("강남구", "서울특별시"), "강동구": ("강동구", "서울특별시"),
-            "강북구": ("강북구", "서울특별시"), "강서구": ("강서구", "서울특별시"),
-            "관악구": ("관악구", "서울특별시"), "광진구": ("광진구", "서울특별시"),
-            "구로구": ("구로구", "서울특별시"), "금천구": ("금천구", "서울특별시"),
-            "노원구": ("노원구", "서울특별시"), "도봉구": ("도봉구", "서울특별시"),
-            "동대문구": ("동대문구", "서울특별시"), "동작구": ("동작구", "서울특별시"),
-            "마포구": ("마포구", "서울특별시"), "서대문구": ("서대문구", "서울특별시"),
-            "서초구": ("서초구", "서울특별시"), "성동구": ("성동구", "서울특별시"),
-            "성북구": ("성북구", "서울특별시"), "송파구": ("송파구", "서울특별시"),
-            "양천구": ("양천구", "서울특별시"), "영등포구": ("영등포구", "서울특별시"),
-            "용산구": ("용산구", "서울특별시"), "은평구": ("은평구", "서울특별시"),
-            "종로구": ("종로구", "서울특별시"), "중구": ("중구", "서울특별시"),
-            "중랑구": ("중랑구", "서울특별시"),
-            # 부산 주요 구
-            "해운대구": ("해운대구", "부산광역시"), "부산진구": ("부산진구", "부산광역시"),
-            "동래구": ("동래구", "부산광역시"), "남구": ("남구", "부산광역시"),
-            "북구": ("북구", "부산광역시"), "사하구": ("사하구", "부산광역시"),
-            "금정구": ("금정구", "부산광역시"), "연제구": ("연제구", "부산광역시"),
-            "수영구": ("수영구", "부산광역시"), "사상구": ("사상구", "부산광역시"),
-            "기장군": ("기장군", "부산광역시"),
-            # 인천 주요 구
-            "미추홀구": ("미추홀구", "인천광역시"), "연수구": ("연수구", "인천광역시"),
-            "남동구": ("남동구", "인천광역시"), "부평구": ("부평구", "인천광역시"),
-            "계양구": ("계양구", "인천광역시"), "강화군": ("강화군", "인천광역시"),
-            "옹진군": ("옹진군", "인천광역시"),
-            # 대구 주요 구
-            "달서구": ("달서구", "대구광역시"), "달성군": ("달성군", "대구광역시"),
-            "수성구": ("수성구", "대구광역시"),
-            # 경기 주요 시/군
-            "수원시": ("수원시", "경기도"), "성남시": ("성남시", "경기도"),
-            "용인시": ("용인시", "경기도"), "부천시": ("부천시", "경기도"),
-            "안산시": ("안산시", "경기도"), "안양시": ("안양시", "경기도"),
-            "남양주시": ("남양주시", "경기도"), "화성시": ("화성시", "경기도"),
-            "평택시": ("평택시", "경기도"), "의정부시": ("의정부시", "경기도"),
-            "시흥시": ("시흥시", "경기도"), "파주시": ("파주시", "경기도"),
-            "광명시": ("광명시", "경기도"), "김포시": ("김포시", "경기도"),
-            "군포시": ("군포시", "경기도"), "하남시": ("하남시", "경기도"),
-            "오산시": ("오산시", "경기도"), "이천시": ("이천시", "경기도"),
-            "안성시": ("안성시", "경기도"), "구리시": ("구리시", "경기도"),
-            "의왕시": ("의왕시", "경기도"), "양주시": ("양주시", "경기도"),
-            "포천시": ("포천시", "경기도"), "고양시": ("고양시", "경기도"),
-            "광주시": ("광주시", "경기도"),
-            # 경기 유명 지역명 (시 이름 없이 쓰는 경우)
-            "판교": ("성남시", "경기도"), "분당": ("성남시", "경기도"),
-            "일산": ("고양시", "경기도"), "동탄": ("화성시", "경기도"),
-            "수지": ("용인시", "경기도"), "광교": ("수원시", "경기도"),
-            "검단": ("인천광역시", "인천광역시"),
-            # 충청/전라/경상 주요 시
-            "청주시": ("청주시", "충청북도"), "천안시": ("천안시", "충청남도"),
-            "전주시": ("전주시", "전라북도"), "창원시": ("창원시", "경상남도"),
-            "진주시": ("진주시", "경상남도"), "포항시": ("포항시", "경상북도"),
-            "경주시": ("경주시", "경상북도"),
-        }
+            sido_hits = scan.regions("sido")
+            # 1차: 명확히 목적지(로/으로)인 키워드 우선, 2차: 조사 불분명한 경우 (에서가 아닌 것만)
+            hit = next((h for h in sido_hits if h.particle == "to"), None) or next(
+                (h for h in sido_hits if h.particle != "from"), None
+            )
+            if hit:
+                detected_sido = SIDO_KEYWORDS[hit.keyword]
+                patch["to_region"] = {"sido": detected_sido, "sgg": profile.to_region.sgg}
+
+        # 구/군/시 감지 (sgg) — sido가 unknown이면 sgg로부터 추론
         if profile.to_region.sgg in ("unknown", None):
             current_sido = detected_sido or profile.to_region.sido
+            sgg_hits = scan.regions("sgg")
 
             def _apply_sgg(keyword: str):
-                sgg_val, inferred_sido = sgg_keywords[keyword]
+                sgg_val, inferred_sido = SGG_KEYWORDS[keyword]
                 patch.setdefault("to_region", {"sido": current_sido, "sgg": "unknown"})
                 patch["to_region"]["sgg"] = sgg_val
-                # sido가 아직 unknown이면 sgg로부터 추론
                 if patch["to_region"].get("sido") in ("unknown", None) and inferred_sido:
                     patch["to_region"]["sido"] = inferred_sido
 
             # 1차: 명확히 목적지(로/으로)인 sgg 우선
-            for keyword in sgg_keywords:
-                if keyword in message and _particle(message, keyword) == "to":
-                    _apply_sgg(keyword)
-                    break
+            hit = next((h for h in sgg_hits if h.particle == "to"), None)
+            if hit:
+                _apply_sgg(hit.keyword)
             # 2차: 조사 불분명하되 에서가 아닌 것
             if "to_region" not in patch or patch["to_region"].get("sgg") == "unknown":
-                for keyword in sgg_keywords:
-                    if keyword in message and _particle(message, keyword) != "from":
-                        _apply_sgg(keyword)
-                        break
+                hit = next((h for h in sgg_hits if h.particle != "from"), None)
+                if hit:
+                    _apply_sgg(hit.keyword)
 
         # 세대 유형 감지
         if profile.household_type == "unknown":
-            if any(k in message for k in ["혼자", "1인", "싱글", "나 혼자", "1인 가구"]):
+            if scan.has("household_single"):
                 patch["household_type"] = "single"
-            elif any(k in message for k in ["신혼", "신혼부부", "부부"]):
+            elif scan.has("household_couple") or scan.has("household_family"):
                 patch["household_type"] = "family"
-            elif any(k in message for k in ["가족", "세대", "아내", "남편", "아이", "자녀", "자녀 있는", "4인", "3인", "5인"]):
-                patch["household_type"] = "family"
-            elif "기타" in message:
+            elif scan.has("household_other"):
                 patch["household_type"] = "single"
 
         # 자녀 유무 감지
-        if profile.has_children == "unknown":
-            if any(k in message for k in ["아이", "자녀", "아들", "딸", "초등", "학교"]):
-                patch["has_children"] = "yes"
+        if profile.has_children == "unknown" and scan.has("children"):
+            patch["has_children"] = "yes"
 
         # 차량 유무 감지
-        if profile.vehicles.car == "unknown":
-            if any(k in message for k in ["차", "자동차", "차량"]):
-                patch["vehicles"] = {"car": "yes"}
+        if profile.vehicles.car == "unknown" and scan.has("vehicle"):
+            patch["vehicles"] = {"car": "yes"}
 
         if patch:
             session.move_profile = profile.merge_patch(patch)
@@ -409,24 +604,21 @@ class Orchestrator:
 
         return questions
 
-    def _detect_draft_service(self, message: str, profile) -> str | None:
+    def _detect_draft_service(self, analysis: MessageAnalysis, profile) -> str | None:
         """메시지와 프로필에서 초안 생성 대상 서비스 ID를 감지합니다."""
-        draft_keywords = ["초안", "신청서", "만들어", "작성", "신청"]
-        car_keywords = ["차량", "자동차", "차 주소", "차량 주소", "차량 변경", "차량 신청"]
-
-        has_draft_intent = any(k in message for k in draft_keywords)
+        has_draft_intent = analysis.has("draft_request")
         # "전입신고" 단독은 SVC001 명시적 요청
-        is_svc001_explicit = "전입신고" in message
+        is_svc001_explicit = analysis.has("move_in_report")
 
         if not has_draft_intent and not is_svc001_explicit:
             return None
 
         # 차량 관련 키워드가 있으면 SVC003 우선
-        if any(k in message for k in car_keywords):
+        if analysis.has("vehicle_service"):
             return "SVC003"
 
-        # 차량 프로필이 있고 "차" 단어가 포함되면 SVC003
-        if getattr(getattr(profile, "vehicles", None), "car", None) == "yes" and "차" in message:
+        # 차량 프로필이 있고 "차" 단어가 포함되면 SVC003 ("차"는 vehicle 분류에 속함)
+        if getattr(getattr(profile, "vehicles", None), "car", None) == "yes" and analysis.has("vehicle"):
             return "SVC003"
 
         return "SVC001"
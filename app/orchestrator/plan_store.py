@@ -0,0 +1,184 @@
+"""프로필 시그니처 → (task_graph, service_cards) 공유 저장소
+
+Decomposition/Evidence 결과는 프로필의 일부 필드에만 의존하므로,
+같은 동치류(시그니처)의 세션은 LLM 호출 없이 저장된 계획을 재사용한다.
+프롬프트·SERVICES_DB·모델이 바뀌면 version이 바뀌어 이전 계획은 자동으로 무시된다.
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+from pathlib import Path
+from operator import attrgetter
+from ..agents.decomposition_rules import RULES, rule_table
+from ..core.config import get_settings
+from ..db.services_db import SERVICES_DB
+from ..db.sqlite_pool import SQLitePool
+from ..prompts import DECOMPOSITION_PROMPT, EVIDENCE_PROMPT, EVIDENCE_REASON_PROMPT
+from ..schemas.profile import MoveProfile
+from ..schemas.service import ServiceCard
+from ..schemas.task import TaskNode
+
+_DB_PATH = Path(__file__).resolve().parent.parent.parent / "plans.db"
+
+# 전입신고 기한(14일) 기준 이사 날짜 구간
+_REPORT_DEADLINE_DAYS = 14
+
+# 규칙 조건 필드와 규칙 밖(LLM 폴백) 필드 — 값이 다르면 task_graph도 달라질 수 있다
+_PLAN_FIELDS = RULES.fields + RULES.uncovered_fields
+_get_plan_fields = attrgetter(*_PLAN_FIELDS)
+
+
+def move_date_bucket(move_date: str, today: date | None = None) -> str:
+    """'unknown' | 'upcoming' | 'recent' (14일 이내) | 'overdue'"""
+    if move_date == "unknown":
+        return "unknown"
+    try:
+        moved = date.fromisoformat(move_date)
+    except ValueError:
+        return "unknown"
+    days_since = ((today or date.today()) - moved).days
+    if days_since < 0:
+        return "upcoming"
+    if days_since <= _REPORT_DEADLINE_DAYS:
+        return "recent"
+    return "overdue"
+
+
+def profile_signature(profile: MoveProfile) -> str:
+    """계획 결과를 좌우하는 필드만으로 만든 정규화 시그니처
+
+    needs.*·vehicles.motorcycle 등 규칙 엔진이 보는 필드를 모두 포함해,
+    LLM 폴백으로 만든 계획이 그 필드가 다른 프로필에 재사용되지 않게 한다.
+    """
+    return "|".join([
+        profile.to_region.sido,
+        profile.household_type,
+        profile.is_rental,
+        move_date_bucket(profile.move_date),
+        *(str(value) for value in _get_plan_fields(profile)),
+    ])
+
+
+def plan_version() -> str:
+    """프롬프트·규칙 테이블·서비스 DB·모델이 바뀌면 달라지는 계획 버전"""
+    payload = json.dumps(
+        [
+            DECOMPOSITION_PROMPT, EVIDENCE_PROMPT, EVIDENCE_REASON_PROMPT, rule_table(),
+            SERVICES_DB, get_settings().openai_model,
+        ],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class PlanStore:
+    def __init__(self, db_path: Path | None = _DB_PATH, version: str | None = None):
+        self.db_path = db_path
+        self.version = version or plan_version()
+        self._memory: dict[str, tuple[list[dict], list[dict]]] = {}
+        self._lock = threading.Lock()
+        self._pool = SQLitePool(self.db_path) if self.db_path else None
+        if self.db_path:
+            self._ensure_table()
+
+    def _connect(self) -> sqlite3.Connection:
+        return self._pool.connection()
+
+    def _ensure_table(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS plans (
+                    signature TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    task_graph TEXT NOT NULL,
+                    service_cards TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (signature, version)
+                )
+                """
+            )
+            conn.commit()
+
+    def get(self, signature: str) -> tuple[list[TaskNode], list[ServiceCard]] | None:
+        with self._lock:
+            entry = self._memory.get(signature)
+
+        if entry is None and self.db_path:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT task_graph, service_cards FROM plans WHERE signature = ? AND version = ?",
+                    (signature, self.version),
+                ).fetchone()
+            if row:
+                entry = (json.loads(row[0]), json.loads(row[1]))
+                with self._lock:
+                    self._memory[signature] = entry
+
+        if entry is None:
+            return None
+        # 세션마다 독립된 객체를 돌려준다 (공유 객체 변경 방지)
+        tasks, cards = entry
+        return [TaskNode(**t) for t in tasks], [ServiceCard(**c) for c in cards]
+
+    async def get_async(self, signature: str) -> tuple[list[TaskNode], list[ServiceCard]] | None:
+        return await asyncio.to_thread(self.get, signature)
+
+    def put(self, signature: str, task_graph: list[TaskNode], service_cards: list[ServiceCard]) -> None:
+        tasks = [t.model_dump() for t in task_graph]
+        cards = [c.model_dump() for c in service_cards]
+        with self._lock:
+            self._memory[signature] = (tasks, cards)
+
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO plans (signature, version, task_graph, service_cards, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        signature,
+                        self.version,
+                        json.dumps(tasks, ensure_ascii=False),
+                        json.dumps(cards, ensure_ascii=False),
+                        datetime.now(timezone.utc).isoformat(),
+                    ),
+                )
+                conn.commit()
+
+    async def put_async(self, signature: str, task_graph: list[TaskNode], service_cards: list[ServiceCard]) -> None:
+        await asyncio.to_thread(self.put, signature, task_graph, service_cards)
+
+    def warm_load(self, path: Path) -> int:
+        """plan_bulk.py가 만든 NDJSON에서 현재 버전의 계획을 메모리에 적재 (DB에는 쓰지 않음)"""
+        if not path.exists():
+            return 0
+        entries: dict[str, tuple[list[dict], list[dict]]] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단된 실행이 남긴 마지막 줄
+                if (
+                    record.get("version") == self.version and not record.get("error")
+                    and not record.get("mock") and record.get("task_graph") and record.get("service_cards")
+                ):
+                    entries[record["signature"]] = (record["task_graph"], record["service_cards"])
+        with self._lock:
+            self._memory.update(entries)
+        return len(entries)
+
+    def purge_stale_versions(self) -> int:
+        """현재 버전이 아닌 계획 삭제"""
+        if not self.db_path:
+            return 0
+        with self._connect() as conn:
+            deleted = conn.execute("DELETE FROM plans WHERE version != ?", (self.version,)).rowcount
+            conn.commit()
+        return deleted
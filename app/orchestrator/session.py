@@ -1,11 +1,21 @@
+import asyncio
+import atexit
+import json
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
+from ..core.config import get_settings
+from ..core.shared_state import SharedState
 from ..schemas.profile import MoveProfile
 from ..schemas.task import TaskNode
 from ..schemas.service import ServiceCard
 from ..schemas.audit import AuditEvent
 from .session_db import SQLiteSessionDB
+
+# 세션 문서의 audit_log 꼬리에는 넣지 않고 audit_events 테이블에만 남기는 이벤트
+_TABLE_ONLY_EVENTS = frozenset({"stage_timing"})
 
 
 class SessionData(BaseModel):
@@ -13,43 +23,276 @@ class SessionData(BaseModel):
     move_profile: MoveProfile = MoveProfile()
     task_graph: list[TaskNode] = []
     service_cards: list[ServiceCard] = []
-    audit_log: list[AuditEvent] = []
+    audit_log: list[AuditEvent] = []  # 최근 audit_tail_size개만 유지 (전체는 audit_events 테이블)
+    audit_seq: int = 0  # 지금까지 적재된 감사 이벤트 수 = 마지막 seq
     turn_count: int = 0
     created_at: str = ""
     last_active_at: str = ""
 
+    # 마지막 저장 이후 바뀐 최상위 필드 — 저장 시 이 필드만 갱신한다
+    _dirty: set[str] = PrivateAttr(default_factory=set)
+
     def model_post_init(self, __context):
         now = datetime.now(timezone.utc).isoformat()
         if not self.created_at:
             self.created_at = now
         self.last_active_at = now
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._dirty.add(name)
+
+    def mark_dirty(self, *fields: str) -> None:
+        """재할당이 아닌 in-place 변경(list.extend 등)은 호출 측이 직접 표시한다"""
+        self._dirty.update(fields)
+
+    def pop_dirty(self) -> set[str]:
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
+
+def _version_key(session_id: str) -> str:
+    return f"session:version:{session_id}"
+
 
 class SessionStore:
-    def __init__(self):
-        self._db = SQLiteSessionDB()
+    """세션 캐시 + SQLite 저장소.
+
+    캐시에는 update()로 저장이 끝난 스냅샷만 올라가고, get()은 항상 깊은 복사본을 돌려준다.
+    턴 도중의 변경이나 update() 전에 실패한 턴의 변경은 캐시·디스크에 남지 않는다.
+    저장 방식은 session_write_mode로 고른다.
+    - write_through(기본): update() 시 동기 기록 (프로세스가 죽어도 완료된 턴은 보존)
+    - write_behind: update()는 메모리만 갱신하고, 백그라운드 스레드가
+      session_flush_interval_ms마다 변경 필드만 한 트랜잭션으로 기록한다.
+      비정상 종료 시 최대 한 주기 분량의 변경이 유실될 수 있고, 단일 워커 전용이다.
+
+    캐시는 워커 간 변경을 확인할 수 있을 때만 쓴다.
+    - 공유 상태가 프로세스 간(shared.cross_process)이면 update()가 동기 기록 후 공유 버전 카운터를 올리고,
+      캐시된 세션은 버전이 같을 때만 재사용한다.
+    - 그렇지 않은 write_through는 캐시 없이 매번 SQLite에서 읽는다 (여러 워커여도 안전).
+    """
+
+    def __init__(self, db: SQLiteSessionDB | None = None, shared: SharedState | None = None):
+        settings = get_settings()
+        self._db = db or SQLiteSessionDB()
+        self._shared = shared if shared is not None and shared.cross_process else None
+        self._versions: dict[str, int] = {}  # 캐시된 세션이 반영하고 있는 공유 버전
+        self.write_behind = settings.session_write_mode == "write_behind" and self._shared is None
+        self._use_cache = self.write_behind or self._shared is not None
+        self._cache_size = settings.session_cache_size
+        self._audit_tail = settings.audit_tail_size
+        self._flush_interval = settings.session_flush_interval_ms / 1000
+        self._cache: OrderedDict[str, SessionData] = OrderedDict()
+        self._pending: dict[str, SessionData] = {}  # 아직 디스크에 쓰지 않은 세션
+        # DB에 행이 있는 세션 (부분 갱신 가능) — 캐시 크기로 제한하는 LRU.
+        # 빠진 세션은 다음 기록 때 전체 문서를 upsert하므로 결과는 같다.
+        self._persisted: OrderedDict[str, None] = OrderedDict()
+        self._pending_audit: list[tuple[str, int, str, str]] = []  # (session_id, seq, event_json, created_at)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._flusher: threading.Thread | None = None
+        if self.write_behind:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="session-flusher", daemon=True
+            )
+            self._flusher.start()
+            atexit.register(self.close)
 
     def get_or_create(self, session_id: str) -> SessionData:
+        """새 세션은 저장하지 않고 반환한다 — 턴 끝의 update()가 턴당 유일한 쓰기"""
         if not session_id:
-            session_id = str(uuid.uuid4())
+            return SessionData(session_id=str(uuid.uuid4()))
         existing = self.get(session_id)
         if existing:
             return existing
-        created = SessionData(session_id=session_id)
-        self.update(session_id, created)
-        return created
+        return SessionData(session_id=session_id)
 
     def update(self, session_id: str, data: SessionData) -> None:
+        snapshot = self._snapshot(session_id, data)
+        if snapshot is not None:
+            self._write_through(session_id, snapshot)
+
+    async def update_async(self, session_id: str, data: SessionData) -> None:
+        """update()와 같되 동기 기록(SQLite)은 스레드에서 실행한다 (async 턴 경로용)"""
+        snapshot = self._snapshot(session_id, data)
+        if snapshot is not None:
+            await asyncio.to_thread(self._write_through, session_id, snapshot)
+
+    def _snapshot(self, session_id: str, data: SessionData) -> SessionData | None:
+        """저장할 스냅샷을 캐시에 올린다. write_behind면 대기열에 넣고 None (기록은 플러셔가)"""
         data.last_active_at = datetime.now(timezone.utc).isoformat()
-        self._db.upsert(
-            session_id=session_id,
-            data_json=data.model_dump_json(),
-            created_at=data.created_at,
-            last_active_at=data.last_active_at,
-        )
+        # 호출자가 이후에 data를 고쳐도 캐시·대기열의 스냅샷은 그대로 — 변경 필드 표시는 옮긴다
+        snapshot = data.model_copy(deep=True)
+        snapshot.mark_dirty(*data.pop_dirty())
+        with self._lock:
+            if self._use_cache:
+                self._remember(session_id, snapshot)
+            if self.write_behind:
+                previous = self._pending.get(session_id)
+                if previous is not None:
+                    # 아직 기록 전인 이전 스냅샷의 변경 필드도 함께 기록
+                    snapshot.mark_dirty(*previous.pop_dirty())
+                self._pending[session_id] = snapshot
+                return None
+        return snapshot
+
+    def _write_through(self, session_id: str, snapshot: SessionData) -> None:
+        self._write({session_id: snapshot})
+        if self._shared is not None:
+            version = self._shared.incr(_version_key(session_id))
+            with self._lock:
+                self._versions[session_id] = version
 
     def get(self, session_id: str) -> SessionData | None:
+        """세션의 깊은 복사본 — 호출자가 고쳐도 update() 전까지 저장 상태에 반영되지 않는다"""
+        data = self._get_shared(session_id)
+        return data.model_copy(deep=True) if data is not None else None
+
+    async def get_async(self, session_id: str) -> SessionData | None:
+        return await asyncio.to_thread(self.get, session_id)
+
+    def _get_shared(self, session_id: str) -> SessionData | None:
+        """캐시 또는 디스크의 저장 상태 객체 (호출자에게 그대로 넘기지 않는다)"""
+        version = self._shared_version(session_id)
+        with self._lock:
+            data = self._cache.get(session_id) or self._pending.get(session_id)
+            if data is not None and (version is None or self._versions.get(session_id) == version):
+                self._remember(session_id, data)
+                return data
+            if data is not None:
+                # 다른 워커가 그 사이에 턴을 처리함 — 디스크에서 다시 읽는다
+                self._cache.pop(session_id, None)
         row = self._db.get(session_id)
         if not row:
             return None
-        return SessionData.model_validate_json(row["data"])
+        data = SessionData.model_validate_json(row["data"])
+        data.pop_dirty()  # 방금 읽은 상태는 디스크와 같음
+        if data.audit_seq < len(data.audit_log):
+            # 감사 로그 테이블 도입 전 세션 — 문서 안의 전체 로그를 테이블로 옮긴다 (다음 update()에 저장)
+            legacy, data.audit_log = data.audit_log, []
+            self.append_audit(data, legacy)
+        with self._lock:
+            self._mark_persisted((session_id,))
+            if not self._use_cache:
+                return data
+            # 읽는 동안 다른 요청이 먼저 캐시에 올렸으면 그 객체를 쓴다
+            cached = self._cache.get(session_id) or self._pending.get(session_id)
+            if cached is not None:
+                return cached
+            if version is not None:
+                self._versions[session_id] = version
+            self._remember(session_id, data)
+        return data
+
+    def append_audit(self, data: SessionData, events: list[AuditEvent]) -> None:
+        """감사 이벤트에 seq를 매겨 적재하고, 세션 문서에는 최근 꼬리만 남긴다 (stage_timing은 테이블에만).
+
+        행은 다음 update()/플러시와 같은 트랜잭션에서 INSERT되므로 턴당 비용은 새 이벤트 수에 비례한다.
+        """
+        if not events:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            seq = data.audit_seq
+            for event in events:
+                seq += 1
+                self._pending_audit.append((data.session_id, seq, event.model_dump_json(), now))
+            data.audit_seq = seq
+            tail = [e for e in events if e.event_type not in _TABLE_ONLY_EVENTS]
+            data.audit_log = (data.audit_log + tail)[-self._audit_tail:] if self._audit_tail else []
+
+    def list_audit(self, session_id: str, after_seq: int = 0, limit: int = 100) -> list[dict]:
+        """seq > after_seq인 감사 이벤트를 seq 순으로 반환 (아직 기록 전인 이벤트 포함)"""
+        events = dict(self._db.list_audit(session_id, after_seq, limit))
+        with self._lock:
+            for sid, seq, event_json, _ in self._pending_audit:
+                if sid == session_id and seq > after_seq:
+                    events[seq] = event_json
+        return [
+            {"seq": seq, **json.loads(events[seq])}
+            for seq in sorted(events)[:limit]
+        ]
+
+    def _shared_version(self, session_id: str) -> int | None:
+        """공유 모드의 세션 버전 (단일 프로세스 모드면 None)"""
+        if self._shared is None:
+            return None
+        return self._shared.get(_version_key(session_id)) or 0
+
+    def _remember(self, session_id: str, data: SessionData) -> None:
+        """LRU 캐시에 올린다 (self._lock 보유 상태에서 호출)"""
+        self._cache[session_id] = data
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self._cache_size:
+            evicted, _ = self._cache.popitem(last=False)
+            self._versions.pop(evicted, None)
+            if evicted in self._pending:
+                self._wake.set()  # 캐시에서 빠진 미기록 세션은 바로 플러시
+
+    def _mark_persisted(self, session_ids) -> None:
+        """DB에 행이 있는 세션으로 기록한다 (self._lock 보유 상태에서 호출)"""
+        for session_id in session_ids:
+            self._persisted[session_id] = None
+            self._persisted.move_to_end(session_id)
+        while len(self._persisted) > self._cache_size:
+            self._persisted.popitem(last=False)
+
+    def flush(self) -> None:
+        """대기 중인 변경을 모두 기록한다"""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            has_audit = bool(self._pending_audit)
+        if batch or has_audit:
+            self._write(batch)
+
+    def _write(self, batch: dict[str, SessionData]) -> None:
+        with self._flush_lock:
+            with self._lock:
+                audit_rows, self._pending_audit = self._pending_audit, []
+            upserts: list[tuple[str, str, str, str]] = []
+            patches: list[tuple[str, dict[str, str], str]] = []
+            popped: list[tuple[SessionData, set[str]]] = []
+            for session_id, data in batch.items():
+                dirty = data.pop_dirty()
+                popped.append((data, dirty))
+                if session_id not in self._persisted:
+                    upserts.append((session_id, data.model_dump_json(), data.created_at, data.last_active_at))
+                elif dirty:
+                    values = data.model_dump(mode="json", include=dirty)
+                    patches.append((
+                        session_id,
+                        {f: json.dumps(v, ensure_ascii=False) for f, v in values.items()},
+                        data.last_active_at,
+                    ))
+            try:
+                self._db.write_batch(upserts, patches, audit_rows)
+            except Exception as e:
+                print(f"[SessionStore] 세션 저장 실패, 다음 주기에 재시도: {e}")
+                for data, dirty in popped:
+                    data.mark_dirty(*dirty)
+                with self._lock:
+                    self._pending_audit[:0] = audit_rows
+                    for session_id, data in batch.items():
+                        self._pending.setdefault(session_id, data)
+                return
+            with self._lock:
+                self._mark_persisted(batch)
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """플러셔를 멈추고 남은 변경을 기록한다 (앱 종료 시)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.flush()
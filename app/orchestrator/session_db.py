@@ -1,19 +1,51 @@
-import sqlite3
+from functools import lru_cache
 from pathlib import Path
+from ..core.config import get_settings
+from ..db.sqlite_pool import SQLitePool
+
+# 자주 쓰는 문장은 상수로 두어 연결별 statement 캐시에서 재사용되게 한다
+_UPSERT_SQL = """
+    INSERT INTO sessions (session_id, data, created_at, last_active_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(session_id) DO UPDATE SET
+        data=excluded.data,
+        last_active_at=excluded.last_active_at
+"""
+_GET_SQL = "SELECT session_id, data, created_at, last_active_at FROM sessions WHERE session_id = ?"
+_AUDIT_INSERT_SQL = """
+    INSERT OR IGNORE INTO audit_events (session_id, seq, event, created_at)
+    VALUES (?, ?, ?, ?)
+"""
+_AUDIT_LIST_SQL = """
+    SELECT seq, event FROM audit_events
+    WHERE session_id = ? AND seq > ?
+    ORDER BY seq
+    LIMIT ?
+"""
+
+
+@lru_cache(maxsize=256)
+def _patch_sql(fields: tuple[str, ...]) -> str:
+    """변경된 최상위 필드만 json_set으로 교체하는 UPDATE 문 (필드 조합별로 캐시)"""
+    assignments = ", ".join(f"'$.{f}', json(?)" for f in fields)
+    return (
+        f"UPDATE sessions SET data = json_set(data, {assignments}), last_active_at = ? "
+        "WHERE session_id = ?"
+    )
 
 
 class SQLiteSessionDB:
-    def __init__(self):
-        self.db_path = Path(__file__).resolve().parent.parent.parent / "sessions.db"
+    def __init__(self, db_path: Path | None = None):
+        configured = get_settings().session_db_path
+        self.db_path = db_path or (
+            Path(configured) if configured else Path(__file__).resolve().parent.parent.parent / "sessions.db"
+        )
+        self._pool = SQLitePool(self.db_path)
         self._ensure_table()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
-
     def _ensure_table(self) -> None:
-        with self._connect() as conn:
+        conn = self._pool.connection()
+        with conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS sessions (
@@ -24,26 +56,56 @@ class SQLiteSessionDB:
                 )
                 """
             )
-            conn.commit()
-
-    def upsert(self, session_id: str, data_json: str, created_at: str, last_active_at: str) -> None:
-        with self._connect() as conn:
+            # 감사 로그는 세션 문서와 분리된 append-only 테이블 (세션별 seq 순)
             conn.execute(
                 """
-                INSERT INTO sessions (session_id, data, created_at, last_active_at)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(session_id) DO UPDATE SET
-                    data=excluded.data,
-                    last_active_at=excluded.last_active_at
-                """,
-                (session_id, data_json, created_at, last_active_at),
+                CREATE TABLE IF NOT EXISTS audit_events (
+                    session_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    event TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (session_id, seq)
+                ) WITHOUT ROWID
+                """
             )
-            conn.commit()
+
+    def upsert(self, session_id: str, data_json: str, created_at: str, last_active_at: str) -> None:
+        conn = self._pool.connection()
+        with conn:
+            conn.execute(_UPSERT_SQL, (session_id, data_json, created_at, last_active_at))
+
+    def write_batch(
+        self,
+        upserts: list[tuple[str, str, str, str]],
+        patches: list[tuple[str, dict[str, str], str]],
+        audit_rows: list[tuple[str, int, str, str]] = (),
+    ) -> None:
+        """한 트랜잭션으로 일괄 기록한다.
+
+        upserts: (session_id, data_json, created_at, last_active_at) — 전체 문서 저장
+        patches: (session_id, {필드: 값 JSON}, last_active_at) — 기존 행의 부분 갱신
+        audit_rows: (session_id, seq, event_json, created_at) — 감사 이벤트 추가
+        """
+        conn = self._pool.connection()
+        with conn:
+            if audit_rows:
+                conn.executemany(_AUDIT_INSERT_SQL, audit_rows)
+            if upserts:
+                conn.executemany(_UPSERT_SQL, upserts)
+            for session_id, fields, last_active_at in patches:
+                conn.execute(
+                    _patch_sql(tuple(fields)),
+                    (*fields.values(), last_active_at, session_id),
+                )
 
     def get(self, session_id: str) -> dict | None:
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT session_id, data, created_at, last_active_at FROM sessions WHERE session_id = ?",
-                (session_id,),
-            ).fetchone()
-            return dict(row) if row else None
+        row = self._pool.connection().execute(_GET_SQL, (session_id,)).fetchone()
+        return dict(row) if row else None
+
+    def list_audit(self, session_id: str, after_seq: int = 0, limit: int = 100) -> list[tuple[int, str]]:
+        """seq > after_seq인 감사 이벤트 (seq, event_json)를 seq 순으로 반환"""
+        rows = self._pool.connection().execute(_AUDIT_LIST_SQL, (session_id, after_seq, limit)).fetchall()
+        return [(row["seq"], row["event"]) for row in rows]
+
+    def close(self) -> None:
+        self._pool.close_all()
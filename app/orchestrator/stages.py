@@ -0,0 +1,111 @@
+"""턴 처리 단계를 DAG로 선언하고 입력이 준비되는 즉시 실행하는 스케줄러"""
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+from ..core.metrics import span
+
+# stage 완료 콜백: (stage 이름, 출력 값)
+StageCallback = Callable[[str, Any], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """name이 곧 출력 키이며, inputs에 나열된 키가 모두 준비되면 실행된다.
+
+    blocking=True인 동기 함수(디스크 I/O 등)는 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+    """
+    name: str
+    fn: Callable[..., Any]
+    inputs: tuple[str, ...] = ()
+    blocking: bool = False
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    name: str
+    started_ms: float   # 그래프 시작 기준 오프셋
+    duration_ms: float
+
+
+class StageGraph:
+    def __init__(self, stages: list[Stage], seeds: tuple[str, ...] = ()):
+        self.stages = {s.name: s for s in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("중복된 stage 이름이 있습니다.")
+        self.seeds = set(seeds)
+        self._order = self._toposort()
+
+    def _toposort(self) -> list[Stage]:
+        order: list[Stage] = []
+        state: dict[str, int] = {}  # 1: 방문 중, 2: 완료
+
+        def visit(name: str) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"stage 순환 의존: {name}")
+            state[name] = 1
+            for dep in self.stages[name].inputs:
+                if dep in self.stages:
+                    visit(dep)
+                elif dep not in self.seeds:
+                    raise ValueError(f"알 수 없는 stage 입력: {name} ← {dep}")
+            state[name] = 2
+            order.append(self.stages[name])
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    async def run(
+        self, on_stage_done: StageCallback | None = None, **seeds
+    ) -> tuple[dict, list[StageTiming]]:
+        """모든 stage를 실행하고 (결과 dict, stage별 타이밍)을 반환한다.
+
+        on_stage_done이 주어지면 각 stage가 끝나는 즉시 호출된다 (스트리밍용).
+        """
+        missing = self.seeds - seeds.keys()
+        if missing:
+            raise ValueError(f"seed 누락: {sorted(missing)}")
+
+        results: dict[str, Any] = dict(seeds)
+        timings: list[StageTiming] = []
+        tasks: dict[str, asyncio.Task] = {}
+        t_graph = time.perf_counter()
+
+        async def _run_stage(stage: Stage) -> None:
+            deps = [tasks[d] for d in stage.inputs if d in tasks]
+            if deps:
+                await asyncio.gather(*deps)
+            t0 = time.perf_counter()
+            kwargs = {k: results[k] for k in stage.inputs}
+            with span(stage.name):
+                if stage.blocking:
+                    value = await asyncio.to_thread(stage.fn, **kwargs)
+                else:
+                    value = stage.fn(**kwargs)
+                if inspect.isawaitable(value):
+                    value = await value
+            t1 = time.perf_counter()
+            results[stage.name] = value
+            timings.append(StageTiming(
+                name=stage.name,
+                started_ms=(t0 - t_graph) * 1000,
+                duration_ms=(t1 - t0) * 1000,
+            ))
+            if on_stage_done is not None:
+                await on_stage_done(stage.name, value)
+
+        for stage in self._order:
+            tasks[stage.name] = asyncio.create_task(_run_stage(stage))
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        timings.sort(key=lambda t: t.started_ms)
+        return results, timings
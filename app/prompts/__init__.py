@@ -1,11 +1,11 @@
 from .system import SYSTEM_PROMPT, DEVELOPER_PROMPT
 from .agents import (
     TRIAGE_PROMPT, INTERVIEW_PROMPT, DECOMPOSITION_PROMPT,
-    EVIDENCE_PROMPT, FORM_FILL_PROMPT, SAFETY_PROMPT,
+    EVIDENCE_PROMPT, EVIDENCE_REASON_PROMPT, FORM_FILL_PROMPT, SAFETY_PROMPT,
 )
 
 __all__ = [
     "SYSTEM_PROMPT", "DEVELOPER_PROMPT",
     "TRIAGE_PROMPT", "INTERVIEW_PROMPT", "DECOMPOSITION_PROMPT",
-    "EVIDENCE_PROMPT", "FORM_FILL_PROMPT", "SAFETY_PROMPT",
+    "EVIDENCE_PROMPT", "EVIDENCE_REASON_PROMPT", "FORM_FILL_PROMPT", "SAFETY_PROMPT",
 ]
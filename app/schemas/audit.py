@@ -4,9 +4,12 @@ from pydantic import BaseModel, Field
 
 
 class AuditEvent(BaseModel):
-    event_type: Literal["recommendation", "tool_call", "hitl_gate", "safety_block", "state_update"]
+    event_type: Literal[
+        "recommendation", "tool_call", "hitl_gate", "safety_block", "state_update", "stage_timing",
+    ]
     timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     summary: str
     evidence_refs: list[str] = []
     tool_name: str | None = None
     tool_args_redacted: bool = True
+    duration_ms: float | None = None  # stage_timing 이벤트의 소요 시간
@@ -1,10 +1,9 @@
 import uuid
 from datetime import datetime, timezone
+from ..db.draft_repository import get_draft_repository
 
-_draft_store: dict[str, dict] = {}
 
-
-def create_application_draft(service_id: str, draft_payload: dict) -> dict:
+def create_application_draft(service_id: str, draft_payload: dict, session_id: str | None = None) -> dict:
     """신청서 초안을 생성합니다. 실제 제출은 하지 않습니다 (HITL 게이트)."""
     draft_id = f"DRAFT-{str(uuid.uuid4())[:8].upper()}"
 
@@ -27,8 +26,8 @@ def create_application_draft(service_id: str, draft_payload: dict) -> dict:
         "status": "draft",
         "note": "⚠️ 초안이 생성되었습니다. 실제 제출 전 반드시 내용을 확인해 주세요.",
         "submitted_at": None,
-        "session_id": None,
+        "session_id": session_id,
         "created_at": datetime.now(timezone.utc).isoformat(),
     }
-    _draft_store[draft_id] = draft
+    get_draft_repository().create(draft)
     return draft
@@ -1,3 +1,4 @@
+from ..core.metrics import span
 from .search_services import search_services
 from .get_service_detail import get_service_detail
 from .get_form_schema import get_form_schema
@@ -20,4 +21,5 @@ def dispatch(tool_name: str, **kwargs) -> dict:
     """화이트리스트에 등록된 툴만 실행합니다."""
     if tool_name not in TOOL_WHITELIST:
         raise ToolNotAllowedError(f"허용되지 않은 툴: {tool_name}")
-    return TOOL_WHITELIST[tool_name](**kwargs)
+    with span(tool_name, kind="tool"):
+        return TOOL_WHITELIST[tool_name](**kwargs)
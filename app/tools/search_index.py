@@ -0,0 +1,146 @@
+"""search_services용 역색인 (bigram/tag/target_region → postings) + top-k
+
+순위는 기존 선형 스캔과 같다: 점수(키워드 일치 +2, 태그 일치 1개당 +1, 전국 서비스 +1)
+내림차순, 동점이면 카탈로그 순서. 색인은 후보 문서를 좁히는 데만 쓴다.
+"""
+import heapq
+import re
+from functools import lru_cache
+from ..db.services_db import SERVICES_DB
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# 기존 스코어링: 키워드 일치 +2, 태그 일치 1개당 +1, target_region "all" +1
+_KEYWORD_SCORE = 2
+_TAG_SCORE = 1
+_REGION_SCORE = 1
+
+
+def _terms(text: str) -> list[str]:
+    """한국어 부분 일치를 위해 토큰을 문자 bigram으로 쪼갠다 ('이사' ⊂ '이사한')"""
+    terms = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if len(token) == 1:
+            terms.append(token)
+        else:
+            terms.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return terms
+
+
+def _rank_key(item: tuple[int, int]) -> tuple[int, int]:
+    # 점수 내림차순, 동점이면 카탈로그 순서 (기존 안정 정렬과 동일)
+    return item[1], -item[0]
+
+
+class ServiceIndex:
+    """카탈로그를 1회 색인한다. 결과는 카탈로그 레코드를 복사 없이 그대로 반환하므로 수정하지 말 것."""
+
+    def __init__(self, services: dict[str, dict], query_cache_size: int = 1024):
+        self._docs: list[dict] = list(services.values())
+        self._regions: list[str] = [svc.get("target_region", "") for svc in self._docs]
+        self._texts: list[str] = []  # 기존 스캔과 같은 검색 대상 문자열 (키워드 부분 일치 확인용)
+        self._postings: dict[str, list[int]] = {}
+        self._tag_postings: dict[str, list[int]] = {}
+        self._region_postings: dict[str, list[int]] = {}
+
+        for doc_id, svc in enumerate(self._docs):
+            text = " ".join([
+                svc.get("service_name", ""),
+                " ".join(svc.get("tags", [])),
+                svc.get("eligibility_summary", ""),
+            ])
+            self._texts.append(text.lower())
+            for term in dict.fromkeys(_terms(text)):
+                self._postings.setdefault(term, []).append(doc_id)
+            for tag in dict.fromkeys(svc.get("tags", [])):
+                self._tag_postings.setdefault(tag, []).append(doc_id)
+            self._region_postings.setdefault(self._regions[doc_id], []).append(doc_id)
+
+        self._search_ids = lru_cache(maxsize=query_cache_size)(self._search_ids_uncached)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def search(
+        self, query: str = "", region: str = "", tags: list[str] | None = None, top_k: int = 5
+    ) -> list[dict]:
+        doc_ids = self._search_ids(query, region, tuple(tags or ()), top_k)
+        return [self._docs[doc_id] for doc_id in doc_ids]
+
+    def _keyword_matches(self, query: str) -> set[int]:
+        """공백으로 나눈 단어 중 하나라도 검색 대상 문자열에 포함된 문서 (기존 스캔과 같은 판정)"""
+        matched: set[int] = set()
+        for word in set(query.lower().split()):
+            if len(word) >= 2 and _TOKEN_RE.fullmatch(word):
+                # 단어의 bigram을 모두 가진 문서만 후보로 두고 부분 문자열을 확인한다
+                postings = [self._postings.get(word[i:i + 2]) for i in range(len(word) - 1)]
+                if not all(postings):
+                    continue
+                postings.sort(key=len)
+                candidates = set(postings[0]).intersection(*postings[1:])
+            else:
+                # 1글자·기호가 섞인 단어는 bigram으로 거를 수 없어 전체를 확인한다
+                candidates = range(len(self._docs))
+            texts = self._texts
+            matched.update(doc_id for doc_id in candidates if word in texts[doc_id])
+        return matched
+
+    def _search_ids_uncached(self, query: str, region: str, tags: tuple[str, ...], top_k: int) -> tuple[int, ...]:
+        scores: dict[int, int] = {}
+        get = scores.get
+
+        # 키워드 일치
+        if query:
+            for doc_id in self._keyword_matches(query):
+                scores[doc_id] = _KEYWORD_SCORE
+
+        # 태그 일치 (기존과 같이 요청 태그가 중복되면 중복 횟수만큼 가산)
+        for tag in tags:
+            for doc_id in self._tag_postings.get(tag, ()):
+                scores[doc_id] = get(doc_id, 0) + _TAG_SCORE
+
+        # 전국 서비스 가산 (target_region이 "all"이면 모두 포함 — 요청 지역은 점수에 쓰지 않는다)
+        regions = self._regions
+        for doc_id in scores:
+            if regions[doc_id] == "all":
+                scores[doc_id] += _REGION_SCORE
+
+        ranked = heapq.nlargest(top_k, scores.items(), key=_rank_key)
+
+        # 전국 가산만 받는 문서(점수 = _REGION_SCORE)는 결과가 모자라거나 동점일 때만 카탈로그 순서로 채운다
+        if len(ranked) < top_k or ranked[-1][1] <= _REGION_SCORE:
+            fill = []
+            for doc_id in self._region_postings.get("all", ()):
+                if doc_id not in scores:
+                    fill.append((doc_id, _REGION_SCORE))
+                    if len(fill) >= top_k:
+                        break
+            ranked = heapq.nlargest(top_k, ranked + fill, key=_rank_key)
+
+        # 검색 조건이 전혀 없으면 나머지 카탈로그(점수 0)로 채운다
+        if not query and not tags and len(ranked) < top_k:
+            seen = {doc_id for doc_id, _ in ranked}
+            for doc_id in range(len(self._docs)):
+                if len(ranked) >= top_k:
+                    break
+                if doc_id not in seen:
+                    ranked.append((doc_id, 0))
+
+        return tuple(doc_id for doc_id, _ in ranked)
+
+
+_index: ServiceIndex | None = None
+
+
+def get_service_index() -> ServiceIndex:
+    global _index
+    if _index is None:
+        _index = ServiceIndex(SERVICES_DB)
+    return _index
+
+
+def rebuild_service_index() -> ServiceIndex:
+    """SERVICES_DB가 갱신된 뒤 호출"""
+    global _index
+    _index = ServiceIndex(SERVICES_DB)
+    return _index
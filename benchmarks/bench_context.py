@@ -0,0 +1,47 @@
+"""에이전트 user 메시지 압축 전/후 추정 토큰 — EvidenceAgent·EvidenceReasonAgent·FormFillAgent
+
+    python -m benchmarks.bench_context                 # 설정의 LLM_CONTEXT_BUDGET_TOKENS
+    python -m benchmarks.bench_context --budget 300    # 예산을 줄여 잘림 동작 확인
+
+plan_bulk.py의 프로필 조합마다 실제 턴과 같은 입력(규칙 task_graph, 서비스 검색 결과,
+카탈로그 카드, 신청서 스키마)으로 각 에이전트의 _build_content만 호출한다 (LLM 호출 없음).
+"""
+import argparse
+from app.agents import EvidenceAgent, EvidenceReasonAgent, FormFillAgent
+from app.agents.decomposition_rules import RULES
+from app.agents.evidence_catalog import build_cards
+from app.core import context_builder
+from app.core.config import get_settings
+from app.db.form_schemas_db import FORM_SCHEMAS
+from app.orchestrator.orchestrator import search_services_for_profile
+from plan_bulk import enumerate_profiles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=int, default=None, help="기본값은 LLM_CONTEXT_BUDGET_TOKENS (0이면 무제한)")
+    args = parser.parse_args()
+    if args.budget is not None:
+        get_settings().llm_context_budget_tokens = args.budget
+
+    evidence, reason, form_fill = EvidenceAgent(), EvidenceReasonAgent(), FormFillAgent()
+    profiles = list(enumerate_profiles(["recent"]))
+    for profile in profiles:
+        tasks = RULES.decompose(profile)
+        evidence._build_content(tasks, profile, search_services_for_profile(profile))
+        reason._build_content(build_cards(tasks, profile) or [], profile)
+        for service_id, schema in FORM_SCHEMAS.items():
+            form_fill._build_content(service_id, profile, schema)
+
+    budget = get_settings().llm_context_budget_tokens
+    print(f"profiles={len(profiles)}  budget={budget or 'unlimited'} tokens (approx_tokens 추정)")
+    print(f"{'agent':>20} {'calls':>6} {'before/call':>12} {'after/call':>11} {'saved':>7} {'truncated':>10}")
+    for agent, t in context_builder.CONTEXT_LEDGER.summary().items():
+        print(
+            f"{agent:>20} {t['calls']:>6} {t['tokens_before'] / t['calls']:>12.0f} "
+            f"{t['tokens_after'] / t['calls']:>11.0f} {t['saved_ratio']:>7.1%} {t['truncated_items']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""structured output 호출당 스키마 처리 오버헤드 — SDK parse() 방식 vs 응답 스키마 레지스트리
+
+    python -m benchmarks.bench_response_schema
+
+네트워크를 빼고 호출 1회에서 클라이언트가 하는 일만 잰다.
+- before: parse()처럼 매 호출 pydantic 모델 → strict JSON 스키마 변환 + ParsedChatCompletion 구성
+- after: 레지스트리의 response_format 재사용 + 응답 content 검증만
+"""
+import argparse
+import json
+import time
+from openai.lib._parsing._completions import parse_chat_completion, type_to_response_format_param
+from openai.types.chat import ChatCompletion
+from app.agents.decomposition import TaskList
+from app.agents.evidence import CardList
+from app.agents.interview import QuestionList
+from app.agents.triage import TriageResult
+from app.core import mock_data
+from app.core.openai_client import _parse_completion
+from app.core.response_schemas import get_response_schema
+from app.schemas.form import FormFillResult
+
+_SAMPLES = [
+    (TriageResult, dict(mock_data.TRIAGE)),
+    (QuestionList, {"questions": mock_data.INTERVIEW}),
+    (TaskList, {"tasks": mock_data.DECOMPOSITION}),
+    (CardList, {"service_cards": mock_data.EVIDENCE}),
+    (FormFillResult, dict(mock_data.FORM_FILL)),
+]
+
+
+def _completion(payload: dict) -> ChatCompletion:
+    return ChatCompletion.model_validate({
+        "id": "bench", "object": "chat.completion", "created": 0, "model": "bench",
+        "choices": [{
+            "index": 0, "finish_reason": "stop",
+            "message": {"role": "assistant", "content": json.dumps(payload, ensure_ascii=False)},
+        }],
+    })
+
+
+def _before(model, completion: ChatCompletion) -> dict:
+    type_to_response_format_param(model)
+    parsed = parse_chat_completion(response_format=model, input_tools=[], chat_completion=completion)
+    message = parsed.choices[0].message.parsed
+    return message.model_dump() if message else {}
+
+
+def _after(model, completion: ChatCompletion) -> dict:
+    schema = get_response_schema(model)
+    _ = schema.response_format
+    return _parse_completion(completion, schema)
+
+
+def _per_call(fn, model, completion: ChatCompletion, min_time: float) -> float:
+    n, elapsed = 0, 0.0
+    start = time.perf_counter()
+    while elapsed < min_time:
+        for _ in range(20):
+            fn(model, completion)
+        n += 20
+        elapsed = time.perf_counter() - start
+    return elapsed / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-time", type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(f"{'schema':>15} {'before us/call':>15} {'after us/call':>14} {'speedup':>8}")
+    for model, payload in _SAMPLES:
+        completion = _completion(payload)
+        schema = get_response_schema(model)
+        assert schema.response_format == type_to_response_format_param(model), model.__name__
+        assert _before(model, completion) == _after(model, completion), model.__name__
+        before = _per_call(_before, model, completion, args.min_time)
+        after = _per_call(_after, model, completion, args.min_time)
+        print(f"{model.__name__:>15} {before * 1e6:>15.1f} {after * 1e6:>14.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
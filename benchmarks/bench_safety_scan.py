@@ -0,0 +1,80 @@
+"""SafetyAuditAgent 스캐너 처리량 마이크로벤치마크
+
+    python -m benchmarks.bench_safety_scan
+
+10B ~ 1MB 메시지에 대해 기존 방식(패턴별 순차 search)과 통합 1회 스캔(scan)을 비교한다.
+ns/byte가 크기와 무관하게 거의 일정하면 선형이며, adversarial 입력에서 급증하면 ReDoS 위험이다.
+"""
+import argparse
+import random
+import time
+from app.agents.safety import _FORCE_SUBMIT_PATTERNS, _PII_PATTERNS, scan, scan_many
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+_FILLER = "어제 강남구로 이사했어요. 전입신고 초안 만들어 주세요! 가족 4인, 차 있어요. "
+
+
+def _legacy_scan(message: str) -> list[str]:
+    """기존 구현: 패턴마다 메시지를 다시 훑는다 (모든 탐지를 얻기 위해 finditer)"""
+    found = []
+    for _, pattern, label in _PII_PATTERNS:
+        found.extend(label for _ in pattern.finditer(message))
+    found.extend("force_submit" for _ in _FORCE_SUBMIT_PATTERNS.finditer(message))
+    return found
+
+
+def _corpus(kind: str, size: int, rng: random.Random) -> str:
+    if kind == "text":
+        base = _FILLER
+    elif kind == "mixed":
+        base = _FILLER + "계좌 1234567890123 카드 1234-5678-9012-3456 바로 제출 "
+    elif kind == "digits":  # 숫자열: 모든 위치에서 숫자 패턴이 시도됨
+        base = "".join(rng.choice("0123456789") for _ in range(97)) + "-1 "
+    elif kind == "spaces":  # '바로' 뒤 긴 공백: \s* 경로
+        base = "바로" + " " * 200 + "x"
+    else:
+        raise ValueError(kind)
+    text = base * (size // len(base.encode()) + 1)
+    # UTF-8 바이트 기준 크기에 맞춰 자른다
+    return text.encode()[:size].decode(errors="ignore")
+
+
+def _bench(fn, message: str, min_time: float) -> float:
+    """호출당 평균 초"""
+    n, elapsed = 0, 0.0
+    start = time.perf_counter()
+    while elapsed < min_time:
+        fn(message)
+        n += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-time", type=float, default=0.2, help="케이스당 최소 측정 시간(초)")
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    print(f"{'corpus':<8} {'bytes':>9} {'legacy ns/B':>12} {'scan ns/B':>10} {'scan MB/s':>10} {'findings':>9}")
+    for kind in ("text", "mixed", "digits", "spaces"):
+        for size in SIZES:
+            message = _corpus(kind, size, rng)
+            nbytes = len(message.encode())
+            legacy = _bench(_legacy_scan, message, args.min_time)
+            combined = _bench(scan, message, args.min_time)
+            print(
+                f"{kind:<8} {nbytes:>9} {legacy / nbytes * 1e9:>12.1f} {combined / nbytes * 1e9:>10.1f} "
+                f"{nbytes / combined / 1e6:>10.1f} {len(scan(message)):>9}"
+            )
+
+    batch = [_corpus("mixed", 1_000, rng) for _ in range(1_000)]
+    start = time.perf_counter()
+    scan_many(batch)
+    elapsed = time.perf_counter() - start
+    print(f"\nscan_many: {len(batch)} x 1KB in {elapsed * 1000:.1f}ms ({len(batch) / elapsed:,.0f} msg/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""search_services 역색인 vs 기존 선형 스캔 비교
+
+    python -m benchmarks.bench_search_services
+
+SERVICES_DB를 템플릿으로 10 / 1k / 100k개 합성 카탈로그를 만들어
+색인 구축 시간과 질의당 지연(캐시 미사용 cold / 반복 질의 warm)을 측정한다.
+측정 전에 실제 SERVICES_DB와 합성 카탈로그에서 기존 스캔과 top-5가 같은지 확인한다.
+"""
+import argparse
+import itertools
+import random
+import sys
+import time
+from app.db.services_db import SERVICES_DB
+from app.tools.search_index import ServiceIndex
+
+SIZES = [10, 1_000, 100_000]
+_SIDO = ["서울특별시", "부산광역시", "인천광역시", "대구광역시", "경기도", "강원도", "제주특별자치도"]
+_EXTRA_TAGS = ["청년", "주거", "보육", "교통", "복지", "세금", "환경", "문화", "일자리", "노인"]
+_QUERIES = [
+    dict(query="이사", region="서울특별시", tags=["이사"]),
+    dict(query="이사", region="경기도", tags=["이사", "자녀", "차량"]),
+    dict(query="전학 초등학교", region="부산광역시", tags=[]),
+    dict(query="청년 주거 지원", region="인천광역시", tags=["청년"]),
+]
+# 일치 확인용 조합 (질의 × 지역 × 태그)
+_PARITY_QUERIES = ["", "이사", "전학 초등학교", "청년 주거 지원", "차", "폐기물", "없는단어"]
+_PARITY_REGIONS = ["", "서울특별시", "경기도"]
+_PARITY_TAGS = [[], ["이사"], ["이사", "자녀", "차량"], ["청년", "보육"], ["이사", "이사"]]
+
+
+def _legacy_search(catalog: dict[str, dict], query: str = "", region: str = "", tags: list[str] | None = None) -> list[dict]:
+    """기존 search_services 구현 (선형 스캔 + 전체 정렬 + 레코드 복사)"""
+    tags = tags or []
+    results = []
+    for svc in catalog.values():
+        score = 0
+        if query:
+            searchable = (
+                svc["service_name"] + " " +
+                " ".join(svc.get("tags", [])) + " " +
+                svc.get("eligibility_summary", "")
+            ).lower()
+            if any(q.lower() in searchable for q in query.split()):
+                score += 2
+        if tags:
+            svc_tags = svc.get("tags", [])
+            score += sum(1 for t in tags if t in svc_tags)
+        if svc.get("target_region") == "all":
+            score += 1
+        if score > 0 or (not query and not tags):
+            results.append({**svc, "_score": score})
+    results.sort(key=lambda x: x["_score"], reverse=True)
+    return [{k: v for k, v in r.items() if k != "_score"} for r in results[:5]]
+
+
+def _catalog(size: int, rng: random.Random) -> dict[str, dict]:
+    templates = list(SERVICES_DB.values())
+    catalog = {}
+    for i in range(size):
+        base = templates[i % len(templates)]
+        sido = rng.choice(_SIDO)
+        svc = {
+            **base,
+            "service_id": f"SVC{i:06d}",
+            "service_name": f"{sido} {base['service_name']} {i}",
+            "target_region": "all" if rng.random() < 0.1 else sido,
+            "tags": base["tags"][:2] + rng.sample(_EXTRA_TAGS, 2),
+        }
+        catalog[svc["service_id"]] = svc
+    return catalog
+
+
+def _parity(catalog: dict[str, dict]) -> list[str]:
+    """기존 스캔과 top-5 service_id 순서가 다른 조합"""
+    index = ServiceIndex(catalog, query_cache_size=0)
+    mismatches = []
+    for query, region, tags in itertools.product(_PARITY_QUERIES, _PARITY_REGIONS, _PARITY_TAGS):
+        legacy = [svc["service_id"] for svc in _legacy_search(catalog, query=query, region=region, tags=tags)]
+        indexed = [svc["service_id"] for svc in index.search(query=query, region=region, tags=tags)]
+        if legacy != indexed:
+            mismatches.append(f"query={query!r} region={region!r} tags={tags}: {legacy} != {indexed}")
+    return mismatches
+
+
+def _per_query(fn, min_time: float) -> float:
+    n, elapsed = 0, 0.0
+    start = time.perf_counter()
+    while elapsed < min_time:
+        for q in _QUERIES:
+            fn(**q)
+            n += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-time", type=float, default=0.5)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    combos = len(_PARITY_QUERIES) * len(_PARITY_REGIONS) * len(_PARITY_TAGS)
+    for name, catalog in [("SERVICES_DB", SERVICES_DB), ("synthetic 1k", _catalog(1_000, random.Random(1)))]:
+        mismatches = _parity(catalog)
+        print(f"parity {name}: {combos - len(mismatches)}/{combos} 조합 top-5 일치")
+        for line in mismatches:
+            print(f"  {line}")
+        if mismatches:
+            sys.exit(1)
+
+    print(
+        f"{'services':>9} {'build ms':>9} {'legacy us/q':>12} {'cold us/q':>10} {'warm us/q':>10} {'cold speedup':>13}"
+    )
+    for size in SIZES:
+        catalog = _catalog(size, rng)
+        t0 = time.perf_counter()
+        index = ServiceIndex(catalog, query_cache_size=0)
+        build = time.perf_counter() - t0
+        warm_index = ServiceIndex(catalog)
+        legacy = _per_query(lambda **q: _legacy_search(catalog, **q), args.min_time)
+        cold = _per_query(index.search, args.min_time)
+        warm = _per_query(warm_index.search, args.min_time)
+        print(
+            f"{size:>9} {build * 1000:>9.1f} {legacy * 1e6:>12.1f} {cold * 1e6:>10.1f} {warm * 1e6:>10.1f} "
+            f"{legacy / cold:>12.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""부하 테스트용 스크립트 대화 코퍼스 — 대화마다 턴이 순서대로 재생된다"""
+
+CONVERSATIONS: list[dict] = [
+    {
+        "name": "family_seoul_draft",
+        "turns": [
+            "이사했어",
+            "어제 강남구로 이사했어 가족이랑, 차 있어",
+            "전입신고 초안 만들어줘",
+        ],
+    },
+    {
+        "name": "single_busan_step_by_step",
+        "turns": [
+            "다음 주에 이사 가는데 뭐 해야 해?",
+            "부산 해운대구로 가요",
+            "혼자 살아요",
+            "차는 없어요",
+        ],
+    },
+    {
+        "name": "couple_gyeonggi_one_shot",
+        "turns": [
+            "신혼부부인데 2026년 3월 2일에 분당으로 이사했어요. 차 있어요",
+            "자동차 주소 변경도 해야 하나요?",
+        ],
+    },
+    {
+        "name": "children_school_transfer",
+        "turns": [
+            "이사 준비 중이에요",
+            "아이 둘이랑 남편이랑 수원시로 이사해요",
+            "3월 1일이요",
+            "초등학교 전학은 어떻게 해요?",
+            "전입신고 신청서 작성해줘",
+        ],
+    },
+    {
+        "name": "overdue_report",
+        "turns": [
+            "이사한 지 한 달 넘었는데 전입신고 안 했어요",
+            "서울 마포구, 1인 가구예요",
+            "2026년 1월 5일에 이사했어요",
+        ],
+    },
+    {
+        "name": "pii_blocked",
+        "turns": [
+            "이사했어요 제 주민번호는 900101-1234567 이에요",
+            "어제 인천 연수구로 이사했어요 가족이랑",
+        ],
+    },
+    {
+        "name": "off_topic_then_move",
+        "turns": [
+            "오늘 날씨 어때?",
+        ],
+    },
+    {
+        "name": "rental_daegu",
+        "turns": [
+            "대구 수성구 전세로 이사했어요",
+            "오늘 이사했고 부부예요",
+            "확정일자도 받아야 하나요?",
+        ],
+    },
+]
@@ -0,0 +1,131 @@
+"""로컬 의도 분류기 오프라인 평가 — 커버리지, 기준 라벨 일치율, 보정, 절약된 LLM 지연
+
+    python -m benchmarks.eval_intent                                   # 사람 라벨 기준, LLM 지연은 가정값
+    python -m benchmarks.eval_intent --llm --llm-labels triage_llm.json  # 실제 TriageAgent LLM과 비교 (결과 저장)
+    python -m benchmarks.eval_intent --llm-labels triage_llm.json        # 저장한 LLM 결과로 재평가 (호출 없음)
+    python -m benchmarks.eval_intent --calibrate                       # temperature 보정값 탐색
+
+기준(reference)은 LLM 라벨이 있으면 LLM 판정, 없으면 intent_corpus.py의 사람 라벨이다.
+"""
+import argparse
+import json
+import math
+import time
+from pathlib import Path
+from app.agents import intent_classifier
+from app.agents.intent_classifier import score_intent
+from app.agents.triage import TriageResult
+from app.core.config import get_settings
+from app.core.openai_client import generate_structured
+from app.orchestrator.message_analysis import analyze_message
+from app.prompts import TRIAGE_PROMPT
+from .intent_corpus import LABELED_MESSAGES
+
+
+def _llm_labels(messages: list[str], path: Path | None, call: bool) -> dict[str, dict]:
+    """메시지 → {"intent", "latency_ms"} (path가 있으면 읽고, call이면 빠진 것을 호출해 채운 뒤 저장)"""
+    labels: dict[str, dict] = json.loads(path.read_text(encoding="utf-8")) if path and path.exists() else {}
+    if call:
+        for message in messages:
+            if message in labels:
+                continue
+            t0 = time.perf_counter()
+            result = generate_structured(TRIAGE_PROMPT, message, TriageResult, 0.1, agent="TriageEval")
+            labels[message] = {
+                "intent": result.get("intent", "error"),
+                "latency_ms": round((time.perf_counter() - t0) * 1000, 1),
+            }
+        if path:
+            path.write_text(json.dumps(labels, ensure_ascii=False, indent=1), encoding="utf-8")
+    return labels
+
+
+def _nll_and_ece(samples: list[tuple[str, frozenset[str], str]], temperature: float, bins: int = 10) -> tuple[float, float]:
+    """음의 로그우도(평균)와 expected calibration error"""
+    nll = 0.0
+    bucket_conf = [0.0] * bins
+    bucket_acc = [0.0] * bins
+    bucket_n = [0] * bins
+    for text, kinds, reference in samples:
+        score = score_intent(text, kinds, temperature)
+        nll -= math.log(max(score.probabilities.get(reference, 0.0), 1e-9))
+        b = min(int(score.confidence * bins), bins - 1)
+        bucket_conf[b] += score.confidence
+        bucket_acc[b] += score.intent == reference
+        bucket_n[b] += 1
+    n = len(samples)
+    ece = sum(abs(bucket_acc[b] - bucket_conf[b]) for b in range(bins) if bucket_n[b]) / n
+    return nll / n, ece
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threshold", type=float, default=None, help="기본값은 TRIAGE_LOCAL_THRESHOLD")
+    parser.add_argument("--llm", action="store_true", help="실제 LLM으로 기준 라벨 생성 (API 키 필요)")
+    parser.add_argument("--llm-labels", type=Path, help="LLM 판정 저장/재사용 JSON")
+    parser.add_argument("--llm-latency-ms", type=float, default=1200.0, help="LLM 라벨이 없을 때 가정할 호출 지연")
+    parser.add_argument("--calibrate", action="store_true", help="NLL을 최소화하는 temperature 탐색")
+    parser.add_argument("-v", "--verbose", action="store_true", help="메시지별 결과 출력")
+    args = parser.parse_args()
+
+    threshold = args.threshold if args.threshold is not None else get_settings().triage_local_threshold
+    messages = [m for m, _ in LABELED_MESSAGES]
+    llm = _llm_labels(messages, args.llm_labels, args.llm)
+    use_llm = all(m in llm for m in messages)
+    reference = {m: llm[m]["intent"] if use_llm else label for m, label in LABELED_MESSAGES}
+    human = dict(LABELED_MESSAGES)
+
+    samples = []
+    for message in messages:
+        analysis = analyze_message(message)
+        samples.append((analysis.text, frozenset(analysis.scan.kinds), reference[message]))
+
+    # 분석(정규화·사전 스캔)을 포함한 로컬 판정 지연
+    t0 = time.perf_counter()
+    rounds = 200
+    for _ in range(rounds):
+        for message in messages:
+            analysis = analyze_message(message)
+            score_intent(analysis.text, analysis.scan.kinds)
+    local_us = (time.perf_counter() - t0) / (rounds * len(messages)) * 1e6
+
+    answered = agree = 0
+    for (text, kinds, ref), message in zip(samples, messages):
+        score = score_intent(text, kinds)
+        local = score.is_local(threshold)
+        answered += local
+        agree += local and score.intent == ref
+        if args.verbose:
+            mark = ("✓" if score.intent == ref else "✗") if local else "→LLM"
+            print(f"{mark:>5} {score.intent:>9} {score.confidence:.3f}  ref={ref:<9} {message}")
+
+    n = len(messages)
+    if use_llm:
+        llm_ms = sum(llm[m]["latency_ms"] for m in messages) / n
+        llm_vs_human = sum(llm[m]["intent"] == human[m] for m in messages) / n
+    else:
+        llm_ms = args.llm_latency_ms
+    saved_ms = answered * llm_ms
+
+    print(f"reference={'LLM' if use_llm else 'human labels'}  messages={n}  threshold={threshold}")
+    print(f"local answered     {answered}/{n} ({answered / n:.0%}), fallback to LLM {n - answered}")
+    print(f"local agreement    {agree}/{answered} ({agree / answered if answered else 0:.1%}) on answered")
+    if use_llm:
+        print(f"LLM vs human       {llm_vs_human:.1%}")
+    print(f"local latency      {local_us:.1f} us/message (analysis + scoring)")
+    print(
+        f"LLM latency        {llm_ms:.0f} ms/call{'' if use_llm else ' (assumed)'} → "
+        f"saved {saved_ms / 1000:.1f}s total, {saved_ms / n:.0f} ms per first turn on average"
+    )
+
+    nll, ece = _nll_and_ece(samples, intent_classifier._TEMPERATURE)
+    print(f"calibration        T={intent_classifier._TEMPERATURE}  NLL={nll:.3f}  ECE={ece:.3f}")
+    if args.calibrate:
+        grid = [round(0.25 * i, 2) for i in range(1, 25)]
+        best = min(grid, key=lambda t: _nll_and_ece(samples, t)[0])
+        nll, ece = _nll_and_ece(samples, best)
+        print(f"best temperature   T={best}  NLL={nll:.3f}  ECE={ece:.3f}  (intent_classifier._TEMPERATURE)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""오프라인 벤치마크용 가짜 LLM — 스키마별 mock_data 응답을 고정 지연 후 반환
+
+mock_mode와 달리 오케스트레이터의 실제(LLM) 경로를 그대로 타므로,
+프로바이더 지연을 제외한 오케스트레이션 오버헤드를 측정할 수 있다.
+"""
+import asyncio
+import random
+import time
+import app.agents.base as agent_base
+from app.core import mock_data
+
+_RESPONSES = {
+    "TriageResult": lambda: dict(mock_data.TRIAGE),
+    "QuestionList": lambda: {"questions": mock_data.INTERVIEW},
+    "TaskList": lambda: {"tasks": mock_data.DECOMPOSITION},
+    "CardList": lambda: {"service_cards": mock_data.EVIDENCE},
+    "CardReasonList": lambda: {"reasons": [
+        {"service_id": c["service_id"], "why_recommended": c["why_recommended"]} for c in mock_data.EVIDENCE
+    ]},
+    "FormFillResult": lambda: dict(mock_data.FORM_FILL),
+}
+
+
+class FakeLLM:
+    """latency_ms ± jitter_ms 만큼 기다린 뒤 응답 (seed 고정으로 재현 가능)"""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._rng = random.Random(seed)
+        self.calls: dict[str, int] = {}
+
+    def _delay(self, schema: type) -> float:
+        name = schema.__name__
+        self.calls[name] = self.calls.get(name, 0) + 1
+        jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def _respond(self, schema: type) -> dict:
+        factory = _RESPONSES.get(schema.__name__)
+        return factory() if factory else {}
+
+    def generate(
+        self, system_prompt: str, user_content: str, response_schema: type, temperature: float = 0.2,
+        agent: str | None = None,
+    ) -> dict:
+        time.sleep(self._delay(response_schema))
+        return self._respond(response_schema)
+
+    async def generate_async(
+        self, system_prompt: str, user_content: str, response_schema: type, temperature: float = 0.2,
+        agent: str | None = None,
+    ) -> dict:
+        await asyncio.sleep(self._delay(response_schema))
+        return self._respond(response_schema)
+
+
+def install(latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: int = 0) -> FakeLLM:
+    """에이전트가 쓰는 generate_structured(_async)를 가짜 LLM으로 교체한다"""
+    fake = FakeLLM(latency_ms, jitter_ms, seed)
+    agent_base.generate_structured = fake.generate
+    agent_base.generate_structured_async = fake.generate_async
+    return fake
@@ -0,0 +1,94 @@
+"""의도 분류 평가용 첫 턴 메시지 코퍼스 — (메시지, 사람이 붙인 라벨)
+
+move: 이미 이사함 / move_plan: 이사 예정·준비 중 / other: 이사와 무관
+애매한 표현(예: "이사 관련 질문이요")도 일부러 섞어 로컬 분류기가 LLM으로 넘기는지 본다.
+"""
+
+LABELED_MESSAGES: list[tuple[str, str]] = [
+    # move
+    ("이사했어", "move"),
+    ("어제 강남구로 이사했어 가족이랑, 차 있어", "move"),
+    ("이사한 지 한 달 넘었는데 전입신고 안 했어요", "move"),
+    ("신혼부부인데 2026년 3월 2일에 분당으로 이사했어요. 차 있어요", "move"),
+    ("대구 수성구 전세로 이사했어요", "move"),
+    ("어제 인천 연수구로 이사했어요 가족이랑", "move"),
+    ("이사 왔는데 뭐부터 해야 돼?", "move"),
+    ("이사 완료했습니다. 전입신고는 어떻게 하나요?", "move"),
+    ("오늘 이사 끝났어요", "move"),
+    ("이사를 했는데 건강보험 주소도 바꿔야 하나요", "move"),
+    ("이사 온 지 일주일 됐어요", "move"),
+    ("이사와서 전입신고 하려고요", "move"),
+    ("그저께 수원시로 이사함", "move"),
+    ("전입신고 하고 싶어요", "move"),
+    ("전입신고 기한이 언제까지예요?", "move"),
+    ("이사 후에 자동차 주소 변경은 어떻게 해요?", "move"),
+    ("부산 해운대구로 이사했는데 아이 학교 전학 절차 알려줘", "move"),
+    ("혼자 사는데 오늘 마포구로 이사했어요", "move"),
+    ("지난주에 이사했는데 확정일자 받아야 하나요", "move"),
+    ("이사하고 나서 해야 할 행정 처리 알려줘", "move"),
+    ("전입 신고 안 하면 과태료 있나요? 이사한 지 20일 됐어요", "move"),
+    ("새 집으로 이사했어요! 주소 변경할 것들 정리해줘", "move"),
+    ("이사했는데 차량 등록증 주소 바꿔야 해?", "move"),
+    ("월세로 이사 왔어요 전입신고 필요하죠?", "move"),
+    ("이사 완료! 이제 뭐 하면 돼?", "move"),
+    ("이사 했어요 서울 송파구", "move"),
+    ("어제 이삿짐 다 옮겼어요", "move"),
+    ("주민센터 가서 전입신고 해야 하나요?", "move"),
+    ("이사한 집 주소로 건강보험 바꾸는 법", "move"),
+    ("제주로 이사 왔습니다", "move"),
+    # move_plan
+    ("다음 주에 이사 가는데 뭐 해야 해?", "move_plan"),
+    ("이사 준비 중이에요", "move_plan"),
+    ("다음 달에 이사 예정이에요", "move_plan"),
+    ("이사 갈 건데 미리 알아둘 거 있어?", "move_plan"),
+    ("3월에 이사할 예정인데 준비할 게 뭐야?", "move_plan"),
+    ("이사하려고 하는데 절차 알려주세요", "move_plan"),
+    ("이사 계획 중입니다", "move_plan"),
+    ("이사 앞두고 체크리스트 알려줘", "move_plan"),
+    ("곧 이사 가요", "move_plan"),
+    ("이번 주말에 이사할 거예요", "move_plan"),
+    ("아이 둘이랑 남편이랑 수원시로 이사해요", "move_plan"),
+    ("경기도로 이사 갈 예정인데 차 있으면 뭐 해야 돼요?", "move_plan"),
+    ("이사하는데 폐기물 스티커는 어디서 사요?", "move_plan"),
+    ("내년 초에 세종으로 이사할 계획이에요", "move_plan"),
+    ("이사 가기 전에 해야 할 일", "move_plan"),
+    ("다음 달 이사인데 전입신고 미리 할 수 있나요?", "move_plan"),
+    ("이사 예정일이 다음 주 금요일이에요", "move_plan"),
+    ("이삿짐 싸는 중이에요 행정 처리 뭐 있어요?", "move_plan"),
+    ("이사 갑니다 대전으로", "move_plan"),
+    ("곧 이사할 건데 어린이집 옮기는 것도 알려줘", "move_plan"),
+    # other
+    ("오늘 날씨 어때?", "other"),
+    ("안녕하세요", "other"),
+    ("점심 메뉴 추천해줘", "other"),
+    ("너는 누구야?", "other"),
+    ("여권 재발급 어떻게 해요?", "other"),
+    ("주식 투자 어떻게 시작해?", "other"),
+    ("운전면허 갱신 기간 알려줘", "other"),
+    ("재미있는 영화 추천해줘", "other"),
+    ("고마워요", "other"),
+    ("코딩 공부 방법", "other"),
+    ("세금 신고는 언제 해요?", "other"),
+    ("택배 조회 어떻게 해?", "other"),
+    # 이사 기준 표지 없이 일반 표지(예정·다음 주·전세)만 있는 경우 — 로컬에서 답하면 안 됨
+    ("다음달 예정된 회의 일정 알려줘", "other"),
+    ("다음 주 출장 예정이야", "other"),
+    ("오늘 전세 월세 시세 알려줘", "other"),
+    ("다음 주에 주민센터 가서 여권 신청할 예정이에요", "other"),
+    # 애매 (사람 라벨은 붙였지만 로컬 분류기는 LLM으로 넘겨도 정상)
+    ("이사 관련 질문이요", "move_plan"),
+    ("강남구로 왔어요", "move"),
+    ("새 주소 등록하려고요", "move"),
+    ("이사", "move_plan"),
+    ("집을 옮겼습니다", "move"),
+    ("곧 새 아파트 입주해요", "move_plan"),
+    # 제3자·부정·취소 (점수가 높아도 로컬 분류기는 항상 LLM으로 넘겨야 함)
+    ("친구가 이사했어요", "other"),
+    ("부모님이 다음 달에 이사하세요", "other"),
+    ("친구 이사 도와주러 가요", "other"),
+    ("동생이 어제 이사했는데 전입신고 대신 해줘도 돼요?", "other"),
+    ("이사 안 가기로 했어요", "other"),
+    ("이사 취소됐어요", "other"),
+    ("아직 이사 안 했어요 다음 주에 가요", "move_plan"),
+    ("계약이 깨져서 이사 못 갔어요", "other"),
+]
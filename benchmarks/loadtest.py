@@ -0,0 +1,278 @@
+"""멀티턴 대화 부하 테스트 — in-process(Orchestrator) 또는 HTTP(/api/v1/chat, /api/v1/chat-mock)
+
+    python -m benchmarks.loadtest                                   # in-process, mock_mode
+    python -m benchmarks.loadtest --llm fake --fake-latency-ms 300  # 실제 LLM 경로 + 가짜 프로바이더 지연
+    python -m benchmarks.loadtest --mode http --url http://127.0.0.1:8000 --endpoint chat-mock
+    python -m benchmarks.loadtest --save-baseline baseline.json
+    python -m benchmarks.loadtest --compare baseline.json           # p95 회귀 시 exit 1
+
+corpus.CONVERSATIONS를 --repeat번 재생하며 대화 단위로 --concurrency개를 동시에 돌린다.
+턴 전체와 stage별(stage_timing 감사 이벤트) p50/p95/p99를 보고한다.
+in-process 모드는 임시 디렉터리의 DB(세션·계획·초안)를 쓰고 LLM 응답 캐시는 끈다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from .corpus import CONVERSATIONS
+
+
+@dataclass
+class TurnSample:
+    conversation: str
+    turn: int
+    latency_ms: float
+    stages: dict[str, float] = field(default_factory=dict)
+    error: str | None = None
+
+
+def _stage_timings(audit_events: list[dict]) -> dict[str, float]:
+    """stage_timing 감사 이벤트 → {stage 이름: ms}"""
+    return {
+        e["summary"].split(":", 1)[0]: e["duration_ms"]
+        for e in audit_events
+        if e.get("event_type") == "stage_timing" and e.get("duration_ms") is not None
+    }
+
+
+def _jobs(repeat: int, seed: int) -> list[dict]:
+    jobs = [conv for _ in range(repeat) for conv in CONVERSATIONS]
+    random.Random(seed).shuffle(jobs)
+    return jobs
+
+
+# ── in-process ─────────────────────────────────────────────────────────
+
+def _configure_inproc(args: argparse.Namespace, workdir: Path) -> None:
+    """app 모듈 import 전에 설정을 환경 변수로 고정한다"""
+    os.environ["MOCK_MODE"] = "true" if args.llm == "mock" else "false"
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.environ["PLAN_STORE_ENABLED"] = "false" if args.no_plan_store else "true"
+    os.environ["SESSION_DB_PATH"] = str(workdir / "sessions.db")
+    os.environ["PLAN_STORE_PATH"] = str(workdir / "plans.db")
+    os.environ["DRAFT_DB_PATH"] = str(workdir / "drafts.db")
+    os.environ["SHARED_STATE_PATH"] = str(workdir / "shared_state.db")
+
+
+async def _run_inproc(args: argparse.Namespace, jobs: list[dict]) -> list[TurnSample]:
+    from app.orchestrator.orchestrator import Orchestrator
+
+    if args.llm == "fake":
+        from .fake_llm import install
+        install(args.fake_latency_ms, args.fake_jitter_ms, args.seed)
+
+    orchestrator = Orchestrator()
+
+    samples: list[TurnSample] = []
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def run_conversation(conv: dict) -> None:
+        async with semaphore:
+            session_id = ""
+            for i, message in enumerate(conv["turns"]):
+                t0 = time.perf_counter()
+                try:
+                    response = await orchestrator.handle_turn_async(session_id, message)
+                except Exception as e:
+                    samples.append(TurnSample(conv["name"], i, (time.perf_counter() - t0) * 1000, error=repr(e)))
+                    return
+                latency = (time.perf_counter() - t0) * 1000
+                events = [e.model_dump() for e in response.audit_events]
+                samples.append(TurnSample(conv["name"], i, latency, _stage_timings(events)))
+                session_id = response.session_id or session_id
+
+    try:
+        await asyncio.gather(*(run_conversation(conv) for conv in jobs))
+    finally:
+        orchestrator.session_store.close()
+    return samples
+
+
+# ── HTTP ───────────────────────────────────────────────────────────────
+
+def _post(url: str, body: dict, timeout: float) -> dict:
+    request = urllib.request.Request(
+        url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+
+def _run_http(args: argparse.Namespace, jobs: list[dict]) -> list[TurnSample]:
+    url = f"{args.url.rstrip('/')}/api/v1/{args.endpoint}"
+
+    def run_conversation(conv: dict) -> list[TurnSample]:
+        samples = []
+        session_id = ""
+        for i, message in enumerate(conv["turns"]):
+            t0 = time.perf_counter()
+            try:
+                data = _post(url, {"session_id": session_id, "user_message": message}, args.timeout)
+            except Exception as e:
+                samples.append(TurnSample(conv["name"], i, (time.perf_counter() - t0) * 1000, error=repr(e)))
+                break
+            latency = (time.perf_counter() - t0) * 1000
+            samples.append(TurnSample(conv["name"], i, latency, _stage_timings(data.get("audit_events", []))))
+            session_id = data.get("session_id") or session_id
+        return samples
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        return [s for conv_samples in pool.map(run_conversation, jobs) for s in conv_samples]
+
+
+# ── 집계 / 베이스라인 ───────────────────────────────────────────────────
+
+def _percentile(values: list[float], p: float) -> float:
+    """정렬된 값의 선형 보간 백분위수"""
+    if len(values) == 1:
+        return values[0]
+    rank = (len(values) - 1) * p / 100
+    lo = int(rank)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (rank - lo)
+
+
+def _distribution(values: list[float]) -> dict:
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values), 3),
+        "p50_ms": round(_percentile(values, 50), 3),
+        "p95_ms": round(_percentile(values, 95), 3),
+        "p99_ms": round(_percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3),
+    }
+
+
+def _report(args: argparse.Namespace, samples: list[TurnSample], wall_s: float, conversations: int) -> dict:
+    ok = [s for s in samples if s.error is None]
+    stage_values: dict[str, list[float]] = {}
+    for s in ok:
+        for name, ms in s.stages.items():
+            stage_values.setdefault(name, []).append(ms)
+    errors = [s for s in samples if s.error is not None]
+    return {
+        "meta": {
+            "mode": args.mode,
+            "endpoint": args.endpoint if args.mode == "http" else "orchestrator",
+            "llm": args.llm if args.mode == "inproc" else "server",
+            "fake_latency_ms": args.fake_latency_ms,
+            "concurrency": args.concurrency,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "throughput": {
+            "wall_s": round(wall_s, 3),
+            "turns_per_s": round(len(ok) / wall_s, 2) if wall_s else 0.0,
+            "conversations_per_s": round(conversations / wall_s, 2) if wall_s else 0.0,
+        },
+        "errors": len(errors),
+        "error_samples": sorted({s.error for s in errors})[:5],
+        "turn": _distribution([s.latency_ms for s in ok]) if ok else None,
+        "stages": {name: _distribution(v) for name, v in sorted(stage_values.items())},
+    }
+
+
+def _print_report(result: dict) -> None:
+    meta, tp = result["meta"], result["throughput"]
+    print(
+        f"mode={meta['mode']} endpoint={meta['endpoint']} llm={meta['llm']} "
+        f"concurrency={meta['concurrency']} repeat={meta['repeat']}"
+    )
+    print(
+        f"wall {tp['wall_s']:.2f}s  {tp['turns_per_s']:.1f} turns/s  "
+        f"{tp['conversations_per_s']:.1f} conversations/s  errors {result['errors']}"
+    )
+    for err in result["error_samples"]:
+        print(f"  error: {err}")
+    print(f"{'':<16} {'count':>6} {'mean':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}  (ms)")
+    rows = ([("turn", result["turn"])] if result["turn"] else []) + list(result["stages"].items())
+    for name, d in rows:
+        print(
+            f"{name:<16} {d['count']:>6} {d['mean_ms']:>9.2f} {d['p50_ms']:>9.2f} "
+            f"{d['p95_ms']:>9.2f} {d['p99_ms']:>9.2f} {d['max_ms']:>9.2f}"
+        )
+
+
+def _compare(baseline: dict, result: dict, max_regression_pct: float, floor_ms: float) -> bool:
+    """p50/p95/p99 변화를 출력하고, p95가 허용치 이상 느려진 항목이 있으면 False"""
+    ok = True
+    print(f"\n{'vs baseline':<16} {'p50':>16} {'p95':>16} {'p99':>16}")
+    names = ["turn"] + [n for n in result["stages"] if n in baseline.get("stages", {})]
+    for name in names:
+        cur = result["turn"] if name == "turn" else result["stages"][name]
+        base = baseline.get("turn") if name == "turn" else baseline["stages"][name]
+        if not cur or not base:
+            continue
+        cells = []
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            delta = (cur[key] - base[key]) / base[key] * 100 if base[key] else 0.0
+            cells.append(f"{cur[key]:>8.2f} {delta:>+6.1f}%")
+        regressed = (
+            cur["p95_ms"] > floor_ms
+            and cur["p95_ms"] > base["p95_ms"] * (1 + max_regression_pct / 100)
+        )
+        ok = ok and not regressed
+        print(f"{name:<16} {cells[0]:>16} {cells[1]:>16} {cells[2]:>16}{'  REGRESSION' if regressed else ''}")
+    base_tp, cur_tp = baseline["throughput"]["turns_per_s"], result["throughput"]["turns_per_s"]
+    if base_tp:
+        print(f"throughput       {cur_tp:.1f} turns/s ({(cur_tp - base_tp) / base_tp * 100:+.1f}%)")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["inproc", "http"], default="inproc")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--endpoint", choices=["chat", "chat-mock"], default="chat")
+    parser.add_argument("--llm", choices=["mock", "fake"], default="mock",
+                        help="inproc 전용: mock_mode 경로 | 가짜 LLM으로 실제 LLM 경로")
+    parser.add_argument("--fake-latency-ms", type=float, default=0.0)
+    parser.add_argument("--fake-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--no-plan-store", action="store_true", help="프로필 시그니처 계획 재사용 끄기")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5, help="코퍼스 재생 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=120.0, help="http 요청 타임아웃(초)")
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--max-regression", type=float, default=20.0, help="허용 p95 증가율(%%)")
+    parser.add_argument("--floor-ms", type=float, default=1.0, help="이보다 짧은 p95는 회귀 판정 제외")
+    args = parser.parse_args()
+
+    jobs = _jobs(args.repeat, args.seed)
+    with tempfile.TemporaryDirectory(prefix="loadtest-") as tmp:
+        t0 = time.perf_counter()
+        if args.mode == "inproc":
+            _configure_inproc(args, Path(tmp))
+            samples = asyncio.run(_run_inproc(args, jobs))
+        else:
+            samples = _run_http(args, jobs)
+        wall_s = time.perf_counter() - t0
+
+    result = _report(args, samples, wall_s, len(jobs))
+    _print_report(result)
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\nbaseline 저장: {args.save_baseline}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if not _compare(baseline, result, args.max_regression, args.floor_ms):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""프로필 조합별 계획(task_graph + service_cards) 사전 생성 CLI
+
+    python plan_bulk.py --out plans.ndjson                        # 17개 시/도 × 세대 × 자녀 × 차량 × 임차 열거
+    python plan_bulk.py --profiles profiles.ndjson --out plans.ndjson --workers 8
+    python plan_bulk.py --out plans.ndjson --mock --limit 10      # LLM 없이 파이프라인만 확인
+
+결과는 한 줄에 시그니처 하나인 NDJSON으로 덧붙여 쓰며, 다시 실행하면 현재 plan_version으로
+이미 성공한 시그니처는 건너뛴다(중단 후 재개). 서비스는 PLAN_WARM_PATH로 이 파일을 지정하면
+시작할 때 PlanStore 메모리에 적재해 해당 프로필의 첫 턴부터 LLM 호출 없이 계획을 재사용한다.
+LLM 호출은 background 우선순위로 나가며, RPM/TPM/동시성 한도는 워커 프로세스 수로 나눠 쓴다.
+"""
+import argparse
+import itertools
+import json
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator
+
+from app.core.config import get_settings
+from app.orchestrator.gazetteer import SIDO_KEYWORDS
+from app.orchestrator.plan_store import plan_version, profile_signature
+from app.schemas.profile import MoveProfile
+
+# 시그니처의 이사 날짜 구간별 대표 날짜 (오늘 기준 일수)
+_BUCKET_OFFSETS = {"upcoming": 7, "recent": -3, "overdue": -30}
+
+
+def enumerate_profiles(buckets: list[str]) -> Iterator[MoveProfile]:
+    """17개 시/도 × 세대 유형 × 자녀 × 차량 × 임차 여부 (1인 가구 + 자녀 조합은 제외)"""
+    today = date.today()
+    for bucket, sido, household, children, car, rental in itertools.product(
+        buckets, SIDO_KEYWORDS.values(), ("single", "family"), ("yes", "no"), ("yes", "no"), ("rental", "owner"),
+    ):
+        if household == "single" and children == "yes":
+            continue
+        yield MoveProfile(
+            move_date=(today + timedelta(days=_BUCKET_OFFSETS[bucket])).isoformat(),
+            to_region={"sido": sido},
+            household_type=household,
+            has_children=children,
+            vehicles={"car": car},
+            is_rental=rental,
+        )
+
+
+def read_profiles(path: Path) -> Iterator[MoveProfile]:
+    """NDJSON의 각 줄(MoveProfile 필드 일부 또는 전체)을 프로필로 읽는다"""
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield MoveProfile.model_validate(json.loads(line))
+            except ValueError as e:
+                print(f"[PlanBulk] {path}:{lineno} 건너뜀 — {e}", file=sys.stderr)
+
+
+def completed_signatures(path: Path, version: str, mock: bool = False) -> set[str]:
+    """이미 현재 버전으로 성공한 시그니처 (재개용)
+
+    mock 결과는 mock 실행끼리만 완료로 본다 — 스모크 실행이 실제 실행을 막지 않도록.
+    """
+    done: set[str] = set()
+    if not path.exists():
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 중단으로 잘린 마지막 줄
+            if record.get("mock") and not mock:
+                continue
+            if record.get("version") == version and not record.get("error"):
+                done.add(record["signature"])
+    return done
+
+
+# ── 워커 프로세스 ──
+
+_agents: tuple | None = None
+
+
+def _init_worker(rpm: int, tpm: int, max_concurrency: int) -> None:
+    global _agents
+    from app.agents import DecompositionAgent, EvidenceAgent, EvidenceReasonAgent
+    from app.core.llm_scheduler import configure_llm_scheduler
+
+    configure_llm_scheduler(rpm, tpm, max_concurrency)
+    _agents = (DecompositionAgent(), EvidenceAgent(), EvidenceReasonAgent())
+
+
+def plan_profile(profile_data: dict, mock: bool) -> dict:
+    """프로필 하나를 Decomposition → 서비스 검색 → Evidence로 계획해 NDJSON 레코드로 반환"""
+    from app.core import mock_data
+    from app.core.llm_scheduler import llm_priority
+    from app.orchestrator.orchestrator import search_services_for_profile
+    from app.schemas.service import ServiceCard
+    from app.schemas.task import TaskNode
+
+    decomposition, evidence, evidence_reason = _agents
+    profile = MoveProfile.model_validate(profile_data)
+    t0 = time.perf_counter()
+    record = {"signature": profile_signature(profile), "version": plan_version(), "profile": profile_data}
+    try:
+        with llm_priority("background"):
+            if mock:
+                tasks_raw, cards_raw = mock_data.DECOMPOSITION, mock_data.EVIDENCE
+            else:
+                tasks_raw = decomposition.run(move_profile=profile)
+                # 카탈로그 카드 + 맞춤 추천 이유 (턴에서는 응답 후에 하는 보강을 여기서는 바로 한다)
+                cards_raw = evidence.from_catalog(tasks_raw, profile) if tasks_raw else None
+                if cards_raw:
+                    reasons = evidence_reason.run(cards=cards_raw, move_profile=profile)
+                    for card in cards_raw:
+                        card["why_recommended"] = reasons.get(card["service_id"], card["why_recommended"])
+                elif tasks_raw:
+                    cards_raw = evidence.run(
+                        task_graph=tasks_raw,
+                        move_profile=profile,
+                        db_results=search_services_for_profile(profile),
+                    )
+                else:
+                    cards_raw = []
+        record["task_graph"] = [TaskNode.model_validate(t).model_dump() for t in tasks_raw]
+        record["service_cards"] = [ServiceCard.model_validate(c).model_dump() for c in cards_raw]
+        if not record["task_graph"] or not record["service_cards"]:
+            record["error"] = "빈 계획 (LLM 실패 또는 예산 초과)"
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    if mock:
+        record["mock"] = True
+    record["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+    return record
+
+
+# ── 실행 ──
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=Path, help="프로필 NDJSON (없으면 조합 열거)")
+    parser.add_argument("--out", type=Path, default=Path("plans.ndjson"))
+    parser.add_argument("--buckets", default="recent",
+                        help="열거할 이사 날짜 구간 (쉼표 구분: upcoming,recent,overdue)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--mock", action="store_true", help="LLM 대신 목데이터 (결과는 warm load 대상에서 제외)")
+    parser.add_argument("--limit", type=int, default=0, help="처리할 최대 프로필 수 (0이면 전체)")
+    args = parser.parse_args()
+
+    if args.profiles:
+        profiles = read_profiles(args.profiles)
+    else:
+        buckets = [b.strip() for b in args.buckets.split(",") if b.strip()]
+        unknown = [b for b in buckets if b not in _BUCKET_OFFSETS]
+        if unknown:
+            parser.error(f"알 수 없는 구간: {', '.join(unknown)}")
+        profiles = enumerate_profiles(buckets)
+
+    settings = get_settings()
+    mock = args.mock or settings.mock_mode
+    version = plan_version()
+    seen = completed_signatures(args.out, version, mock)
+    skipped = len(seen)
+    pending: list[dict] = []
+    for profile in profiles:
+        signature = profile_signature(profile)
+        if signature in seen:
+            continue
+        seen.add(signature)
+        pending.append(profile.model_dump())
+        if args.limit and len(pending) >= args.limit:
+            break
+    print(f"[PlanBulk] version={version} 대상 {len(pending)}개 (완료분 {skipped}개 건너뜀), 워커 {args.workers}개")
+
+    workers = max(1, args.workers)
+    limits = (
+        # 0은 무제한이므로, 한도가 워커 수보다 작아도 0으로 내려가지 않게 최소 1
+        max(1, settings.llm_rpm_limit // workers) if settings.llm_rpm_limit else 0,
+        max(1, settings.llm_tpm_limit // workers) if settings.llm_tpm_limit else 0,
+        max(1, settings.llm_max_concurrency // workers) if settings.llm_max_concurrency else 0,
+    )
+    ok = failed = 0
+    t0 = time.perf_counter()
+    queue = iter(pending)
+    in_flight: set[Future] = set()
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=limits)
+    try:
+        with open(args.out, "a", encoding="utf-8") as out:
+            while True:
+                # 결과를 받는 대로 기록하도록 제출은 워커 수의 2배까지만
+                for profile_data in itertools.islice(queue, workers * 2 - len(in_flight)):
+                    in_flight.add(pool.submit(plan_profile, profile_data, mock))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record = future.result()
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    out.flush()
+                    if record.get("error"):
+                        failed += 1
+                        print(f"[PlanBulk] 실패 {record['signature']} — {record['error']}", file=sys.stderr)
+                    else:
+                        ok += 1
+                    total = ok + failed
+                    if total % 20 == 0 or total == len(pending):
+                        print(f"[PlanBulk] {total}/{len(pending)} (실패 {failed}) {time.perf_counter() - t0:.1f}s")
+    except KeyboardInterrupt:
+        print("[PlanBulk] 중단 — 같은 명령으로 다시 실행하면 이어서 진행합니다", file=sys.stderr)
+        pool.shutdown(wait=False, cancel_futures=True)
+        sys.exit(130)
+    pool.shutdown()
+    print(f"[PlanBulk] 완료 {ok}개, 실패 {failed}개 → {args.out}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()